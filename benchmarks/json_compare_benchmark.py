@@ -0,0 +1,125 @@
+"""
+Benchmarks `django_data_seed.utils.json_compare` against the previous recursive
+implementation on wide and deeply nested JSONField payloads.
+
+Run from the repository root:
+
+    python benchmarks/json_compare_benchmark.py
+"""
+import os
+import sys
+import timeit
+from typing import Any
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'django_data_seed'))
+
+from django_data_seed.utils.json_compare import (  # noqa: E402
+    compare_json_objects,
+    get_changed_paths,
+    json_fingerprint
+)
+
+
+# ? the recursive implementation used before the iterative comparator
+def legacy_compare_json_objects(obj1: Any, obj2: Any) -> bool:
+    if not legacy_compare_types(obj1, obj2):
+        return False
+
+    if isinstance(obj1, dict):
+        return legacy_compare_dicts(obj1, obj2)
+    elif isinstance(obj1, list):
+        return legacy_compare_lists(obj1, obj2)
+    else:
+        return legacy_compare_values(obj1, obj2)
+
+
+def legacy_compare_types(obj1: Any, obj2: Any) -> bool:
+    if type(obj1) != type(obj2):
+        return False
+    return True
+
+
+def legacy_compare_dicts(dict1: dict, dict2: dict) -> bool:
+    for key in dict1.keys():
+        if key not in dict2:
+            return False
+        if not legacy_compare_json_objects(dict1[key], dict2[key]):
+            return False
+    for key in dict2.keys():
+        if key not in dict1:
+            return False
+    return True
+
+
+def legacy_compare_lists(list1: list, list2: list) -> bool:
+    if len(list1) != len(list2):
+        return False
+    for item1, item2 in zip(list1, list2):
+        if not legacy_compare_json_objects(item1, item2):
+            return False
+    return True
+
+
+def legacy_compare_values(value1: Any, value2: Any) -> bool:
+    if value1 != value2:
+        return False
+    return True
+
+
+def wide_payload(width: int) -> dict:
+    return {
+        "pk": "1",
+        "model": "app.model",
+        "fields": {
+            f"field_{index}": [index, f"value {index}", index / 3, index % 2 == 0]
+            for index in range(width)
+        }
+    }
+
+
+def deep_payload(depth: int) -> dict:
+    payload = {"leaf": "value", "numbers": [1, 2, 3]}
+    for index in range(depth):
+        payload = {"level": index, "child": payload, "siblings": [index, str(index)]}
+    return payload
+
+
+def modify_first(payload: dict) -> dict:
+    payload = dict(payload)
+    payload["pk"] = "2"
+    return payload
+
+
+def bench(label: str, function, number: int) -> float:
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(f"  {label:<42} {seconds * 1e6:>12.1f} us")
+    return seconds
+
+
+def main():
+    cases = [
+        ("wide (5000 fields), equal", wide_payload(5000), wide_payload(5000)),
+        ("wide (5000 fields), first key differs",
+         wide_payload(5000), modify_first(wide_payload(5000))),
+        ("deep (200 levels), equal", deep_payload(200), deep_payload(200)),
+    ]
+    for title, before, after in cases:
+        print(title)
+        legacy = bench(
+            "legacy recursive compare",
+            lambda: legacy_compare_json_objects(before, after), 20)
+        current = bench(
+            "iterative compare",
+            lambda: compare_json_objects(before, after), 20)
+        fingerprint = json_fingerprint(before)
+        bench(
+            "fingerprint of one side (stored hash path)",
+            lambda: fingerprint == json_fingerprint(after), 20)
+        bench(
+            "changed paths",
+            lambda: get_changed_paths(before, after), 20)
+        print(f"  speedup of iterative compare: {legacy / current:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -11,15 +11,23 @@ theme = StdoutTextTheme()
 
 class DataBackUpModelAdmin(admin.ModelAdmin):
     list_display = ('pk', 'object_id', 'model_name')
-    search_fields = ('pk', 'object_id', 'model_name')
+    # ? whole value matches keep searches off substring scans
+    search_fields = ('=pk', '=object_id', '=model_name')
     list_filter = ('deleted_by', 'created_at')
+    ordering = ('-pk',)
+    # ? skip the unfiltered COUNT(*) over the whole audit table
+    show_full_result_count = False
     actions = [restore_data]
 
 
 class DjangoSeedDataLogEntryModelAdmin(admin.ModelAdmin):
     list_display = ('pk', 'object_id', 'model_name')
-    search_fields = ('pk', 'object_id', 'model_name')
+    # ? whole value matches keep searches off substring scans
+    search_fields = ('=pk', '=object_id', '=model_name')
     list_filter = ('mutated_by', 'created_at')
+    ordering = ('-pk',)
+    # ? skip the unfiltered COUNT(*) over the whole audit table
+    show_full_result_count = False
     actions = [load_log_entry_data]
 
 
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class DjangoDataSeedConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'django_data_seed'
+
+    def ready(self):
+        from .signals import connect_audit_receivers
+        connect_audit_receivers()
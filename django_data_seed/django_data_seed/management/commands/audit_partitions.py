@@ -0,0 +1,113 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from ...models import (
+    DjangoSeedDataBackUpModel,
+    DjangoSeedDataLogEntryModel
+)
+from ...utils.partition_utils import (
+    create_month_partitions,
+    drop_partitions_before,
+    is_partitioned
+)
+
+AUDIT_MODELS = {
+    'backup': DjangoSeedDataBackUpModel,
+    'logentry': DjangoSeedDataLogEntryModel,
+}
+
+
+class Command(BaseCommand):
+    help = 'Maintains the monthly partitions of the audit tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--table',
+            choices=['backup', 'logentry', 'all'],
+            default='all',
+            help='The audit table to maintain'
+        )
+
+        parser.add_argument(
+            '--create-ahead',
+            type=int,
+            default=None,
+            help='Create partitions for the current month and this many months ahead (PostgreSQL)'
+        )
+
+        parser.add_argument(
+            '--create-from',
+            type=str,
+            default=None,
+            help='First month (YYYY-MM) to create partitions for, used with --create-ahead'
+        )
+
+        parser.add_argument(
+            '--drop-before',
+            type=str,
+            default=None,
+            help='Drop every partition (or delete every row) created before this month (YYYY-MM)'
+        )
+
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Primary key range size for deletes on tables that are not partitioned'
+        )
+
+        parser.add_argument(
+            '--database',
+            type=str,
+            default='default',
+            help='The database alias to use'
+        )
+
+    def parse_month(self, value):
+        try:
+            year, month = (int(part) for part in value.split('-'))
+        except ValueError:
+            raise CommandError(f'Invalid month, expected YYYY-MM: {value}')
+        if not 1 <= month <= 12:
+            raise CommandError(f'Invalid month, expected YYYY-MM: {value}')
+        return year, month
+
+    def handle(self, *args, **kwargs):
+        using = kwargs.get('database', 'default')
+        create_ahead = kwargs.get('create_ahead')
+        drop_before = kwargs.get('drop_before')
+        if create_ahead is None and drop_before is None:
+            raise CommandError('Pass --create-ahead and/or --drop-before')
+        table = kwargs.get('table', 'all')
+        models = list(AUDIT_MODELS.values()) if table == 'all' else [
+            AUDIT_MODELS[table]]
+
+        for model in models:
+            label = model.__name__
+            partitioned = is_partitioned(model, using=using)
+            if create_ahead is not None:
+                if partitioned:
+                    start = kwargs.get('create_from')
+                    names = create_month_partitions(
+                        model,
+                        months_ahead=create_ahead,
+                        start=self.parse_month(start) if start else None,
+                        using=using
+                    )
+                    self.stdout.write(self.style.SUCCESS(
+                        f'{label}: ensured {len(names)} monthly partitions'))
+                else:
+                    self.stdout.write(self.style.WARNING(
+                        f'{label}: table is not partitioned on '
+                        f'{connections[using].vendor}, nothing to create'))
+            if drop_before is not None:
+                year, month = self.parse_month(drop_before)
+                removed = drop_partitions_before(
+                    model,
+                    year,
+                    month,
+                    chunk_size=kwargs.get('chunk_size', 5000),
+                    using=using
+                )
+                unit = 'partitions dropped' if partitioned else 'rows deleted'
+                self.stdout.write(self.style.SUCCESS(
+                    f'{label}: {removed} {unit} before {drop_before}'))
@@ -0,0 +1,95 @@
+from django.core.management.base import BaseCommand, CommandError
+from ...models import (
+    DjangoSeedDataBackUpModel,
+    DjangoSeedDataLogEntryModel
+)
+from ...utils.retention_utils import compact_audit_model
+
+AUDIT_MODELS = {
+    'backup': DjangoSeedDataBackUpModel,
+    'logentry': DjangoSeedDataLogEntryModel,
+}
+
+
+class Command(BaseCommand):
+    help = 'Applies retention policies to the log entry and backup tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--table',
+            choices=['backup', 'logentry', 'all'],
+            default='all',
+            help='The audit table to compact'
+        )
+
+        parser.add_argument(
+            '--model-name',
+            type=str,
+            default=None,
+            help='Only compact the audit rows of this model class name'
+        )
+
+        parser.add_argument(
+            '--max-age-days',
+            type=int,
+            default=None,
+            help='Delete audit rows older than this many days, overrides the settings'
+        )
+
+        parser.add_argument(
+            '--max-versions',
+            type=int,
+            default=None,
+            help='Keep at most this many rows per object, overrides the settings'
+        )
+
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Primary key range size of every delete'
+        )
+
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report what would be reclaimed'
+        )
+
+    def handle(self, *args, **kwargs):
+        max_age_days = kwargs.get('max_age_days')
+        max_versions = kwargs.get('max_versions')
+        if max_age_days is not None and max_age_days < 0:
+            raise CommandError('--max-age-days can not be negative')
+        if max_versions is not None and max_versions < 1:
+            raise CommandError('--max-versions must be at least 1')
+        table = kwargs.get('table', 'all')
+        models = list(AUDIT_MODELS.values()) if table == 'all' else [
+            AUDIT_MODELS[table]]
+        dry_run = kwargs.get('dry_run', False)
+
+        total_rows, total_bytes = 0, 0
+        for model in models:
+            report = compact_audit_model(
+                model,
+                model_name=kwargs.get('model_name'),
+                overrides={
+                    'max_age_days': max_age_days,
+                    'max_versions': max_versions,
+                },
+                chunk_size=kwargs.get('chunk_size', 5000),
+                dry_run=dry_run
+            )
+            for model_name, reclaimed in report.items():
+                if not reclaimed['rows']:
+                    continue
+                self.stdout.write(
+                    f"{model.__name__} / {model_name}: {reclaimed['rows']} rows, "
+                    f"{reclaimed['bytes']} bytes"
+                )
+                total_rows += reclaimed['rows']
+                total_bytes += reclaimed['bytes']
+
+        verb = 'Would reclaim' if dry_run else 'Reclaimed'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {total_rows} rows, {total_bytes} bytes'))
@@ -2,6 +2,7 @@ from ...utils.colorama_theme import StdoutTextTheme
 from django.db import models
 from faker import Faker
 from .utils import DatabaseUtils
+from ...utils.unique_text import get_unique_text_mode
 import uuid
 import random
 import datetime
@@ -113,6 +114,8 @@ class ModelFieldCharaterstics(
         """
 
         if obj.unique or obj.primary_key:
+            if get_unique_text_mode() == 'sequence':
+                return self.get_unique_text(model=model, obj=obj)
             value = self.get_unique_value(
                 model=model,
                 obj=obj,
@@ -384,6 +387,8 @@ class ModelFieldCharaterstics(
                 - A random slug value for the specified model field.
         """
         if obj.unique or obj.primary_key:
+            if get_unique_text_mode() == 'sequence':
+                return self.get_unique_text(model=model, obj=obj)
             return slugify(
                 self.get_unique_value(
                     obj=obj,
@@ -410,6 +415,8 @@ class ModelFieldCharaterstics(
         """
 
         if obj.unique or obj.primary_key:
+            if get_unique_text_mode() == 'sequence':
+                return self.get_unique_text(model=model, obj=obj)
             return self.get_unique_value(
                 obj=obj,
                 model=model,
@@ -526,3 +533,21 @@ class ModelFieldCharaterstics(
         """
 
         return self.create_random_json()
+
+    def FileField(
+            self,
+            obj: models.FileField,
+            model: models.Model
+    ) -> str:
+        """
+            Generates a file for a model's FileField or ImageField.
+
+            Args:
+                - obj: The FileField or ImageField instance from the model.
+                - model: The Django model class.
+
+            Returns:
+                - The storage name of a placeholder file for the specified model field.
+        """
+
+        return self.get_placeholder_file(model=model, obj=obj)
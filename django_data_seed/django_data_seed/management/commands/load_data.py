@@ -1,13 +1,59 @@
 from django.apps import apps
 from .fields import ModelFieldCharaterstics
-from .utils import SUPPORTED_DJANGO_MODEL_FIELDS
 from django.db import models, transaction
 from ...utils.colorama_theme import StdoutTextTheme
 import sys
 from django_data_seed.utils.app_utils import get_filtered_models
+from django_data_seed.utils.generator_registry import BatchBuffer, GeneratorEntry, registry
+from django_data_seed.utils.fk_strategies import (
+    DEFAULT_TREE_BRANCHING,
+    DEFAULT_ZIPF_EXPONENT,
+    parent_sampler,
+    tree_sampler
+)
+from django_data_seed.utils.model_introspection import get_model_descriptor
+from django_data_seed.utils.seed_constraints import (
+    UniqueTuples,
+    check_seed_model,
+    value_adjuster
+)
+from django_data_seed.utils.seed_engine import link_foreign_key
+from django_data_seed.utils.seed_profile import (
+    DEFAULT_SEED_BATCH_SIZE,
+    compile_column_samplers,
+    get_cyclic_relations
+)
 
 
 class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
+
+    def __init__(
+        self,
+        column_profiles=None,
+        fk_strategy=None,
+        fk_fan_out=None,
+        zipf_exponent=DEFAULT_ZIPF_EXPONENT
+    ):
+        # ? the buffered values of batch generators keyed by (model class, field name)
+        self.batch_buffers = {}
+        # ? samplers of profiled columns keyed by (model class, field name), see profile_columns
+        self.column_samplers = compile_column_samplers(
+            column_profiles, self) if column_profiles else {}
+        # ? without a strategy every foreign key gets a freshly created parent
+        self.fk_strategy = fk_strategy
+        self.fk_fan_out = fk_fan_out
+        self.zipf_exponent = zipf_exponent
+        # ? [sampler, next row index] per foreign key field
+        self.parent_samplers = {}
+        # ? the composite unique tuples taken per model, read once from the existing rows
+        self.unique_tuples = {}
+        # ? the unique text sequences keyed by (model class, field name), see get_unique_text
+        self.text_sequences = {}
+        # ? the names of the placeholder files keyed by (model class, field name), see get_placeholder_file
+        self.placeholder_files = {}
+        # ? the primary keys of the new rows of models with deferred foreign keys, in creation order
+        self.created_pks = {}
+
     def get_models(self, app_name: str, model_name: str) -> list:
         """
         Returns a list of models in a Django project. 
@@ -45,6 +91,9 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
         """
             Info:
                 This function generates a random value for the specified model field and adds it to the provided dictionary.
+                Profiled columns draw their value from their column profile, other fields from the generators registered
+                for their class, see `generator_registry`.
+                Generated values are adjusted to the max_length, decimal precision and value limits of the field.
 
             Args:
                 - field: The model field.
@@ -55,18 +104,63 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
                 - dict
         """
 
-        for model_field in SUPPORTED_DJANGO_MODEL_FIELDS:
-            if hasattr(self, model_field):
-                method = getattr(self, model_field)
-                try:
-                    if callable(method) and isinstance(field, getattr(models, model_field)):
-                        field_value = method(field, model)
-                        field_values[field.name] = field_value
-                        return field_values
-                except Exception as e:
-                    self.stdout_warning(
-                        f'WARNING : Error occur while generating data for {field.name}, {str(model)}. Error : {str(e)}'
-                    )
+        sampler = self.column_samplers.get((model, field.name))
+        if sampler is not None:
+            field_values[field.name] = sampler()
+            return field_values
+
+        for entry in self.get_generators(type(field)):
+            try:
+                field_value = self.call_generator(entry, field, model)
+                adjust = value_adjuster(field)
+                field_values[field.name] = adjust(field_value) if adjust else field_value
+                return field_values
+            except Exception as e:
+                self.stdout_warning(
+                    f'WARNING : Error occur while generating data for {field.name}, {str(model)}. Error : {str(e)}'
+                )
+
+    def get_generators(self, field_class: type) -> tuple:
+        """
+            Info:
+                Resolves, once per field class, the generators registered for the classes of its MRO.
+
+            Args:
+                - field_class: The class of the model field.
+
+            Returns:
+                - The generator entries, the most specific first, the others being fallbacks.
+        """
+        return registry.resolve(field_class)
+
+    def call_generator(self, entry: GeneratorEntry, field: object, model: models.Model):
+        """
+            Info:
+                Generates one value with a generator entry. Batch generators fill a buffer per field,
+                drawing many values per call.
+
+            Args:
+                - entry: The generator entry.
+                - field: The model field.
+                - model: The Django model class.
+
+            Returns:
+                - The generated value.
+        """
+        if not entry.batch:
+            return entry.function(self, field, model)
+        key = (model, field.name)
+        buffer = self.batch_buffers.get(key)
+        if buffer is None or buffer.entry is not entry:
+            buffer = self.batch_buffers[key] = BatchBuffer(entry, self, field, model)
+        return buffer()
+
+    def generate_field_value(self, field: object, model: models.Model):
+        """
+            Info:
+                Returns a generated value of a field, or None when no generator succeeds.
+        """
+        return (self.validate_and_give_value(field, model, {}) or {}).get(field.name)
 
     def fill_data_to_model(self, model: models.Model) -> object:
         """
@@ -80,15 +174,29 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
             - A new instance of the specified model.
         """
 
-        fields = model._meta.get_fields()
+        fields = get_model_descriptor(model).fields
+        deferred = self.get_deferred_relations(model)
         field_values = {}
         many_to_many_data_instance = {}
-        for field in fields:
+        for descriptor in fields:
+            field = descriptor.field
             try:
                 if isinstance(field, models.AutoField):
                     # ? Skip AutoField, handled by the database
                     continue
 
+                if descriptor.concrete and descriptor.name in deferred:
+                    # ? filled by link_deferred_relations once the rows exist
+                    continue
+
+                if self.fk_strategy and isinstance(field, models.ForeignKey) and \
+                        not field.one_to_one:
+                    # ? point to an existing parent drawn with the foreign key strategy
+                    parent_pk = self.pick_parent(field)
+                    if parent_pk is not None:
+                        field_values[field.attname] = parent_pk
+                        continue
+
                 if isinstance(field, (models.ForeignKey, models.OneToOneField)):
                     # ? create new related model instance
                     field_values[field.name] = self.validate_and_create_related_instance(
@@ -108,6 +216,7 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
                         f'Error : Error occur while generating data for {field.name}, {str(model)}. Error : {str(e)}'
                     )
                     # sys.exit(0)
+        self.claim_unique_tuples(model, field_values)
         created_instance = model.objects.create(**field_values)
         # ? add instance created for many to many fields
         [
@@ -120,11 +229,122 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
         ]
 
         created_instance.save()
+        self.record_created(created_instance)
         self.stdout_info(
             f'Sucessfully populated Data for {str(model)}'
         )
         return created_instance
 
+    def get_deferred_relations(self, model: models.Model) -> frozenset:
+        """
+        Info:
+            Returns the names of the nullable foreign keys of a model that lead back to it, left
+            empty while rows are created and filled afterwards by `link_deferred_relations`.
+        """
+        descriptor = get_model_descriptor(model)
+        return frozenset(
+            name for name in get_cyclic_relations(model) if descriptor.get_field(name).null
+        )
+
+    def record_created(self, instance: models.Model) -> None:
+        """
+        Info:
+            Keeps the primary key of a new row whose model has deferred foreign keys, so
+            `link_deferred_relations` can fill them once every model is seeded.
+        """
+        if self.get_deferred_relations(type(instance)):
+            self.created_pks.setdefault(type(instance), []).append(instance.pk)
+
+    def link_deferred_relations(self, model: models.Model, pks: list) -> None:
+        """
+        Info:
+            Fills the deferred foreign keys of the new rows of a model with bulk updates. Self
+            referential keys shape the new rows into a tree, one to one keys into a chain. Keys
+            closing a cycle through other models point to their existing parents with
+            `fk_strategy`, uniform by default; one to one keys of cycles are left empty.
+
+        Args:
+            - model: The Django model class.
+            - pks: The primary keys of the new rows, in creation order.
+        """
+        descriptor = get_model_descriptor(model)
+        for name in sorted(self.get_deferred_relations(model)):
+            field = descriptor.get_field(name)
+            if field.self_referential:
+                sample = tree_sampler(pks, branching=1 if field.one_to_one else DEFAULT_TREE_BRANCHING)
+            elif field.one_to_one:
+                continue
+            else:
+                pool = list(field.related_model._base_manager.order_by(
+                    'pk').values_list('pk', flat=True))
+                if not pool:
+                    continue
+                sample = parent_sampler(
+                    pool, self.fk_strategy or 'uniform', fan_out=self.fk_fan_out,
+                    exponent=self.zipf_exponent
+                )
+            link_foreign_key(model, field.field, pks, sample(0, len(pks)), DEFAULT_SEED_BATCH_SIZE)
+
+    def claim_unique_tuples(self, model: models.Model, field_values: dict) -> dict:
+        """
+        Info:
+            Regenerates the values of a row until the tuples of its `unique_together` and
+            `UniqueConstraint` fields are free, without querying the database for every row.
+
+        Args:
+            - model: The Django model class.
+            - field_values: The values of the row, updated in place.
+
+        Returns:
+            - dict
+        """
+        unique = self.unique_tuples.get(model)
+        if unique is None:
+            unique = self.unique_tuples[model] = UniqueTuples(model)
+            if unique:
+                unique.preload()
+        if not unique:
+            return field_values
+
+        descriptor = get_model_descriptor(model)
+        row, regenerators = {}, {}
+        for name, value in field_values.items():
+            field = descriptor.get_field(name)
+            row[field.attname] = value.pk if isinstance(value, models.Model) else value
+            if not field.is_relation:
+                regenerators[field.attname] = lambda field=field.field: self.generate_field_value(
+                    field, model)
+        unique.claim(row, regenerators)
+        for name in regenerators:
+            field_values[name] = row[name]
+        return field_values
+
+    def pick_parent(self, field: models.ForeignKey):
+        """
+        Info:
+            Draws the parent of a foreign key with `fk_strategy`, from the primary keys of the
+            existing parents read once per field.
+
+        Args:
+            - field: The foreign key field.
+
+        Returns:
+            - The primary key of the parent, or None when the parent model has no rows.
+        """
+        state = self.parent_samplers.get(field)
+        if state is None:
+            pool = list(field.related_model._base_manager.order_by(
+                'pk').values_list('pk', flat=True))
+            sampler = parent_sampler(
+                pool, self.fk_strategy, fan_out=self.fk_fan_out, exponent=self.zipf_exponent
+            ) if pool else None
+            state = self.parent_samplers[field] = [sampler, 0]
+        sampler, index = state
+        if sampler is None:
+            return None
+        state[1] += 1
+        return sampler(index, index + 1)[0]
+
     def validate_and_create_related_instance(self, field: object):
         related_model = field.related_model
         return self.create_related_instance(
@@ -155,10 +375,11 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
         # Mark the current model as processed
         processed_models.add(related_model)
 
-        related_fields = related_model._meta.get_fields()
+        related_fields = get_model_descriptor(related_model).fields
         related_field_values = {}
 
-        for field in related_fields:
+        for descriptor in related_fields:
+            field = descriptor.field
             if isinstance(field, (models.AutoField, models.BigAutoField, models.SmallAutoField)):
                 # Skip AutoField, handled by the database
                 continue
@@ -168,6 +389,10 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
                 if field.related_model == related_model:
                     continue
 
+                # ? nullable keys leading back to the model are left empty, which ends cycles
+                if field.name in self.get_deferred_relations(related_model):
+                    continue
+
                 # If relation fields contain chain or nested relational fields,
                 # this function calls itself recursively to get child instances
                 related_field_values[field.name] = self.validate_and_create_related_instance(
@@ -180,7 +405,10 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
                     related_field_values
                 )
 
-        return related_model.objects.create(**related_field_values)
+        self.claim_unique_tuples(related_model, related_field_values)
+        created_instance = related_model.objects.create(**related_field_values)
+        self.record_created(created_instance)
+        return created_instance
 
     def str_to_object(self, class_name: str, import_path: str):
         class_object = getattr(
@@ -199,19 +427,28 @@ class SeedData(ModelFieldCharaterstics, StdoutTextTheme):
             Info:
                 This function retrieves all models from each app, or from a specific app if `app_name` is provided. For each model,
                 it creates the specified number of objects by iterating `number_of_objects` times.
+                Every model is checked once before any row is created, see `check_seed_model`.
+                Self referential and cyclic foreign keys are filled once every model is seeded, including the rows
+                created as parents of other models, see `link_deferred_relations`.
 
             Args:
                 - model: The Django model class.
 
             Returns:
                 - New instances of the model.
+
+            Raises:
+                - SeedConstraintError: If a model can not be seeded, before anything is written.
         """
 
+        models_to_seed = self.get_models(app_name, model_name)
+        checked = set()
+        for model in models_to_seed:
+            check_seed_model(model, self, checked)
         with transaction.atomic():
-            [
-                self.fill_data_to_model(
-                    model
-                ) for model in self.get_models(app_name, model_name) for _ in range(
-                    number_of_objects
-                )
-            ]
+            for model in models_to_seed:
+                for _ in range(number_of_objects):
+                    self.fill_data_to_model(model)
+            for model, pks in self.created_pks.items():
+                self.link_deferred_relations(model, pks)
+            self.created_pks = {}
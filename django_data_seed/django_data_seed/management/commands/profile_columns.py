@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand, CommandError
+from ...utils.column_profile import (
+    DEFAULT_BINS,
+    DEFAULT_TOP_K,
+    profile_models,
+    save_column_profiles
+)
+from ...utils.seed_scale import get_sampled_models
+
+
+class Command(BaseCommand):
+    help = 'Profiles the column distributions of existing rows for seeddata --column-profile'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output',
+            type=str,
+            required=True,
+            help='The JSON file the column profiles are written to'
+        )
+
+        parser.add_argument(
+            '--django-app',
+            type=str,
+            default=None,
+            help='Only profile the models of this app'
+        )
+
+        parser.add_argument(
+            '--django-model',
+            type=str,
+            default=None,
+            help='Only profile the model with this class name'
+        )
+
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=DEFAULT_TOP_K,
+            help='The number of most common values kept per column'
+        )
+
+        parser.add_argument(
+            '--bins',
+            type=int,
+            default=DEFAULT_BINS,
+            help='The number of histogram buckets of numeric and date columns'
+        )
+
+    def handle(self, *args, **kwargs):
+        top_k = kwargs.get('top_k', DEFAULT_TOP_K)
+        bins = kwargs.get('bins', DEFAULT_BINS)
+        if top_k < 0:
+            raise CommandError('--top-k can not be negative')
+        if bins < 1:
+            raise CommandError('--bins must be at least 1')
+        models_to_profile = get_sampled_models(
+            kwargs.get('django_app'), kwargs.get('django_model'))
+        if not models_to_profile:
+            raise CommandError('No models to profile')
+
+        profiles = profile_models(models_to_profile, top_k=top_k, bins=bins)
+        save_column_profiles(profiles, kwargs['output'])
+        columns = sum(len(profile['columns']) for profile in profiles['models'].values())
+        self.stdout.write(self.style.SUCCESS(
+            f'Profiled {columns} columns of {len(profiles["models"])} models into {kwargs["output"]}'
+        ))
@@ -0,0 +1,149 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils import timezone
+import datetime
+from ...models import DjangoSeedDataBackUpModel
+from ...utils.restore_utils import (
+    filter_backups,
+    restore_backups_by_model
+)
+
+
+class Command(BaseCommand):
+    help = 'Restores deleted instances from the backup table in streamed, batched transactions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model-name',
+            type=str,
+            default=None,
+            help='Only restore backups of this model class name'
+        )
+
+        parser.add_argument(
+            '--object-id-from',
+            type=str,
+            default=None,
+            help='Inclusive lower bound of the object ids to restore'
+        )
+
+        parser.add_argument(
+            '--object-id-to',
+            type=str,
+            default=None,
+            help='Inclusive upper bound of the object ids to restore'
+        )
+
+        parser.add_argument(
+            '--user',
+            type=str,
+            default=None,
+            help='Only restore objects deleted by this user id'
+        )
+
+        parser.add_argument(
+            '--since',
+            type=str,
+            default=None,
+            help='Only restore backups created at or after this date/datetime (ISO 8601)'
+        )
+
+        parser.add_argument(
+            '--until',
+            type=str,
+            default=None,
+            help='Only restore backups created at or before this date/datetime (ISO 8601)'
+        )
+
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=2000,
+            help='The number of backup rows fetched per database round trip'
+        )
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='The number of backup rows restored per transaction'
+        )
+
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='The number of models restored in parallel'
+        )
+
+        parser.add_argument(
+            '--keep-backups',
+            action='store_true',
+            help='Do not delete backup rows after they are restored'
+        )
+
+    def parse_moment(self, value, end_of_day=False):
+        """
+        Parse a `--since`/`--until` value into an aware datetime.
+        """
+        if value is None:
+            return None
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            if day is None:
+                raise CommandError(f'Invalid date or datetime: {value}')
+            moment = datetime.datetime.combine(
+                day, datetime.time.max if end_of_day else datetime.time.min)
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return moment
+
+    def handle(self, *args, **kwargs):
+        chunk_size = kwargs.get('chunk_size', 2000)
+        batch_size = kwargs.get('batch_size', 500)
+        workers = kwargs.get('workers', 1)
+        if chunk_size < 1 or batch_size < 1 or workers < 1:
+            raise CommandError(
+                '--chunk-size, --batch-size and --workers must be positive')
+
+        queryset = filter_backups(
+            DjangoSeedDataBackUpModel.objects.all(),
+            model_name=kwargs.get('model_name'),
+            object_id_from=kwargs.get('object_id_from'),
+            object_id_to=kwargs.get('object_id_to'),
+            user_id=kwargs.get('user'),
+            created_from=self.parse_moment(kwargs.get('since')),
+            created_to=self.parse_moment(kwargs.get('until'), end_of_day=True)
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                'Django data seed Started Restoring backups'
+            )
+        )
+
+        def progress(model_name, stats):
+            self.stdout.write(
+                f"{model_name}: restored {stats['restored']}, failed {stats['failed']}"
+            )
+
+        results = restore_backups_by_model(
+            queryset,
+            workers=workers,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            should_delete=not kwargs.get('keep_backups', False),
+            progress=progress
+        )
+
+        restored = sum(stats['restored'] for stats in results.values())
+        failed = sum(stats['failed'] for stats in results.values())
+        deleted = sum(stats['deleted'] for stats in results.values())
+        for stats in results.values():
+            for error in stats['errors']:
+                self.stderr.write(self.style.ERROR(error))
+        style = self.style.ERROR if failed else self.style.SUCCESS
+        self.stdout.write(style(
+            f'Restored {restored} backups, {failed} failed, {deleted} backup rows deleted'
+        ))
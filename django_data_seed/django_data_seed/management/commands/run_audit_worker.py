@@ -0,0 +1,85 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from ...utils.audit_queue import get_audit_spool, run_audit_worker
+
+
+class Command(BaseCommand):
+    help = 'Drains the audit event queue into the log entry and backup tables'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--queue-path',
+            type=str,
+            default=None,
+            help='The spool file, defaults to DJANGO_DATA_SEED_AUDIT_QUEUE_PATH'
+        )
+
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of events written per transaction'
+        )
+
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=5,
+            help='Failed deliveries after which an event is moved to the dead letter table'
+        )
+
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to wait when the queue is empty'
+        )
+
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit once the queue is empty instead of waiting for new events'
+        )
+
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Print the queue depth metrics as JSON and exit'
+        )
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs.get('batch_size', 1000)
+        max_attempts = kwargs.get('max_attempts', 5)
+        if batch_size < 1:
+            raise CommandError('--batch-size must be at least 1')
+        if max_attempts < 1:
+            raise CommandError('--max-attempts must be at least 1')
+        try:
+            spool = get_audit_spool(kwargs.get('queue_path'))
+        except ValueError as error:
+            raise CommandError(str(error))
+
+        if kwargs.get('stats'):
+            self.stdout.write(json.dumps(spool.stats()))
+            return
+
+        def progress(report):
+            self.stdout.write(
+                f"Delivered {report['delivered']} events, {report['failed']} failed, "
+                f"{report['dead']} dead lettered"
+            )
+
+        try:
+            delivered = run_audit_worker(
+                spool,
+                batch_size=batch_size,
+                max_attempts=max_attempts,
+                poll_interval=kwargs.get('poll_interval', 1.0),
+                once=kwargs.get('once', False),
+                progress=progress
+            )
+        except KeyboardInterrupt:
+            return
+        finally:
+            spool.close()
+        self.stdout.write(self.style.SUCCESS(f'Delivered {delivered} audit events'))
@@ -1,5 +1,9 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from .load_data import SeedData
+from ...utils.fk_strategies import DEFAULT_ZIPF_EXPONENT, FK_STRATEGIES
+from ...utils.seed_engine import seed_from_profile
+from ...utils.seed_scale import scale_models
+from ...utils.seed_profile import SeedProfileError
 
 
 class Command(BaseCommand):
@@ -27,6 +31,49 @@ class Command(BaseCommand):
             help='Specify the model to load'
         )
 
+        parser.add_argument(
+            '--profile-file',
+            type=str,
+            default=None,
+            help='A YAML or JSON seeding profile with per model counts, fan outs and field overrides'
+        )
+
+        parser.add_argument(
+            '--fk-strategy',
+            type=str,
+            choices=FK_STRATEGIES,
+            default=None,
+            help='Point foreign keys to existing parents drawn with this strategy instead of creating a parent per row'
+        )
+
+        parser.add_argument(
+            '--fk-fan-out',
+            type=int,
+            default=None,
+            help='The number of children per parent of the fixed foreign key strategy'
+        )
+
+        parser.add_argument(
+            '--zipf-exponent',
+            type=float,
+            default=DEFAULT_ZIPF_EXPONENT,
+            help='The skew of the zipf foreign key strategy, higher is more skewed'
+        )
+
+        parser.add_argument(
+            '--column-profile',
+            type=str,
+            default=None,
+            help='A column profile file written by profile_columns, whose distributions the generated values follow'
+        )
+
+        parser.add_argument(
+            '--scale-factor',
+            type=float,
+            default=None,
+            help='Grow the existing rows of the selected models to this many times their size'
+        )
+
     def handle(self, *args, **kwargs):
         number_of_objects = kwargs.get(
             'no_of_objects_to_create',
@@ -41,15 +88,64 @@ class Command(BaseCommand):
             None
         )
 
+        profile_file = kwargs.get(
+            'profile_file',
+            None
+        )
+        scale_factor = kwargs.get(
+            'scale_factor',
+            None
+        )
+        column_profile = kwargs.get(
+            'column_profile',
+            None
+        )
+        fk_strategy = kwargs.get(
+            'fk_strategy',
+            None
+        )
+        fk_fan_out = kwargs.get(
+            'fk_fan_out',
+            None
+        )
+        zipf_exponent = kwargs.get(
+            'zipf_exponent',
+            DEFAULT_ZIPF_EXPONENT
+        )
+        if profile_file and scale_factor is not None:
+            raise CommandError('Use either --profile-file or --scale-factor')
+        if fk_strategy == 'fixed' and (not fk_fan_out or fk_fan_out < 1):
+            raise CommandError('The fixed foreign key strategy requires --fk-fan-out')
+        if zipf_exponent <= 0:
+            raise CommandError('--zipf-exponent must be positive')
+
         self.stdout.write(
             self.style.SUCCESS(
                 'Django data seed Started Populating data'
             )
         )
-        run = SeedData()
-        run.SeedData(
-            number_of_objects=number_of_objects, app_name=app_name,
-            model_name=model_name
-        )
+        if profile_file or scale_factor is not None:
+            try:
+                if profile_file:
+                    created = seed_from_profile(profile_file, column_profiles=column_profile)
+                else:
+                    created = scale_models(
+                        scale_factor, app_name=app_name, model_name=model_name)
+            except SeedProfileError as e:
+                raise CommandError(str(e))
+            self.stdout.write(self.style.SUCCESS(
+                f'Successfully populated {sum(created.values())} rows'))
+            return
+        try:
+            run = SeedData(
+                column_profiles=column_profile, fk_strategy=fk_strategy,
+                fk_fan_out=fk_fan_out, zipf_exponent=zipf_exponent
+            )
+            run.SeedData(
+                number_of_objects=number_of_objects, app_name=app_name,
+                model_name=model_name
+            )
+        except SeedProfileError as e:
+            raise CommandError(str(e))
         self.stdout.write(self.style.SUCCESS(
             'Successfully populated data'))
@@ -7,6 +7,8 @@ from typing import Any
 import random
 import uuid
 import string
+from django_data_seed.utils.unique_text import get_text_sequence, get_unique_text_mode
+from django_data_seed.utils.placeholder_files import create_placeholder_files
 
 fake = Faker()
 
@@ -23,6 +25,8 @@ class DatabaseUtils:
             Returns:
                 - A unique character string for the model fields.
         """
+        if get_unique_text_mode() == 'sequence':
+            return self.get_unique_text(model=model, obj=obj)
         max_chars = int(obj.max_length) // 2
         val = fake.name() if max_chars < 50 else fake.text(max_nb_chars=max_chars)
         if "id" in str(obj.name):
@@ -34,6 +38,44 @@ class DatabaseUtils:
         else:
             return val
 
+    def get_unique_text(self, model: models.Model, obj: models.Field) -> str:
+        """
+            Generates a unique text value composed of a random prefix and a base 36 sequence sized to fit
+            `max_length`, unique by construction: the existing rows are read once per field, never per value.
+
+            Args:
+                - model: The Django model class.
+                - obj: The CharField, TextField, SlugField, EmailField or URLField instance.
+
+            Returns:
+                - A unique text value for the model field.
+        """
+        key = (model, obj.name)
+        sequence = self.text_sequences.get(key)
+        if sequence is None:
+            sequence = self.text_sequences[key] = get_text_sequence(model, obj)
+        return sequence()
+
+    def get_placeholder_file(self, model: models.Model, obj: models.FileField) -> str:
+        """
+            Returns the name of one of the placeholder files of a FileField or ImageField. The files are written
+            once per field and shared by all the seeded rows; unique fields get a file of their own per row.
+
+            Args:
+                - model: The Django model class.
+                - obj: The FileField or ImageField instance.
+
+            Returns:
+                - The storage name of a placeholder file.
+        """
+        if obj.unique or obj.primary_key:
+            return create_placeholder_files(obj, count=1, workers=1)[0]
+        key = (model, obj.name)
+        names = self.placeholder_files.get(key)
+        if names is None:
+            names = self.placeholder_files[key] = create_placeholder_files(obj)
+        return random.choice(names)
+
     def get_unique_numeric_field_data(self, obj: object, model: models.Model) -> int:
         """
             - Generates a unique integer value for a model field by adding 1 to the highest existing value.
@@ -168,5 +210,6 @@ SUPPORTED_DJANGO_MODEL_FIELDS = [
     "GenericIPAddressField",
     "BinaryField",
     "DurationField",
-    "JSONField"
+    "JSONField",
+    "FileField"
 ]
@@ -0,0 +1,76 @@
+from django.db import models, transaction
+from django_data_seed.utils.thread_locals import (
+    clear_thread_variable,
+    get_thread_variable,
+    set_thread_variable
+)
+from django_data_seed.utils.bulk_audit_utils import (
+    DEFAULT_AUDIT_CHUNK_SIZE,
+    audit_bulk_create,
+    audit_bulk_update,
+    audit_update,
+    is_bulk_audited,
+    write_log_entries
+)
+
+
+class AuditedQuerySetMixin:
+    """
+    Records log entries for the bulk write paths that bypass `pre_save`/`post_save`:
+    `update()`, `bulk_update()` and `bulk_create()`.
+
+    The before and after states are read with one query each per chunk of `audit_chunk_size`
+    objects and the log entries are written with bulk inserts. Nothing changes for models that are not audited
+    or while log entries are disabled.
+
+    Example:
+        class Order(models.Model):
+            objects = AuditedManager()
+    """
+    audit_chunk_size = DEFAULT_AUDIT_CHUNK_SIZE
+
+    def update(self, **kwargs):
+        # ? bulk_update() runs its own update() queries, which are already audited
+        if not is_bulk_audited(self.model) or \
+                get_thread_variable('django_data_seed_bulk_update_active'):
+            return super().update(**kwargs)
+        with transaction.atomic(using=self.db):
+            return audit_update(
+                self,
+                lambda queryset: super(AuditedQuerySetMixin, queryset).update(**kwargs),
+                chunk_size=self.audit_chunk_size
+            )
+
+    def bulk_update(self, objs, fields, batch_size=None):
+        if not is_bulk_audited(self.model):
+            return super().bulk_update(objs, fields, batch_size=batch_size)
+        objs = list(objs)
+        with transaction.atomic(using=self.db):
+            set_thread_variable('django_data_seed_bulk_update_active', True)
+            try:
+                return audit_bulk_update(
+                    self.model,
+                    objs,
+                    lambda chunk: super(AuditedQuerySetMixin, self).bulk_update(
+                        chunk, fields, batch_size=batch_size),
+                    self.db,
+                    chunk_size=self.audit_chunk_size
+                )
+            finally:
+                clear_thread_variable('django_data_seed_bulk_update_active')
+
+    def bulk_create(self, objs, *args, **kwargs):
+        if not is_bulk_audited(self.model) or kwargs.get('ignore_conflicts') or \
+                kwargs.get('update_conflicts'):
+            return super().bulk_create(objs, *args, **kwargs)
+        with transaction.atomic(using=self.db):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            write_log_entries(audit_bulk_create(self.model, objs), using=self.db)
+        return objs
+
+
+class AuditedQuerySet(AuditedQuerySetMixin, models.QuerySet):
+    pass
+
+
+AuditedManager = models.Manager.from_queryset(AuditedQuerySet)
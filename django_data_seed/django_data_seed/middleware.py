@@ -1,52 +1,82 @@
+from django_data_seed.utils.audit_context import (
+    bind_audit_context,
+    reset_audit_context
+)
+from django_data_seed.utils.identity import (
+    JWT_IDENTITY_SOURCES,
+    AuditIdentity,
+    load_identity_sources
+)
 
-from django_data_seed.utils.get_user import set_current_user
-from django.utils.deprecation import MiddlewareMixin
+try:
+    from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+except ImportError:  # pragma: no cover - asgiref < 3.6
+    import asyncio
 
+    iscoroutinefunction = asyncio.iscoroutinefunction
 
-class CurrentUserMiddleware(MiddlewareMixin):
-    def process_request(self, request):
-        """
-        Set the current user based on the request object.
-        """
-        if hasattr(request, 'user'):
-            user = request.user
-            if user.is_authenticated:
-                set_current_user(user)
-            else:
-                # ? Optional: Handle cases where user is not authenticated
-                set_current_user(None)
-        else:
-            # ? Optional: Handle cases where request.user is not set
-            set_current_user(None)
-
-    def process_response(self, request, response):
-        """
-        Called after the view has been processed.
-        """
-        return response
+    def markcoroutinefunction(func):
+        func._is_coroutine = asyncio.coroutines._is_coroutine
+        return func
 
 
-class QueryAuthMiddleware:
+class AuditContextMiddleware:
     """
-    Custom middleware to handle JWT authentication from query strings or headers.
+    Binds the authenticated user to the audit context for the duration of a request.
+
+    Works under WSGI and ASGI: async requests are served without a thread hop, and the
+    user and the pending audit state are reset when the response is returned, so they never
+    leak into the next request served by the same thread or event loop. The user is bound
+    lazily and only resolved, through the identity sources, when a backup or log entry row
+    is written.
     """
+    sync_capable = True
+    async_capable = True
+    # ? callables or dotted paths taking a request and returning a user id, tried in order;
+    # ? None falls back to `DJANGO_DATA_SEED_IDENTITY_SOURCES`
+    identity_sources = None
 
     def __init__(self, get_response):
         self.get_response = get_response
+        self.identity_sources = load_identity_sources(self.identity_sources)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def get_identity(self, request):
+        """
+        Returns a lazy reference to the user of the request that is only resolved when an
+        audit row is written, so requests that never write skip the identity lookups.
+        """
+        return AuditIdentity(request, self.identity_sources)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        tokens = bind_audit_context(self.get_identity(request))
+        try:
+            return self.get_response(request)
+        finally:
+            reset_audit_context(tokens)
+
+    async def __acall__(self, request):
+        tokens = bind_audit_context(self.get_identity(request))
         try:
-            response = self.get_response(request)
-        except Exception as e:
-            print('__call_ Exception ', e)
-        if hasattr(request, 'user'):
-            user = request.user
-            if user.is_authenticated:
-                set_current_user(user)
-            else:
-                # ? Optional: Handle cases where user is not authenticated
-                set_current_user(None)
-        else:
-            # ? Optional: Handle cases where request.user is not set
-            set_current_user(None)
-        return response
+            return await self.get_response(request)
+        finally:
+            reset_audit_context(tokens)
+
+
+class CurrentUserMiddleware(AuditContextMiddleware):
+    """
+    Kept for existing settings; behaves like `AuditContextMiddleware`.
+    """
+
+
+class QueryAuthMiddleware(AuditContextMiddleware):
+    """
+    Audit context middleware for token authenticated APIs.
+
+    The user id is read from the JWT in the `Authorization` header or the query string,
+    decoded once per token, and falls back to `request.user`.
+    """
+    identity_sources = JWT_IDENTITY_SOURCES
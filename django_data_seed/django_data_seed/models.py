@@ -1,29 +1,25 @@
 from .utils.signal_utils import (
     data_backup_pre_save_handler,
     data_logentry_prev_save_handler,
-    data_logentry_post_save_handler
-)
-from django.conf import settings
-from django.dispatch import receiver
-from django.db.models.signals import (
-    pre_delete,
-    pre_save,
-    post_save
+    data_logentry_post_save_handler,
+    data_logentry_post_save_queue_handler,
+    get_snapshot_fingerprint
 )
+from .utils.audit_queue import enqueue_audit_event
+from .utils.config import get_audit_config
+from .managers import AuditedManager
 from django.db import models
+from django.core.validators import FileExtensionValidator
 import uuid
 from django.contrib.auth import get_user_model
 from typing import Type
-from .utils.colorama_theme import StdoutTextTheme
+from .utils.colorama_theme import SignalTextTheme
 from .utils.thread_locals import (
+    get_thread_variable,
     set_thread_variable,
     clear_thread_variable
 )
-from django_data_seed.utils.excluded_models import (
-    auto_log_entry_get_excluded_models,
-    auto_data_backup_get_excluded_models
-)
-colorma_theme = StdoutTextTheme()
+colorma_theme = SignalTextTheme()
 
 
 class DjangoSeedDataBackUpModel(models.Model):
@@ -54,6 +50,27 @@ class DjangoSeedDataBackUpModel(models.Model):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['model_name', 'object_id'],
+                name='dds_backup_object_idx'
+            ),
+            models.Index(
+                fields=['model_name', 'created_at'],
+                name='dds_backup_model_time_idx'
+            ),
+            models.Index(
+                fields=['deleted_by', 'created_at'],
+                name='dds_backup_user_time_idx'
+            ),
+            # ? serves the date filter of the admin, which is not narrowed by model
+            models.Index(
+                fields=['created_at'],
+                name='dds_backup_created_idx'
+            ),
+        ]
+
 
 class DjangoSeedDataLogEntryModel(models.Model):
     before_mutation = models.JSONField(null=True, blank=True)
@@ -84,8 +101,29 @@ class DjangoSeedDataLogEntryModel(models.Model):
         blank=True
     )
 
+    class Meta:
+        indexes = [
+            # ? serves point in time reconstruction of a single object
+            models.Index(
+                fields=['model_name', 'object_id', 'created_at'],
+                name='dds_logentry_object_time_idx'
+            ),
+            models.Index(
+                fields=['model_name', 'created_at'],
+                name='dds_logentry_model_time_idx'
+            ),
+            models.Index(
+                fields=['mutated_by', 'created_at'],
+                name='dds_logentry_user_time_idx'
+            ),
+            # ? serves the date filter of the admin, which is not narrowed by model
+            models.Index(
+                fields=['created_at'],
+                name='dds_logentry_created_idx'
+            ),
+        ]
+
 
-@receiver(pre_delete)
 def data_seed_backup_data_before_delete_handler(sender: Type[models.Model], instance: models.Model, **kwargs):
     """
         Handles the `pre_delete` signal to back up data before a model instance is deleted.
@@ -104,14 +142,13 @@ def data_seed_backup_data_before_delete_handler(sender: Type[models.Model], inst
             None
     """
     try:
-        if sender.__name__ in auto_data_backup_get_excluded_models():
-            return
-        ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP = getattr(
-            settings, 'ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP', None)
-        if not ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP:
-            return
         data_dict = data_backup_pre_save_handler(
             sender=sender, instance=instance)
+        if get_audit_config().queued:
+            # ? leave the write to `run_audit_worker`
+            enqueue_audit_event(
+                DjangoSeedDataBackUpModel, data_dict, using=instance._state.db)
+            return
         # ? Create a backup entry
         DjangoSeedDataBackUpModel.objects.create(**data_dict)
         colorma_theme.stdout_success("Databack up successfully.!")
@@ -119,7 +156,6 @@ def data_seed_backup_data_before_delete_handler(sender: Type[models.Model], inst
         pass
 
 
-@receiver(pre_save)
 def data_seed_auto_log_entry_pre_save_data_handler(sender: Type[models.Model], instance: models.Model, **kwargs):
     """
         Handles the pre-save signal to store the state of a model instance before any mutations.
@@ -138,30 +174,40 @@ def data_seed_auto_log_entry_pre_save_data_handler(sender: Type[models.Model], i
             None: This function does not return any value but performs data storage operations.
     """
 
+    # ? drop the state a failed save may have left behind
+    clear_thread_variable('django_data_seed_auto_logentry_pending')
+    clear_thread_variable('django_data_seed_auto_logentry_fingerprint')
     try:
-        if sender.__name__ in auto_log_entry_get_excluded_models():
-            return
-        ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY = getattr(
-            settings, 'ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY', None)
-        if not ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY:
-
-            return
         # ? only update if any changes happend
         data_dict = data_logentry_prev_save_handler(
             sender=sender,
             instance=instance
         )
+        if get_audit_config().queued:
+            # ? keep the before state until post_save instead of writing a row, with its owner
+            set_thread_variable(
+                name="django_data_seed_auto_logentry_pending",
+                value=(sender, instance.pk, data_dict)
+            )
+            set_thread_variable(
+                name="django_data_seed_auto_logentry_fingerprint",
+                value=get_snapshot_fingerprint(data_dict['before_mutation'])
+            )
+            return
         # ? Create a backup entry
         instance = DjangoSeedDataLogEntryModel.objects.create(**data_dict)
         set_thread_variable(
             name="django_data_seed_auto_logentry_pk",
             value=instance.pk
         )
+        set_thread_variable(
+            name="django_data_seed_auto_logentry_fingerprint",
+            value=get_snapshot_fingerprint(data_dict['before_mutation'])
+        )
     except Exception as e:
         pass
 
 
-@receiver(post_save)
 def data_seed_auto_log_entry_post_save_data_handler(sender: Type[models.Model], instance: models.Model, **kwargs):
     """
         Handles the `post_save` signal for storing data after a model instance has been saved.
@@ -181,23 +227,31 @@ def data_seed_auto_log_entry_post_save_data_handler(sender: Type[models.Model],
     """
 
     try:
-        if sender.__name__ in auto_log_entry_get_excluded_models():
-            return
-        ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY = getattr(
-            settings, 'ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY', None)
-        if not ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY:
-
-            return
-        is_data_saved = data_logentry_post_save_handler(
-            sender=sender,
-            instance=instance,
-            queryset=DjangoSeedDataLogEntryModel.objects.all()
-        )
-        if is_data_saved:
-
-            colorma_theme.stdout_success("Databack up successfully..!")
+        pending = get_thread_variable("django_data_seed_auto_logentry_pending")
+        if pending is not None and pending[:2] != (sender, instance.pk):
+            # ? the before state of another instance, never attach it to this one
+            pending = None
+            clear_thread_variable('django_data_seed_auto_logentry_fingerprint')
+        if pending is not None:
+            data_logentry_post_save_queue_handler(
+                sender=sender,
+                instance=instance,
+                data_dict=pending[2],
+                model=DjangoSeedDataLogEntryModel
+            )
+        else:
+            is_data_saved = data_logentry_post_save_handler(
+                sender=sender,
+                instance=instance,
+                queryset=DjangoSeedDataLogEntryModel.objects.all()
+            )
+            if is_data_saved:
+
+                colorma_theme.stdout_success("Databack up successfully..!")
         # ? clear the information loaded to threads
         clear_thread_variable('django_data_seed_auto_logentry_pk')
+        clear_thread_variable('django_data_seed_auto_logentry_pending')
+        clear_thread_variable('django_data_seed_auto_logentry_fingerprint')
     except Exception as e:
         pass
 
@@ -238,6 +292,13 @@ class DjangoDataSeedIntegerModel(models.Model):
     integer_field = models.IntegerField()
 
 
+class DjangoDataSeedAuditedManagerModel(models.Model):
+    integer_field = models.IntegerField()
+    char_field = models.CharField(max_length=100, default='')
+
+    objects = AuditedManager()
+
+
 class DjangoDataSeedUUIDModel(models.Model):
     uuid_field = models.UUIDField(
         default=uuid.uuid4, unique=True)
@@ -331,4 +392,49 @@ class DjangoDataSeedManyToManyModel(models.Model):
         related_name="DjangoDataSeedManyToManyModel_char_field"
     )
 
+
+class DjangoDataSeedUniqueTogetherModel(models.Model):
+    integer_field = models.ForeignKey(
+        DjangoDataSeedIntegerModel, on_delete=models.CASCADE,
+        related_name="DjangoDataSeedUniqueTogetherModel_integer_field"
+    )
+    position = models.PositiveSmallIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['integer_field', 'position'], name='dds_unique_together_position'
+            ),
+        ]
+
+
+class DjangoDataSeedTreeModel(models.Model):
+    name = models.CharField(max_length=50)
+    parent = models.ForeignKey(
+        'self', null=True, blank=True, on_delete=models.CASCADE,
+        related_name="DjangoDataSeedTreeModel_parent"
+    )
+
+
+class DjangoDataSeedCycleAModel(models.Model):
+    cycle_b = models.ForeignKey(
+        'DjangoDataSeedCycleBModel', null=True, blank=True, on_delete=models.SET_NULL,
+        related_name="DjangoDataSeedCycleAModel_cycle_b"
+    )
+
+
+class DjangoDataSeedCycleBModel(models.Model):
+    cycle_a = models.ForeignKey(
+        DjangoDataSeedCycleAModel, on_delete=models.CASCADE,
+        related_name="DjangoDataSeedCycleBModel_cycle_a"
+    )
+
+
+class DjangoDataSeedFileModel(models.Model):
+    document = models.FileField(upload_to='django_data_seed/documents/')
+    picture = models.FileField(
+        upload_to='django_data_seed/pictures/%Y/', blank=True,
+        validators=[FileExtensionValidator(['png', 'jpg'])]
+    )
+
 # * END OF TEST MODELS
@@ -0,0 +1,90 @@
+from django.apps import apps
+from django.core.signals import setting_changed
+from django.db.models.signals import (
+    pre_delete,
+    pre_save,
+    post_save
+)
+from django.dispatch import receiver
+from django_data_seed.utils.config import (
+    AUDIT_SETTINGS,
+    reload_audit_config
+)
+
+BACKUP_DISPATCH_UID = 'django_data_seed_backup_pre_delete'
+LOG_ENTRY_PRE_SAVE_DISPATCH_UID = 'django_data_seed_log_entry_pre_save'
+LOG_ENTRY_POST_SAVE_DISPATCH_UID = 'django_data_seed_log_entry_post_save'
+
+# ? (signal, dispatch_uid, sender) of every receiver connected by `connect_audit_receivers`
+_connected_receivers = []
+
+
+def disconnect_audit_receivers() -> None:
+    """
+    Disconnects every audit receiver from the model signals.
+    """
+    while _connected_receivers:
+        signal, dispatch_uid, sender = _connected_receivers.pop()
+        signal.disconnect(sender=sender, dispatch_uid=dispatch_uid)
+
+
+def connect_audit_receiver(signal, handler, dispatch_uid: str, sender) -> None:
+    """
+    Connects an audit receiver to one model and remembers it for `disconnect_audit_receivers`.
+    """
+    signal.connect(handler, sender=sender, dispatch_uid=dispatch_uid)
+    _connected_receivers.append((signal, dispatch_uid, sender))
+
+
+def connect_audit_receivers() -> None:
+    """
+    Compiles the audit configuration and connects the receivers of enabled features
+    to every audited model.
+
+    Description:
+        Receivers are connected per sender, so Django only dispatches to them for audited
+        models; saves of sessions and other unaudited tables never reach django_data_seed.
+        When a feature is disabled its receivers are not connected at all.
+    """
+    from django_data_seed.models import (
+        data_seed_backup_data_before_delete_handler,
+        data_seed_auto_log_entry_pre_save_data_handler,
+        data_seed_auto_log_entry_post_save_data_handler
+    )
+    config = reload_audit_config()
+    disconnect_audit_receivers()
+    if not config.enabled:
+        return
+    for model in apps.get_models():
+        if not config.is_audited(model):
+            continue
+        label = model._meta.label_lower
+        if config.backup_enabled:
+            connect_audit_receiver(
+                pre_delete,
+                data_seed_backup_data_before_delete_handler,
+                f'{BACKUP_DISPATCH_UID}_{label}',
+                model
+            )
+        if config.log_entry_enabled:
+            connect_audit_receiver(
+                pre_save,
+                data_seed_auto_log_entry_pre_save_data_handler,
+                f'{LOG_ENTRY_PRE_SAVE_DISPATCH_UID}_{label}',
+                model
+            )
+            connect_audit_receiver(
+                post_save,
+                data_seed_auto_log_entry_post_save_data_handler,
+                f'{LOG_ENTRY_POST_SAVE_DISPATCH_UID}_{label}',
+                model
+            )
+
+
+@receiver(setting_changed)
+def reconnect_audit_receivers_on_setting_changed(setting, **kwargs):
+    """
+    Recompiles the audit configuration when one of its settings is overridden, e.g. in tests.
+    """
+    if setting in AUDIT_SETTINGS:
+        connect_audit_receivers()
@@ -8,19 +8,90 @@ from .models import (
     DjangoDataSeedCharModel,
     DjangoDataSeedForeignKeyModel,
     DjangoDataSeedUUIDModel,
-    DjangoDataSeedIntegerModel
+    DjangoDataSeedIntegerModel,
+    DjangoDataSeedAuditedManagerModel,
+    DjangoDataSeedManyToManyModel,
+    DjangoDataSeedOneToOneModel,
+    DjangoDataSeedDecimalModel,
+    DjangoDataSeedPositiveSmallIntegerModel,
+    DjangoDataSeedUniqueTogetherModel,
+    DjangoDataSeedTreeModel,
+    DjangoDataSeedCycleAModel,
+    DjangoDataSeedCycleBModel,
+    DjangoDataSeedFileModel,
+    DjangoDataSeedSmallIntegerModel,
+    DjangoDataSeedBigIntegerModel
 )
 from django_data_seed.utils.get_user import (
     set_current_user,
     get_current_user,
 
 )
-from django.test import TestCase
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from io import StringIO
+from django.utils import timezone
 from django.core.management import call_command
-from .utils.colorama_theme import StdoutTextTheme
+from .utils.colorama_theme import StdoutTextTheme, SignalTextTheme
+from .utils.output import ConsoleHandler
+from django_data_seed.utils.model_introspection import (
+    clear_model_descriptors,
+    get_model_descriptor
+)
+from django_data_seed.utils.model_property import get_model_properties
+from django_data_seed.utils.model_utils.utils import load_objects
+from django_data_seed.utils.column_profile import AliasTable, profile_model
+from django_data_seed.utils.fk_strategies import parent_sampler, tree_sampler
+from django_data_seed.utils.seed_constraints import (
+    SeedConstraintError,
+    UniqueTuples,
+    value_adjuster
+)
+from django_data_seed.utils.seed_engine import execute_plan
+from django_data_seed.utils.unique_text import UniqueTextSequence, get_text_sequence
+from django_data_seed.management.commands.load_data import SeedData
+from django_data_seed.utils.generator_registry import registry
+from django_data_seed.utils.placeholder_files import (
+    create_placeholder_files,
+    write_placeholder
+)
+from django.core.validators import validate_email
+from django.db import models as db_models
+from django_data_seed.utils.seed_profile import SeedProfileError, compile_profile
+from django.core.management.base import CommandError
+from django.core.exceptions import ImproperlyConfigured
+import logging
 import uuid
-from django_data_seed.utils.json_compare import compare_json_objects
+import datetime
+from django_data_seed.utils.retention_utils import measure_bytes
+from django_data_seed.utils.json_compare import (
+    compare_json_objects,
+    get_changed_paths,
+    json_fingerprint
+)
+from django_data_seed.utils.config import get_audit_config
+from django.db.models import F
+from django.db.models.signals import post_save, pre_delete, pre_save
+from django.contrib.sessions.models import Session
+from django.contrib import admin
+from django_data_seed.utils.log_entry_utils import (
+    clear_reconstruction_cache,
+    get_object_at,
+    reconstruct_queryset
+)
+from django_data_seed.middleware import AuditContextMiddleware
+from django.test import RequestFactory
+from django.http import HttpResponse
+from django.utils.functional import SimpleLazyObject
+from asgiref.sync import async_to_sync
+from unittest import skipIf, skipUnless
+from importlib.util import find_spec
+from django_data_seed.middleware import QueryAuthMiddleware
+from django_data_seed.utils.identity import clear_token_cache
+from django_data_seed.utils.audit_queue import get_audit_spool
+import os
+import json
+import tempfile
+from decimal import Decimal
 from django_data_seed.utils.app_utils import (
     get_all_custom_apps_and_sub_apps,
     get_filtered_models
@@ -35,6 +106,14 @@ class DataDataSeedTestCase(TestCase, StdoutTextTheme):
     app_names = get_all_custom_apps_and_sub_apps()
     model_names = get_filtered_models()
 
+    def setUp(self):
+        # ? placeholder files of seeded file fields go to a temporary media root
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        media = override_settings(MEDIA_ROOT=media_root.name)
+        media.enable()
+        self.addCleanup(media.disable)
+
     def run_seed_command_for_model(self, model_name):
         try:
             # ? Run the seeddata command
@@ -411,3 +490,1407 @@ class DjangoDataSeedAutoLogEntryUnWantedSaveTestCase(TestCase, StdoutTextTheme):
         self.stdout_headers(
             "No differences detected between mutated and created data, so the instance was not added to the log entry. Test case passed successfully."
         )
+
+
+@override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True)
+class DjangoDataSeedRestoreBackupsCommandTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that the `restore_backups` command streams
+        backups back into their models and removes the restored backup rows.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+
+    def test_restore_backups_command(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed restore_backups command test cases")
+        char_pks = []
+        for index in range(5):
+            char_instance = DjangoDataSeedCharModel.objects.create(
+                char_field=f"sample data {index}",
+                choice_field="option1"
+            )
+            char_pks.append(char_instance.pk)
+            char_instance.delete()
+        self.assertEqual(
+            DjangoSeedDataBackUpModel.objects.filter(
+                model_name="DjangoDataSeedCharModel"
+            ).count(),
+            5
+        )
+        call_command(
+            'restore_backups',
+            '--model-name',
+            'DjangoDataSeedCharModel',
+            '--object-id-from',
+            str(char_pks[1]),
+            '--object-id-to',
+            str(char_pks[3]),
+            '--batch-size',
+            '2',
+            stdout=StringIO()
+        )
+        self.assertEqual(
+            set(DjangoDataSeedCharModel.objects.values_list('pk', flat=True)),
+            set(char_pks[1:4])
+        )
+        self.assertEqual(
+            set(
+                DjangoSeedDataBackUpModel.objects.filter(
+                    model_name="DjangoDataSeedCharModel"
+                ).values_list('object_id', flat=True)
+            ),
+            {str(char_pks[0]), str(char_pks[4])}
+        )
+        self.stdout_success(
+            "Backups inside the requested object id range were restored and removed."
+        )
+
+    def test_restore_backups_command_restores_parents_first(self):
+        uuid_instance = DjangoDataSeedUUIDModel.objects.create(uuid_field=uuid.uuid1())
+        integer_instance = DjangoDataSeedIntegerModel.objects.create(integer_field=10)
+        foreign_key_instance = DjangoDataSeedForeignKeyModel.objects.create(
+            uuid_field=uuid_instance,
+            integer_field=integer_instance
+        )
+        foreign_key_pk, integer_pk = foreign_key_instance.pk, integer_instance.pk
+        # ? the cascade backs up the child, whose name sorts before its parent
+        integer_instance.delete()
+        call_command('restore_backups', stdout=StringIO())
+        self.assertTrue(
+            DjangoDataSeedForeignKeyModel.objects.filter(
+                pk=foreign_key_pk,
+                integer_field=integer_pk
+            ).exists()
+        )
+        self.assertFalse(DjangoSeedDataBackUpModel.objects.exists())
+        self.stdout_success(
+            "A single worker restores the parents before the children that point to them."
+        )
+
+
+@override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True)
+class DjangoDataSeedPointInTimeReconstructionTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that log entries can reconstruct
+        the state of objects at a given point in time.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+        clear_reconstruction_cache()
+
+    def test_get_object_at(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed point in time reconstruction test cases")
+        char_instance = DjangoDataSeedCharModel.objects.create(
+            char_field="first value",
+            choice_field="option1"
+        )
+        other_instance = DjangoDataSeedCharModel.objects.create(
+            char_field="other value",
+            choice_field="option1"
+        )
+        before_first_change = timezone.now()
+        char_instance.char_field = "second value"
+        char_instance.save()
+        after_first_change = timezone.now()
+        char_instance.char_field = "third value"
+        char_instance.save()
+
+        self.assertEqual(
+            get_object_at(
+                DjangoDataSeedCharModel, char_instance.pk, before_first_change
+            )['fields']['char_field'],
+            "first value"
+        )
+        self.assertEqual(
+            get_object_at(
+                DjangoDataSeedCharModel, char_instance.pk, after_first_change
+            )['fields']['char_field'],
+            "second value"
+        )
+        self.assertEqual(
+            get_object_at(
+                "DjangoDataSeedCharModel", char_instance.pk, timezone.now()
+            )['fields']['char_field'],
+            "third value"
+        )
+        states = reconstruct_queryset(
+            DjangoDataSeedCharModel.objects.all(), after_first_change
+        )
+        self.assertEqual(
+            states[str(char_instance.pk)]['fields']['char_field'],
+            "second value"
+        )
+        self.assertIsNone(states[str(other_instance.pk)])
+
+        for value in range(5):
+            other_instance.char_field = f"version {value}"
+            other_instance.save()
+        clear_reconstruction_cache()
+        # ? the primary keys, then one row per object picked in SQL
+        with self.assertNumQueries(2):
+            states = reconstruct_queryset(DjangoDataSeedCharModel.objects.all(), timezone.now())
+        self.assertEqual(states[str(other_instance.pk)]['fields']['char_field'], "version 4")
+        self.assertEqual(states[str(char_instance.pk)]['fields']['char_field'], "third value")
+        self.stdout_success(
+            "Objects were reconstructed to their state at the requested time."
+        )
+
+    def test_get_object_at_does_not_cache_unresolved_states(self):
+        timestamp = timezone.now()
+        self.assertIsNone(get_object_at(DjangoDataSeedCharModel, 0, timestamp))
+        entry = DjangoSeedDataLogEntryModel.objects.create(
+            model_name="DjangoDataSeedCharModel",
+            object_id="0",
+            before_mutation={"fields": {"char_field": "before"}},
+            after_mutation={"fields": {"char_field": "after"}}
+        )
+        self.assertEqual(
+            get_object_at(DjangoDataSeedCharModel, 0, timestamp)['fields']['char_field'], "before"
+        )
+        # ? an entry logged late, e.g. by the audit queue, with a time before the timestamp
+        DjangoSeedDataLogEntryModel.objects.filter(pk=entry.pk).update(
+            created_at=timestamp - datetime.timedelta(seconds=1)
+        )
+        self.assertEqual(
+            get_object_at(DjangoDataSeedCharModel, 0, timestamp)['fields']['char_field'], "after"
+        )
+        self.stdout_success(
+            "Unknown and fallback states are looked up again instead of being served from the cache."
+        )
+
+
+class DjangoDataSeedAdminSearchTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that the audit admin pages search whole
+        values of the primary key, object id and model name.
+    """
+
+    def test_admin_search(self):
+        model_admin = admin.site._registry[DjangoSeedDataLogEntryModel]
+        entries = [
+            DjangoSeedDataLogEntryModel.objects.create(object_id=str(pk), model_name='Model')
+            for pk in (10, 100)
+        ]
+        queryset = DjangoSeedDataLogEntryModel.objects.all()
+        for term, expected in (
+            (str(entries[0].pk), [entries[0]]),
+            ('10', [entries[0]]),
+            ('Model', entries),
+            ('Mod', []),
+        ):
+            results, _ = model_admin.get_search_results(None, queryset, term)
+            self.assertEqual(list(results.order_by('pk')), expected)
+
+
+@override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True)
+class DjangoDataSeedAuditPartitionsCommandTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that `audit_partitions --drop-before` removes
+        old audit rows through the chunked delete stand-in on SQLite.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+
+    def test_drop_before_deletes_old_rows(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed audit_partitions command test cases")
+        for index in range(3):
+            DjangoDataSeedCharModel.objects.create(
+                char_field=f"sample data {index}",
+                choice_field="option1"
+            ).delete()
+        now = timezone.now()
+        call_command(
+            'audit_partitions',
+            '--table',
+            'backup',
+            '--drop-before',
+            f'{now.year - 1}-01',
+            stdout=StringIO()
+        )
+        self.assertEqual(DjangoSeedDataBackUpModel.objects.count(), 3)
+        call_command(
+            'audit_partitions',
+            '--table',
+            'backup',
+            '--drop-before',
+            f'{now.year + 1}-01',
+            '--chunk-size',
+            '2',
+            stdout=StringIO()
+        )
+        self.assertFalse(DjangoSeedDataBackUpModel.objects.exists())
+        self.stdout_success(
+            "Backups created before the requested month were removed."
+        )
+
+
+@override_settings(
+    ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True,
+    ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True
+)
+class DjangoDataSeedCompactAuditLogCommandTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that `compact_audit_log` collapses old log entries
+        into a single snapshot and applies age based retention.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+
+    def test_measure_bytes(self):
+        DjangoDataSeedCharModel.objects.create(char_field='h\u00e9llo \u20ac', choice_field='option1')
+        self.assertEqual(
+            measure_bytes(DjangoDataSeedCharModel.objects.all(), ['char_field']), 10)
+
+    def test_compact_audit_log(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed compact_audit_log command test cases")
+        char_instance = DjangoDataSeedCharModel.objects.create(
+            char_field="value 0",
+            choice_field="option1"
+        )
+        for index in range(1, 5):
+            char_instance.char_field = f"value {index}"
+            char_instance.save()
+        log_entries = DjangoSeedDataLogEntryModel.objects.filter(
+            model_name="DjangoDataSeedCharModel",
+            object_id=char_instance.pk
+        )
+        self.assertEqual(log_entries.count(), 4)
+
+        call_command(
+            'compact_audit_log',
+            '--table',
+            'logentry',
+            '--max-versions',
+            '2',
+            stdout=StringIO()
+        )
+        remaining = list(log_entries.order_by('created_at', 'pk'))
+        self.assertEqual(len(remaining), 2)
+        self.assertEqual(
+            remaining[0].before_mutation['fields']['char_field'], "value 0")
+        self.assertEqual(
+            remaining[0].after_mutation['fields']['char_field'], "value 3")
+        self.assertEqual(
+            remaining[1].after_mutation['fields']['char_field'], "value 4")
+        self.stdout_info(
+            "Old log entries were collapsed into a single snapshot."
+        )
+
+        char_instance.delete()
+        call_command(
+            'compact_audit_log',
+            '--table',
+            'backup',
+            '--max-age-days',
+            '0',
+            stdout=StringIO()
+        )
+        self.assertFalse(DjangoSeedDataBackUpModel.objects.exists())
+        self.stdout_success(
+            "Backups older than the retention window were deleted."
+        )
+
+
+class DjangoDataSeedJsonCompareTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying the iterative JSON comparison,
+        the changed path detection and the canonical fingerprints.
+    """
+
+    def test_compare_json_objects(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed JSON comparison test cases")
+        before = {
+            "pk": "1",
+            "model": "django_data_seed.djangodataseedcharmodel",
+            "fields": {"char_field": "sample", "tags": [1, 2, {"deep": True}]}
+        }
+        after = {
+            "model": "django_data_seed.djangodataseedcharmodel",
+            "pk": "1",
+            "fields": {"char_field": "sample", "tags": [1, 2, {"deep": True}]}
+        }
+        self.assertTrue(compare_json_objects(before, after))
+        self.assertEqual(json_fingerprint(before), json_fingerprint(after))
+        self.assertEqual(get_changed_paths(before, after), set())
+
+        after["fields"]["char_field"] = "modified"
+        after["fields"]["tags"][2]["deep"] = 1
+        self.assertFalse(compare_json_objects(before, after))
+        self.assertNotEqual(json_fingerprint(before), json_fingerprint(after))
+        self.assertEqual(
+            get_changed_paths(before, after),
+            {("fields", "char_field"), ("fields", "tags", 2, "deep")}
+        )
+
+        nested_before, nested_after = [], []
+        for _ in range(5000):
+            nested_before, nested_after = [nested_before], [nested_after]
+        self.assertTrue(compare_json_objects(nested_before, nested_after))
+        self.stdout_success(
+            "JSON comparison detects changes and handles deeply nested payloads."
+        )
+
+
+class DjangoDataSeedAuditConfigTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that the compiled audit configuration
+        honours exclusions and disconnects receivers of disabled features.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+
+    def test_audit_config(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed audit configuration test cases")
+        with override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=False):
+            self.assertFalse(get_audit_config().backup_enabled)
+            self.assertFalse(
+                pre_delete.has_listeners(DjangoDataSeedCharModel))
+            DjangoDataSeedCharModel.objects.create(
+                char_field="sample data", choice_field="option1").delete()
+            self.assertFalse(DjangoSeedDataBackUpModel.objects.exists())
+
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True,
+            DJANGO_DATA_SEED_EXCLUDED_MODELS=['django_data_seed.DjangoDataSeedCharModel']
+        ):
+            self.assertFalse(
+                get_audit_config().is_audited(DjangoDataSeedCharModel))
+            self.assertTrue(
+                get_audit_config().is_audited(DjangoDataSeedIntegerModel))
+            DjangoDataSeedCharModel.objects.create(
+                char_field="sample data", choice_field="option1").delete()
+            DjangoDataSeedIntegerModel.objects.create(integer_field=1).delete()
+            self.assertEqual(
+                list(DjangoSeedDataBackUpModel.objects.values_list(
+                    'model_name', flat=True)),
+                ["DjangoDataSeedIntegerModel"]
+            )
+        self.stdout_success(
+            "Audit configuration excludes models and skips disabled features."
+        )
+
+
+class DjangoDataSeedPerModelReceiversTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that audit receivers are connected per
+        audited model instead of listening to every model.
+    """
+
+    def test_receivers_connected_per_sender(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed per model receivers test cases")
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True,
+            ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True
+        ):
+            self.assertTrue(pre_delete.has_listeners(DjangoDataSeedCharModel))
+            self.assertFalse(pre_save.has_listeners(Session))
+            self.assertFalse(pre_save.has_listeners(DjangoSeedDataLogEntryModel))
+
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True,
+            DJANGO_DATA_SEED_AUDITED_MODELS=['DjangoDataSeedIntegerModel']
+        ):
+            self.assertTrue(
+                pre_delete.has_listeners(DjangoDataSeedIntegerModel))
+            self.assertFalse(
+                pre_delete.has_listeners(DjangoDataSeedCharModel))
+        self.stdout_success(
+            "Audit receivers are only connected to audited models."
+        )
+
+
+class DjangoDataSeedAuditContextMiddlewareTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that the audit context middleware binds the
+        request user for sync and async requests and resets it afterwards.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+        self.user = get_user_model().objects.create(username='middleware')
+        self.request = RequestFactory().get('/')
+        self.request.user = self.user
+
+    def test_audit_context_middleware(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed audit context middleware test cases")
+        seen = []
+
+        def view(request):
+            seen.append(get_current_user())
+            return HttpResponse()
+
+        async def async_view(request):
+            seen.append(get_current_user())
+            return HttpResponse()
+
+        AuditContextMiddleware(view)(self.request)
+        self.assertEqual(seen, [self.user])
+        self.assertIsNone(get_current_user())
+
+        middleware = AuditContextMiddleware(async_view)
+        async_to_sync(middleware)(self.request)
+        self.assertEqual(seen, [self.user, self.user])
+        self.assertIsNone(get_current_user())
+        self.stdout_success(
+            "Audit context is bound per request and reset afterwards."
+        )
+
+    def test_user_resolved_only_when_audit_rows_are_written(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed lazy audit user test cases")
+        resolved = []
+
+        def resolve_user():
+            resolved.append(True)
+            return self.user
+
+        self.request.user = SimpleLazyObject(resolve_user)
+        AuditContextMiddleware(lambda request: HttpResponse())(self.request)
+        self.assertEqual(resolved, [])
+
+        def write_view(request):
+            DjangoDataSeedIntegerModel.objects.create(integer_field=1).delete()
+            return HttpResponse()
+
+        with override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True):
+            AuditContextMiddleware(write_view)(self.request)
+        self.assertEqual(resolved, [True])
+        self.assertEqual(
+            DjangoSeedDataBackUpModel.objects.get().deleted_by_id, self.user.pk)
+        self.stdout_success(
+            "Audit user is only resolved when an audit row is written."
+        )
+
+
+def header_user_id(request):
+    """
+        Identity source used by the tests, reading the user id from a header.
+    """
+    header_user_id.calls += 1
+    return request.META.get('HTTP_X_USER_ID')
+
+
+header_user_id.calls = 0
+
+
+class DjangoDataSeedIdentitySourcesTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that audit rows record the user id returned by
+        the identity sources without fetching the user.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+        self.user = get_user_model().objects.create(username='identity')
+
+    def test_pluggable_identity_source(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed identity sources test cases")
+
+        class HeaderMiddleware(AuditContextMiddleware):
+            identity_sources = [header_user_id]
+
+        def write_view(request):
+            for value in (1, 2):
+                DjangoDataSeedIntegerModel.objects.create(
+                    integer_field=value).delete()
+            return HttpResponse()
+
+        header_user_id.calls = 0
+        request = RequestFactory().get('/', HTTP_X_USER_ID=str(self.user.pk))
+        with override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True):
+            HeaderMiddleware(write_view)(request)
+        self.assertEqual(header_user_id.calls, 1)
+        self.assertEqual(
+            set(DjangoSeedDataBackUpModel.objects.values_list(
+                'deleted_by_id', flat=True)),
+            {self.user.pk}
+        )
+        self.stdout_success(
+            "Identity sources are asked once per request."
+        )
+
+    @skipIf(find_spec('jwt'), 'PyJWT is installed')
+    def test_jwt_identity_source_without_pyjwt(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, 'django-data-seed[jwt]'):
+            QueryAuthMiddleware(lambda request: HttpResponse())
+        with override_settings(DJANGO_DATA_SEED_IDENTITY_SOURCES=[
+            'django_data_seed.utils.identity.jwt_user_id'
+        ]):
+            with self.assertRaises(ImproperlyConfigured):
+                AuditContextMiddleware(lambda request: HttpResponse())
+
+    @skipUnless(find_spec('jwt'), 'PyJWT is not installed')
+    def test_jwt_identity_source(self):
+        import jwt
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed JWT identity test cases")
+        clear_token_cache()
+        token = jwt.encode(
+            {'user_id': self.user.pk}, 'secret', algorithm='HS256')
+
+        def write_view(request):
+            DjangoDataSeedIntegerModel.objects.create(integer_field=1).delete()
+            return HttpResponse()
+
+        request = RequestFactory().get(
+            '/', HTTP_AUTHORIZATION=f'Bearer {token}')
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True,
+            DJANGO_DATA_SEED_JWT_SECRET='secret'
+        ):
+            QueryAuthMiddleware(write_view)(request)
+        self.assertEqual(
+            DjangoSeedDataBackUpModel.objects.get().deleted_by_id, self.user.pk)
+        self.stdout_success(
+            "User id is captured from the JWT claims."
+        )
+
+
+class DjangoDataSeedAuditQueueTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that queued audit events are only written
+        once the worker drains the spool.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+        self.directory = tempfile.TemporaryDirectory()
+        self.queue_path = os.path.join(self.directory.name, 'audit.sqlite3')
+
+    def tearDown(self):
+        get_audit_spool(self.queue_path).close()
+        self.directory.cleanup()
+
+    def test_run_audit_worker(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed audit queue test cases")
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP=True,
+            ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True,
+            DJANGO_DATA_SEED_AUDIT_QUEUE_PATH=self.queue_path
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                instance = DjangoDataSeedIntegerModel.objects.create(
+                    integer_field=1)
+                instance.integer_field = 2
+                instance.save()
+                # ? unchanged saves are not queued
+                instance.save()
+                instance.delete()
+            self.assertFalse(DjangoSeedDataLogEntryModel.objects.exists())
+            self.assertFalse(DjangoSeedDataBackUpModel.objects.exists())
+
+            stdout = StringIO()
+            call_command('run_audit_worker', '--stats', stdout=stdout)
+            self.assertEqual(json.loads(stdout.getvalue())['depth'], 2)
+
+            delivered_at = timezone.now()
+            call_command('run_audit_worker', '--once', stdout=StringIO())
+            stdout = StringIO()
+            call_command('run_audit_worker', '--stats', stdout=stdout)
+            self.assertEqual(json.loads(stdout.getvalue())['depth'], 0)
+
+        entry = DjangoSeedDataLogEntryModel.objects.get()
+        self.assertEqual(entry.before_mutation['fields']['integer_field'], 1)
+        self.assertEqual(entry.after_mutation['fields']['integer_field'], 2)
+        # ? rows keep the moment of the audited write
+        self.assertLess(entry.created_at, delivered_at)
+        self.assertEqual(entry.updated_at, entry.created_at)
+        self.assertEqual(
+            DjangoSeedDataBackUpModel.objects.get().data['fields']['integer_field'], 2)
+        self.stdout_success(
+            "Queued audit events were delivered by the worker."
+        )
+
+    def test_stale_pending_snapshot(self):
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True,
+            DJANGO_DATA_SEED_AUDIT_QUEUE_PATH=self.queue_path
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                first = DjangoDataSeedIntegerModel.objects.create(integer_field=1)
+                second = DjangoDataSeedIntegerModel.objects.create(integer_field=5)
+                # ? a save of the first instance failing after pre_save
+                pre_save.send(sender=DjangoDataSeedIntegerModel, instance=first)
+                post_save.send(
+                    sender=DjangoDataSeedIntegerModel, instance=second, created=False)
+                pre_save.send(sender=DjangoDataSeedIntegerModel, instance=first)
+                second.integer_field = 6
+                second.save()
+            call_command('run_audit_worker', '--once', stdout=StringIO())
+        entry = DjangoSeedDataLogEntryModel.objects.get()
+        self.assertEqual(entry.object_id, str(second.pk))
+        self.assertEqual(entry.before_mutation['fields']['integer_field'], 5)
+
+    def test_unavailable_spool(self):
+        # ? a directory can not be opened as the spool file
+        with override_settings(
+            ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True,
+            DJANGO_DATA_SEED_AUDIT_QUEUE_PATH=self.directory.name
+        ):
+            with self.assertLogs('django_data_seed', level='ERROR') as logs:
+                with self.captureOnCommitCallbacks(execute=True):
+                    instance = DjangoDataSeedIntegerModel.objects.create(integer_field=1)
+                    instance.integer_field = 2
+                    instance.save()
+        self.assertIn('writing them directly', logs.output[0])
+        self.assertEqual(
+            DjangoSeedDataLogEntryModel.objects.get().after_mutation['fields']['integer_field'], 2)
+
+
+class DjangoDataSeedAuditedManagerTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that update(), bulk_update() and bulk_create()
+        of an audited manager record log entries.
+    """
+
+    def setUp(self):
+        set_current_user(user=None)
+
+    def test_bulk_writes_are_audited(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed audited manager test cases")
+        with override_settings(ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY=True):
+            objs = DjangoDataSeedAuditedManagerModel.objects.bulk_create([
+                DjangoDataSeedAuditedManagerModel(integer_field=value)
+                for value in range(3)
+            ])
+            entries = DjangoSeedDataLogEntryModel.objects.filter(
+                model_name='DjangoDataSeedAuditedManagerModel')
+            self.assertEqual(entries.count(), 3)
+            self.assertTrue(all(
+                entry.before_mutation is None for entry in entries))
+            entries.delete()
+
+            with self.assertNumQueries(7):
+                # ? savepoint, pks, before state, update, after state,
+                # ? log entries, release
+                DjangoDataSeedAuditedManagerModel.objects.filter(
+                    integer_field__gte=1).update(integer_field=F('integer_field') + 10)
+            entry = entries.get(object_id=str(objs[1].pk))
+            self.assertEqual(entry.before_mutation['fields']['integer_field'], 1)
+            self.assertEqual(entry.after_mutation['fields']['integer_field'], 11)
+            self.assertEqual(entries.count(), 2)
+            entries.delete()
+
+            for obj in objs:
+                obj.char_field = f'bulk {obj.pk}'
+            DjangoDataSeedAuditedManagerModel.objects.bulk_update(
+                objs, ['char_field'])
+            entry = entries.get(object_id=str(objs[1].pk))
+            self.assertEqual(entry.before_mutation['fields']['char_field'], '')
+            self.assertEqual(
+                entry.after_mutation['fields'],
+                {'integer_field': 11, 'char_field': f'bulk {objs[1].pk}'}
+            )
+            self.assertEqual(entries.count(), 3)
+            entries.delete()
+
+            for obj in objs:
+                obj.integer_field = F('integer_field') + 1
+            DjangoDataSeedAuditedManagerModel.objects.bulk_update(
+                objs, ['integer_field'])
+            entry = entries.get(object_id=str(objs[1].pk))
+            self.assertEqual(entry.before_mutation['fields']['integer_field'], 11)
+            self.assertEqual(entry.after_mutation['fields']['integer_field'], 12)
+        self.stdout_success(
+            "Bulk writes of the audited manager were logged."
+        )
+
+
+class DjangoDataSeedConsoleOutputTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that console output is rate limited, plain on
+        non terminals and silent in the signal handlers.
+    """
+
+    def test_console_output(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed console output test cases")
+        stream = StringIO()
+        handler = ConsoleHandler(rate_limit=2, rate_window=60, stream=stream)
+        logger = logging.getLogger('django_data_seed.tests.console_output')
+        logger.propagate = False
+        logger.addHandler(handler)
+        try:
+            for row in range(5):
+                logger.warning("Seeded row %s", row)
+                logger.warning(f"Seeded object {row}")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+        self.assertEqual(stream.getvalue().splitlines(), [
+            "Seeded row 0",
+            "Seeded object 0",
+            "Seeded row 1",
+            "Seeded object 1",
+            "... 3 similar messages suppressed",
+            "... 3 similar messages suppressed",
+        ])
+
+        signal_logger = logging.getLogger(SignalTextTheme.output_logger_name)
+        SignalTextTheme().stdout_success("configured")
+        self.assertFalse(signal_logger.isEnabledFor(logging.INFO))
+        self.stdout_success(
+            "Console output is rate limited and signal handlers are silent."
+        )
+
+
+class DjangoDataSeedModelIntrospectionTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that model descriptors are computed once,
+        immutable and describe the model fields.
+    """
+
+    def test_model_descriptor(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed model introspection test cases")
+        clear_model_descriptors()
+        descriptor = get_model_descriptor(DjangoDataSeedForeignKeyModel)
+        self.assertIs(
+            descriptor, get_model_descriptor(DjangoDataSeedForeignKeyModel))
+        with self.assertRaises(AttributeError):
+            descriptor.name = 'Changed'
+
+        field = descriptor.get_field('uuid_field')
+        self.assertIs(field, descriptor.get_field('uuid_field_id'))
+        self.assertTrue(field.many_to_one)
+        self.assertIs(field.related_model, DjangoDataSeedUUIDModel)
+        self.assertEqual(
+            [relation.name for relation in descriptor.relation_fields],
+            ['uuid_field', 'integer_field']
+        )
+
+        properties = get_model_properties(DjangoDataSeedForeignKeyModel)
+        self.assertEqual(
+            properties['fields']['uuid_field']['related_model'],
+            'DjangoDataSeedUUIDModel'
+        )
+        self.assertEqual(properties['fields']['uuid_field']['type'], 'ForeignKey')
+
+        clear_model_descriptors(DjangoDataSeedForeignKeyModel)
+        self.assertIsNot(
+            descriptor, get_model_descriptor(DjangoDataSeedForeignKeyModel))
+        self.stdout_success(
+            "Model descriptors are cached, frozen and complete."
+        )
+
+
+class DjangoDataSeedLoadObjectsTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that load_objects creates and updates
+        serialized objects and their many-to-many rows in bulk.
+    """
+
+    def test_load_objects(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed load_objects test cases")
+        existing = DjangoDataSeedIntegerModel.objects.create(integer_field=1)
+        uuids = [DjangoDataSeedUUIDModel.objects.create() for _ in range(2)]
+
+        def objects():
+            yield {
+                'model': 'django_data_seed.djangodataseedintegermodel',
+                'pk': existing.pk,
+                'fields': {'integer_field': 10},
+            }
+            for pk in range(1000, 1005):
+                yield {
+                    'model': 'django_data_seed.djangodataseedintegermodel',
+                    'pk': pk,
+                    'fields': {'integer_field': pk},
+                }
+            yield {
+                'model': 'django_data_seed.djangodataseedmanytomanymodel',
+                'pk': 7,
+                'fields': {'uuid_field': [uuid.pk for uuid in uuids]},
+            }
+
+        report = load_objects(objects(), chunk_size=4)
+        self.assertEqual(report, {'created': 6, 'updated': 1, 'errors': []})
+        existing.refresh_from_db()
+        self.assertEqual(existing.integer_field, 10)
+        self.assertEqual(
+            DjangoDataSeedIntegerModel.objects.filter(pk__gte=1000).count(), 5)
+        self.assertEqual(
+            DjangoDataSeedManyToManyModel.objects.get(pk=7).uuid_field.count(), 2)
+
+        report = load_objects([{
+            'model': 'django_data_seed.djangodataseedmanytomanymodel',
+            'pk': 7,
+            'fields': {'uuid_field': [uuids[0].pk]},
+        }])
+        self.assertEqual(report, {'created': 0, 'updated': 1, 'errors': []})
+        self.assertEqual(
+            list(DjangoDataSeedManyToManyModel.objects.get(pk=7).uuid_field.all()),
+            [uuids[0]]
+        )
+        self.stdout_success(
+            "Serialized objects were loaded in bulk."
+        )
+
+    def test_load_objects_partial_update(self):
+        kept = DjangoDataSeedCharModel.objects.create(char_field='old', choice_field='option3')
+        other = DjangoDataSeedCharModel.objects.create(char_field='other', choice_field='option2')
+        report = load_objects([
+            {
+                'model': 'django_data_seed.djangodataseedcharmodel',
+                'pk': kept.pk,
+                'fields': {'char_field': 'new'},
+            },
+            {
+                'model': 'django_data_seed.djangodataseedcharmodel',
+                'pk': other.pk,
+                'fields': {'choice_field': 'option1'},
+            },
+        ])
+        self.assertEqual(report, {'created': 0, 'updated': 2, 'errors': []})
+        self.assertEqual(
+            list(DjangoDataSeedCharModel.objects.filter(pk__in=[kept.pk, other.pk]).order_by(
+                'pk').values_list('char_field', 'choice_field')),
+            [('new', 'option3'), ('other', 'option1')]
+        )
+
+
+class DjangoDataSeedProfileTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that `seeddata --profile-file` seeds per model
+        counts, foreign key fan outs and field overrides in bulk.
+    """
+
+    def write_profile(self, profile):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            json.dump(profile, file)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_seed_profile(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed seeding profile test cases")
+        path = self.write_profile({
+            'batch_size': 4,
+            'models': {
+                'django_data_seed.DjangoDataSeedUUIDModel': {'count': 3},
+                'django_data_seed.DjangoDataSeedIntegerModel': {
+                    'count': 2,
+                    'fields': {'integer_field': {'value': 7}},
+                },
+                'django_data_seed.DjangoDataSeedForeignKeyModel': {
+                    'fields': {'uuid_field': {'fan_out': 2}},
+                },
+                'django_data_seed.DjangoDataSeedOneToOneModel': {'count': 3},
+                'django_data_seed.DjangoDataSeedCharModel': {
+                    'count': 5,
+                    'fields': {
+                        'choice_field': {
+                            'choices': ['option1', 'option2'], 'weights': [0, 1]},
+                        'char_field': {'faker': 'pystr', 'args': {'max_chars': 8}},
+                    },
+                },
+            },
+        })
+        out = StringIO()
+        # ? 3 unique uuid checks, then one savepoint, insert and release per batch
+        with self.assertNumQueries(24):
+            call_command('seeddata', '--profile-file', path, stdout=out)
+        self.assertIn('Successfully populated 19 rows', out.getvalue())
+
+        self.assertEqual(DjangoDataSeedUUIDModel.objects.count(), 3)
+        self.assertEqual(
+            list(DjangoDataSeedIntegerModel.objects.values_list('integer_field', flat=True)),
+            [7, 7])
+        self.assertEqual(DjangoDataSeedForeignKeyModel.objects.count(), 6)
+        for uuid_model in DjangoDataSeedUUIDModel.objects.all():
+            self.assertEqual(
+                uuid_model.DjangoDataSeedForeignKeyModel_char_field.count(), 2)
+            self.assertTrue(DjangoDataSeedOneToOneModel.objects.filter(
+                uuid_field=uuid_model).exists())
+        self.assertEqual(
+            set(DjangoDataSeedCharModel.objects.values_list('choice_field', flat=True)),
+            {'option2'})
+        self.assertTrue(all(
+            len(value) <= 8
+            for value in DjangoDataSeedCharModel.objects.values_list('char_field', flat=True)))
+
+        invalid = self.write_profile({'models': {
+            'django_data_seed.DjangoDataSeedIntegerModel': {
+                'count': 1, 'fields': {'missing_field': {'value': 1}}},
+        }})
+        with self.assertRaisesMessage(CommandError, "has no field 'missing_field'"):
+            call_command('seeddata', '--profile-file', invalid, stdout=StringIO())
+        self.stdout_success(
+            "Seeding profiles were compiled and executed in bulk."
+        )
+
+
+class DjangoDataSeedScaleFactorTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that `seeddata --scale-factor` grows the
+        existing rows with the sampled distributions.
+    """
+
+    def test_scale_factor(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed scale factor test cases")
+        integers = [
+            DjangoDataSeedIntegerModel.objects.create(integer_field=value)
+            for value in (10, 20, 30, 40)
+        ]
+        uuids = [DjangoDataSeedUUIDModel.objects.create() for _ in range(2)]
+        for uuid_model in (uuids[0], uuids[0], uuids[0], uuids[1]):
+            DjangoDataSeedForeignKeyModel.objects.create(
+                uuid_field=uuid_model, integer_field=integers[0])
+        for choice in ('option2', 'option3'):
+            DjangoDataSeedCharModel.objects.create(char_field='x', choice_field=choice)
+
+        out = StringIO()
+        call_command(
+            'seeddata', '--scale-factor', '2', '--django-app', 'django_data_seed', stdout=out)
+        self.assertIn('Successfully populated 12 rows', out.getvalue())
+
+        self.assertEqual(DjangoDataSeedIntegerModel.objects.count(), 8)
+        self.assertTrue(all(
+            10 <= value <= 40
+            for value in DjangoDataSeedIntegerModel.objects.values_list('integer_field', flat=True)))
+        self.assertEqual(DjangoDataSeedUUIDModel.objects.count(), 4)
+        new_children = DjangoDataSeedForeignKeyModel.objects.exclude(uuid_field__in=uuids)
+        self.assertEqual(new_children.count(), 4)
+        self.assertFalse(new_children.filter(integer_field__in=integers).exists())
+        self.assertEqual(
+            set(DjangoDataSeedCharModel.objects.values_list('choice_field', flat=True)),
+            {'option2', 'option3'})
+
+        with self.assertRaisesMessage(CommandError, 'at least 1'):
+            call_command('seeddata', '--scale-factor', '0.5', stdout=StringIO())
+        self.stdout_success(
+            "Existing rows were grown with matching distributions."
+        )
+
+
+class DjangoDataSeedColumnProfileTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that column profiles capture the distribution
+        of existing rows and that seeded values follow it.
+    """
+
+    def test_alias_table(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed alias table test cases")
+        table = AliasTable(['a', 'b', 'c'], [1, 3, 0])
+        draws = [table.draw() for _ in range(20000)]
+        self.assertEqual(draws.count('c'), 0)
+        self.assertAlmostEqual(draws.count('b') / len(draws), 0.75, delta=0.03)
+        self.stdout_success(
+            "Alias tables draw values by weight."
+        )
+
+    def test_column_profile(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed column profile test cases")
+        DjangoDataSeedIntegerModel.objects.bulk_create(
+            [DjangoDataSeedIntegerModel(integer_field=5) for _ in range(30)]
+            + [DjangoDataSeedIntegerModel(integer_field=7) for _ in range(10)]
+            + [DjangoDataSeedIntegerModel(integer_field=value) for value in range(100, 120)]
+        )
+        profile = profile_model(DjangoDataSeedIntegerModel, top_k=2, bins=4)
+        column = profile['columns']['integer_field']
+        self.assertEqual(profile['rows'], 60)
+        self.assertEqual(column['null_fraction'], 0)
+        self.assertEqual(column['distinct'], 22)
+        self.assertEqual(column['top'], [[5, 30], [7, 10]])
+        self.assertEqual(column['rest'], 20)
+        self.assertEqual(column['histogram'], {'min': 5, 'max': 119, 'counts': [0, 0, 0, 20]})
+
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        out = StringIO()
+        call_command(
+            'profile_columns', '--output', path, '--django-model', 'DjangoDataSeedIntegerModel',
+            '--top-k', '2', '--bins', '4', stdout=out)
+        self.assertIn('Profiled 1 columns of 1 models', out.getvalue())
+
+        call_command(
+            'seeddata', '--django-model', 'DjangoDataSeedIntegerModel',
+            '--no-of-objects-to-create', '300', '--column-profile', path, stdout=StringIO())
+        values = list(DjangoDataSeedIntegerModel.objects.filter(
+            pk__gt=DjangoDataSeedIntegerModel.objects.order_by('pk')[59].pk
+        ).values_list('integer_field', flat=True))
+        self.assertEqual(len(values), 300)
+        self.assertTrue(all(value in (5, 7) or 90 <= value <= 119 for value in values))
+        self.assertAlmostEqual(values.count(5) / 300, 0.5, delta=0.15)
+        self.stdout_success(
+            "Seeded values follow the profiled column distribution."
+        )
+
+
+class DjangoDataSeedForeignKeyStrategyTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying the uniform, round robin, zipf and fixed
+        foreign key strategies.
+    """
+
+    def test_parent_sampler(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed foreign key strategy test cases")
+        pool = list(range(100))
+        self.assertEqual(parent_sampler(pool, 'round_robin')(98, 102), [98, 99, 0, 1])
+        self.assertEqual(parent_sampler(pool, 'fixed', fan_out=3)(0, 6), [0, 0, 0, 1, 1, 1])
+        uniform = parent_sampler(pool, 'uniform')(0, 1000)
+        self.assertEqual(len(uniform), 1000)
+        self.assertTrue(set(uniform) <= set(pool))
+        zipf = parent_sampler(pool, 'zipf', exponent=2)(0, 20000)
+        self.assertAlmostEqual(zipf.count(0) / len(zipf), 0.61, delta=0.03)
+        self.assertGreater(zipf.count(1), zipf.count(10))
+        self.assertEqual(parent_sampler([], 'zipf')(0, 2), [None, None])
+        self.stdout_success(
+            "Parents were drawn with every strategy."
+        )
+
+    def test_foreign_key_strategies(self):
+        uuids = [DjangoDataSeedUUIDModel.objects.create() for _ in range(10)]
+        integers = [DjangoDataSeedIntegerModel.objects.create(integer_field=1) for _ in range(2)]
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as file:
+            json.dump({'models': {'django_data_seed.DjangoDataSeedForeignKeyModel': {
+                'count': 300,
+                'fields': {
+                    'uuid_field': {'strategy': 'zipf', 'exponent': 3},
+                    'integer_field': {'strategy': 'round_robin'},
+                },
+            }}}, file)
+        self.addCleanup(os.remove, path)
+        call_command('seeddata', '--profile-file', path, stdout=StringIO())
+        hot = DjangoDataSeedForeignKeyModel.objects.filter(uuid_field=uuids[0]).count()
+        self.assertGreater(hot / 300, 0.7)
+        for integer in integers:
+            self.assertEqual(DjangoDataSeedForeignKeyModel.objects.filter(
+                integer_field=integer).count(), 150)
+
+        call_command(
+            'seeddata', '--django-model', 'DjangoDataSeedForeignKeyModel',
+            '--no-of-objects-to-create', '4', '--fk-strategy', 'fixed', '--fk-fan-out', '2',
+            stdout=StringIO())
+        self.assertEqual(DjangoDataSeedUUIDModel.objects.count(), 10)
+        self.assertEqual(DjangoDataSeedIntegerModel.objects.count(), 2)
+        newest = DjangoDataSeedForeignKeyModel.objects.order_by('-pk')[:4]
+        self.assertEqual(
+            sorted(child.uuid_field_id for child in newest),
+            [uuids[0].pk, uuids[0].pk, uuids[1].pk, uuids[1].pk])
+
+        with self.assertRaisesMessage(CommandError, 'requires --fk-fan-out'):
+            call_command('seeddata', '--fk-strategy', 'fixed', stdout=StringIO())
+        self.stdout_success(
+            "Foreign keys were assigned with skewed and fixed strategies."
+        )
+
+
+class DjangoDataSeedConstraintTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that generated values are adjusted to the field
+        limits and that unsatisfiable seeding profiles fail before any insert.
+    """
+
+    def test_value_adjuster(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed constraint test cases")
+        adjust = value_adjuster(DjangoDataSeedCharModel._meta.get_field('char_field'))
+        self.assertEqual(adjust('x' * 150), 'x' * 100)
+        adjust = value_adjuster(DjangoDataSeedDecimalModel._meta.get_field('decimal_field'))
+        self.assertEqual(adjust(1.005), Decimal('1.00'))
+        self.assertEqual(adjust(10 ** 12), Decimal('99999999.99'))
+        adjust = value_adjuster(DjangoDataSeedPositiveSmallIntegerModel._meta.get_field(
+            'positive_small_integer_field'))
+        self.assertEqual(adjust(-5), 0)
+        self.assertIsNone(value_adjuster(DjangoDataSeedUUIDModel._meta.get_field('uuid_field')))
+        self.stdout_success(
+            "Generated values were adjusted to the field limits."
+        )
+
+    def test_unsatisfiable_profiles(self):
+        uuid_model = 'django_data_seed.DjangoDataSeedUUIDModel'
+        cases = [
+            ({uuid_model: {'count': 2, 'fields': {'uuid_field': {'value': str(uuid.uuid4())}}}},
+             'must be unique'),
+            ({'django_data_seed.DjangoDataSeedCharModel': {
+                'count': 1, 'fields': {'char_field': {'choices': ['ok', 'x' * 101]}}}},
+             'is invalid'),
+            ({'django_data_seed.DjangoDataSeedForeignKeyModel': {'count': 1}},
+             'rows to point to'),
+            ({uuid_model: {'count': 3}, 'django_data_seed.DjangoDataSeedOneToOneModel': {
+                'count': 5}}, 'needs 5'),
+        ]
+        for models_spec, message in cases:
+            with self.assertRaisesMessage(SeedConstraintError, message):
+                compile_profile({'models': models_spec})
+        self.assertFalse(DjangoDataSeedUUIDModel.objects.exists())
+        self.stdout_success(
+            "Unsatisfiable profiles failed before any insert."
+        )
+
+
+class DjangoDataSeedCompositeUniqueTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that composite unique constraints are enforced
+        in memory, existing rows included.
+    """
+
+    def test_composite_unique(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed composite unique test cases")
+        parents = [DjangoDataSeedIntegerModel.objects.create(integer_field=i) for i in range(2)]
+        for position in range(1, 6):
+            DjangoDataSeedUniqueTogetherModel.objects.create(
+                integer_field=parents[0], position=position)
+
+        unique = UniqueTuples(DjangoDataSeedUniqueTogetherModel, using='default')
+        self.assertEqual(unique.columns, [('integer_field_id', 'position')])
+        self.assertIn((parents[0].pk, 1), unique.seen[0])
+        row = unique.claim(
+            {'integer_field_id': parents[0].pk, 'position': 1}, {'position': lambda: 6})
+        self.assertEqual(row['position'], 6)
+        with self.assertRaisesMessage(SeedConstraintError, 'could not generate a free'):
+            unique.claim({'integer_field_id': parents[0].pk, 'position': 6}, {})
+
+        execute_plan(compile_profile({'models': {
+            'django_data_seed.DjangoDataSeedUniqueTogetherModel': {
+                'count': 12, 'fields': {'position': {'range': [1, 10]}}},
+        }}))
+        call_command(
+            'seeddata', '--django-model', 'DjangoDataSeedUniqueTogetherModel',
+            '--no-of-objects-to-create', '3', stdout=StringIO())
+        rows = list(DjangoDataSeedUniqueTogetherModel.objects.values_list(
+            'integer_field_id', 'position'))
+        self.assertEqual(len(rows), 20)
+        self.assertEqual(len(set(rows)), 20)
+        self.stdout_success(
+            "Composite unique tuples were never generated twice."
+        )
+
+
+class DjangoDataSeedDeferredRelationTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that self referential keys are shaped as trees
+        and cyclic keys are filled by an update pass.
+    """
+
+    def test_cyclic_keys_of_seeded_app(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        with override_settings(MEDIA_ROOT=media_root.name):
+            call_command(
+                'seeddata', '--django-app', 'django_data_seed',
+                '--no-of-objects-to-create', '3', stdout=StringIO())
+        self.assertGreaterEqual(DjangoDataSeedCycleAModel.objects.count(), 3)
+        self.assertFalse(DjangoDataSeedCycleAModel.objects.filter(cycle_b__isnull=True).exists())
+        self.assertFalse(DjangoDataSeedTreeModel.objects.filter(parent__isnull=True).count() > 1)
+
+    def get_depth(self, node, parents):
+        depth = 1
+        while parents[node] is not None:
+            node, depth = parents[node], depth + 1
+        return depth
+
+    def test_tree_sampler(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed deferred relation test cases")
+        self.assertEqual(
+            tree_sampler(list(range(10)))(0, 10), [None, 0, 0, 0, 1, 1, 1, 2, 2, 2])
+        self.assertEqual(tree_sampler(list(range(6)), depth=2, branching=2)(0, 6),
+                         [None, None, 0, 0, 1, 1])
+        self.assertEqual(tree_sampler(list(range(4)), branching=1)(0, 4), [None, 0, 1, 2])
+        self.stdout_success(
+            "Trees were shaped breadth first."
+        )
+
+    def test_deferred_relations(self):
+        execute_plan(compile_profile({'models': {
+            'django_data_seed.DjangoDataSeedTreeModel': {
+                'count': 40, 'fields': {'parent': {'depth': 3, 'branching': 3}}},
+            'django_data_seed.DjangoDataSeedCycleAModel': {'count': 5},
+            'django_data_seed.DjangoDataSeedCycleBModel': {'count': 5},
+        }}))
+        parents = dict(DjangoDataSeedTreeModel.objects.values_list('pk', 'parent_id'))
+        self.assertEqual(sum(parent is None for parent in parents.values()), 4)
+        self.assertEqual(max(self.get_depth(node, parents) for node in parents), 3)
+        self.assertFalse(DjangoDataSeedCycleAModel.objects.filter(cycle_b=None).exists())
+        self.assertEqual(DjangoDataSeedCycleBModel.objects.count(), 5)
+
+        call_command(
+            'seeddata', '--django-model', 'DjangoDataSeedTreeModel',
+            '--no-of-objects-to-create', '7', stdout=StringIO())
+        new_parents = dict(DjangoDataSeedTreeModel.objects.exclude(
+            pk__in=parents).values_list('pk', 'parent_id'))
+        self.assertEqual(sum(parent is None for parent in new_parents.values()), 1)
+        self.assertEqual(max(self.get_depth(node, new_parents) for node in new_parents), 3)
+        call_command(
+            'seeddata', '--django-model', 'DjangoDataSeedCycleBModel',
+            '--no-of-objects-to-create', '2', stdout=StringIO())
+        self.assertEqual(DjangoDataSeedCycleBModel.objects.count(), 7)
+
+        with self.assertRaisesMessage(SeedProfileError, 'depth and branching shape'):
+            compile_profile({'models': {'django_data_seed.DjangoDataSeedCycleBModel': {
+                'count': 1, 'fields': {'cycle_a': {'depth': 2}}}}})
+        self.stdout_success(
+            "Trees and cycles were linked by an update pass."
+        )
+
+
+class DjangoDataSeedUniqueTextTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that unique text values are composed from a
+        prefix and a base 36 sequence sized to fit max_length.
+    """
+
+    def test_unique_text_sequence(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed unique text test cases")
+        sequence = UniqueTextSequence(
+            db_models.CharField(max_length=8), prefix=lambda length: 'x' * length)
+        self.assertEqual((sequence.width, sequence.prefix_length), (6, 1))
+        self.assertEqual([sequence(), sequence()], ['x-000000', 'x-000001'])
+
+        tiny = UniqueTextSequence(db_models.SlugField(max_length=3))
+        values = [tiny() for _ in range(36 ** 2)]
+        self.assertEqual(len(set(values)), 36 ** 2)
+        self.assertTrue(all(len(value) <= 3 for value in values))
+        with self.assertRaisesMessage(ValueError, 'ran out'):
+            tiny()
+
+        email = UniqueTextSequence(db_models.EmailField(max_length=20))
+        for _ in range(50):
+            value = email()
+            validate_email(value)
+            self.assertLessEqual(len(value), 20)
+        self.stdout_success(
+            "Unique text values were composed without collisions."
+        )
+
+    def test_unique_text_after_existing_rows(self):
+        field = DjangoDataSeedCharModel._meta.get_field('char_field')
+        DjangoDataSeedCharModel.objects.create(char_field='ann-00000a', choice_field='option1')
+        DjangoDataSeedCharModel.objects.create(char_field='Some Name', choice_field='option1')
+        self.assertEqual(get_text_sequence(DjangoDataSeedCharModel, field).next_value, 11)
+
+        seeder = SeedData()
+        with self.assertNumQueries(1):
+            values = [seeder.get_unique_char_data(DjangoDataSeedCharModel, field) for _ in range(100)]
+        self.assertEqual(len(set(values)), 100)
+        self.assertTrue(values[0].endswith('-00000b'))
+
+
+class RoomCodeField(db_models.CharField):
+    pass
+
+
+class DjangoDataSeedGeneratorRegistryTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that generators resolve through the field
+        class MRO, once per class, and that batch generators are buffered.
+    """
+
+    def test_generator_registry(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed generator registry test cases")
+        calls = []
+
+        @registry.register(RoomCodeField, batch=True)
+        def generate_room_codes(seeder, field, model, count):
+            calls.append(count)
+            return [f'R{index}' for index in range(count)]
+        self.addCleanup(registry.unregister, RoomCodeField)
+
+        entries = registry.resolve(RoomCodeField)
+        self.assertIs(registry.resolve(RoomCodeField), entries)
+        self.assertEqual(entries[0].function, generate_room_codes)
+        self.assertEqual(entries[1:], registry.resolve(db_models.CharField))
+
+        field = RoomCodeField(max_length=10)
+        field.set_attributes_from_name('room')
+        seeder = SeedData()
+        values = [seeder.generate_field_value(field, DjangoDataSeedCharModel) for _ in range(1500)]
+        self.assertEqual(values[:2], ['R0', 'R1'])
+        self.assertEqual(calls, [1000, 1000])
+
+        registry.register(RoomCodeField, lambda seeder, field, model: 1 / 0)
+        value = seeder.generate_field_value(field, DjangoDataSeedCharModel)
+        self.assertIsInstance(value, str)
+        self.assertLessEqual(len(value), 10)
+        self.stdout_success(
+            "Generators were resolved through the MRO and buffered."
+        )
+
+    def test_generator_fallback_without_warnings(self):
+        for model in (DjangoDataSeedSmallIntegerModel, DjangoDataSeedBigIntegerModel):
+            with self.assertLogs('django_data_seed', level='INFO') as logs:
+                call_command(
+                    'seeddata', '--django-model', model.__name__,
+                    '--no-of-objects-to-create', '3', stdout=StringIO())
+            self.assertEqual(model.objects.count(), 3)
+            self.assertEqual(
+                [record.getMessage() for record in logs.records if record.levelno >= logging.WARNING], [])
+
+
+class DjangoDataSeedPlaceholderFileTestCase(TestCase, StdoutTextTheme):
+    """
+        Test case for verifying that file fields reference a small pool of
+        content addressed placeholder files.
+    """
+
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.media_root = media_root.name
+        media = override_settings(MEDIA_ROOT=self.media_root, DJANGO_DATA_SEED_PLACEHOLDER_FILES=4)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def get_media_files(self):
+        return [
+            os.path.join(directory, name)
+            for directory, _, names in os.walk(self.media_root) for name in names
+        ]
+
+    def test_placeholder_files(self):
+        self.stdout_headers(
+            "\n\nStarting Django Data Seed placeholder file test cases")
+        call_command(
+            'seeddata', '--django-model', 'DjangoDataSeedFileModel',
+            '--no-of-objects-to-create', '30', stdout=StringIO())
+        rows = DjangoDataSeedFileModel.objects.all()
+        self.assertEqual(rows.count(), 30)
+        files = self.get_media_files()
+        self.assertLessEqual(len(files), 8)
+        self.assertLessEqual(len({row.document.name for row in rows}), 4)
+        for row in rows:
+            self.assertTrue(row.document.storage.exists(row.document.name))
+            self.assertTrue(row.document.name.endswith('.txt'))
+            self.assertTrue(row.picture.name.endswith('.png'))
+            with row.picture.open('rb') as picture:
+                self.assertEqual(picture.read(8), b'\x89PNG\r\n\x1a\n')
+
+        field = DjangoDataSeedFileModel._meta.get_field('document')
+        names = create_placeholder_files(field, count=2)
+        for name in names:
+            self.assertRegex(name, r'^django_data_seed/documents/seed-[0-9a-f]{16}\.txt$')
+        written = len(self.get_media_files())
+        self.assertEqual(write_placeholder(field, names[0], b'placeholder'), names[0])
+        self.assertEqual(len(self.get_media_files()), written)
+        self.stdout_success(
+            "File fields shared a few content addressed placeholder files."
+        )
@@ -4,6 +4,7 @@ from typing import Any, Dict, List
 from django.apps import apps
 from django.db import transaction
 from django.core.exceptions import ObjectDoesNotExist
+from django_data_seed.utils.model_introspection import get_field_descriptor
 
 
 def process_entries_core(
@@ -65,14 +66,14 @@ def handle_related_fields(model, fields: Dict[str, Any]) -> Dict[str, Any]:
     """
     updated_fields = fields.copy()
     for field_name, value in fields.items():
-        field = model._meta.get_field(field_name)
-        if field.is_relation:
-            if field.many_to_one or field.one_to_one:
+        descriptor = get_field_descriptor(model, field_name)
+        if descriptor.is_relation:
+            if descriptor.many_to_one or descriptor.one_to_one:
                 updated_fields[field_name] = process_related_field(
-                    field, value)
-            elif field.many_to_many:
+                    descriptor.field, value)
+            elif descriptor.many_to_many:
                 updated_fields[field_name] = process_many_to_many_field(
-                    field, value)
+                    descriptor.field, value)
     return updated_fields
 
 
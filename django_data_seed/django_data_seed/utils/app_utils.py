@@ -1,6 +1,9 @@
 import os
 from django.apps import apps
 from django.conf import settings
+from django_data_seed.utils.colorama_theme import StdoutTextTheme
+
+theme = StdoutTextTheme()
 
 
 def get_all_custom_apps_and_sub_apps(specific_app_name=None):
@@ -55,7 +58,7 @@ def get_filtered_models(installed_apps=None, model_name=None, specific_app_name=
     ]
 
     if not models:
-        print(
+        theme.stdout_warning(
             f"No models found for {'app ' + specific_app_name if specific_app_name else ''} {'model ' + model_name if model_name else ''}.")
 
     return models
@@ -0,0 +1,102 @@
+from contextvars import ContextVar, Token
+from typing import Any, Optional, Tuple
+
+# ? the user responsible for the mutations of the current request or task
+_current_user = ContextVar(
+    'django_data_seed_current_user', default=None)
+# ? audit bookkeeping shared between the pre_save and post_save receivers
+_variables = ContextVar(
+    'django_data_seed_variables', default=None)
+
+
+def get_context_user() -> Any:
+    """
+    Returns the user stored in the current context, or None.
+    """
+    return _current_user.get()
+
+
+def set_context_user(user: Any) -> Token:
+    """
+    Stores the user in the current context.
+
+    Args:
+        user (Any): The user object.
+
+    Returns:
+        Token: A token that restores the previous user when passed to `_current_user.reset`.
+    """
+    return _current_user.set(user)
+
+
+def get_context_variable(name: str, default: Optional[Any] = None) -> Any:
+    """
+    Retrieves a variable of the current context.
+
+    Args:
+        name (str): The name of the variable.
+        default (Optional[Any]): The value returned when the variable is not set.
+
+    Returns:
+        Any: The value of the variable, or the default value if not found.
+    """
+    variables = _variables.get()
+    if variables is None:
+        return default
+    return variables.get(name, default)
+
+
+def set_context_variable(name: str, value: Any) -> None:
+    """
+    Sets a variable of the current context.
+
+    Args:
+        name (str): The name of the variable.
+        value (Any): The value to assign.
+
+    Description:
+        The variables are copied on write, so a value set in a task or request never
+        becomes visible to a concurrently running one.
+    """
+    variables = dict(_variables.get() or {})
+    variables[name] = value
+    _variables.set(variables)
+
+
+def clear_context_variable(name: str) -> None:
+    """
+    Removes a variable from the current context.
+
+    Args:
+        name (str): The name of the variable to clear.
+    """
+    variables = _variables.get()
+    if variables and name in variables:
+        variables = dict(variables)
+        del variables[name]
+        _variables.set(variables)
+
+
+def bind_audit_context(user: Any) -> Tuple[Token, Token]:
+    """
+    Starts a fresh audit context for a request or task.
+
+    Args:
+        user (Any): The user responsible for the mutations, or None.
+
+    Returns:
+        Tuple[Token, Token]: The tokens to pass to `reset_audit_context` once the work is done.
+    """
+    return _current_user.set(user), _variables.set({})
+
+
+def reset_audit_context(tokens: Tuple[Token, Token]) -> None:
+    """
+    Restores the audit context that was active before `bind_audit_context`.
+
+    Args:
+        tokens (Tuple[Token, Token]): The tokens returned by `bind_audit_context`.
+    """
+    user_token, variables_token = tokens
+    _variables.reset(variables_token)
+    _current_user.reset(user_token)
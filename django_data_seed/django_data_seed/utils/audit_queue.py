@@ -0,0 +1,386 @@
+import json
+import sqlite3
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from django.apps import apps
+from django.conf import settings
+from django.db import connections, models, router, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django_data_seed.utils.colorama_theme import StdoutTextTheme
+from django_data_seed.utils.restore_utils import chunked
+
+# ? the audit models events may be delivered to
+QUEUE_MODELS = frozenset({
+    'django_data_seed.djangoseeddatabackupmodel',
+    'django_data_seed.djangoseeddatalogentrymodel',
+})
+
+theme = StdoutTextTheme()
+
+SPOOL_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS events ('
+    'id INTEGER PRIMARY KEY AUTOINCREMENT, '
+    'payload TEXT NOT NULL, '
+    'enqueued_at REAL NOT NULL, '
+    'attempts INTEGER NOT NULL DEFAULT 0)',
+    'CREATE TABLE IF NOT EXISTS dead_events ('
+    'id INTEGER PRIMARY KEY, '
+    'payload TEXT NOT NULL, '
+    'enqueued_at REAL NOT NULL, '
+    'attempts INTEGER NOT NULL, '
+    'error TEXT, '
+    'failed_at REAL NOT NULL)',
+)
+
+
+class AuditSpool:
+    """
+        A durable local queue of audit events backed by a SQLite file.
+
+        Producers and the worker may live in different processes. The file runs in WAL mode
+        and, with the default `synchronous=NORMAL`, commits are only fsynced at checkpoints,
+        so fsyncs are batched across many enqueued events while a crashed process still loses
+        nothing it has committed.
+    """
+
+    def __init__(self, path: str, synchronous: str = 'NORMAL', timeout: float = 30.0):
+        self.path = path
+        self.synchronous = synchronous
+        self.timeout = timeout
+        self._local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(f'PRAGMA synchronous={self.synchronous}')
+            for statement in SPOOL_SCHEMA:
+                connection.execute(statement)
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def put(self, event: Dict[str, Any]) -> None:
+        self.put_many([event])
+
+    def put_many(self, events: Iterable[Dict[str, Any]]) -> None:
+        """
+        Appends events to the queue in one transaction.
+        """
+        now = time.time()
+        rows = [(json.dumps(event, default=str), now) for event in events]
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.executemany(
+                'INSERT INTO events (payload, enqueued_at) VALUES (?, ?)', rows)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def peek(self, limit: int) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Returns the oldest events without removing them.
+
+        Args:
+            limit (int): The maximum number of events to return.
+
+        Returns:
+            List[Tuple[int, Dict[str, Any]]]: `(event id, event)` pairs in enqueue order.
+        """
+        rows = self.connection.execute(
+            'SELECT id, payload FROM events ORDER BY id LIMIT ?', (limit,)
+        ).fetchall()
+        return [(event_id, json.loads(payload)) for event_id, payload in rows]
+
+    def ack(self, event_ids: Iterable[int]) -> None:
+        """
+        Removes delivered events from the queue.
+        """
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            for chunk in chunked(event_ids, 500):
+                connection.execute(
+                    f'DELETE FROM events WHERE id IN ({",".join("?" * len(chunk))})', chunk)
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def fail(self, event_id: int, error: str, max_attempts: int) -> bool:
+        """
+        Records a failed delivery, moving the event to `dead_events` once it ran out of attempts.
+
+        Returns:
+            bool: True if the event was moved to the dead letter table.
+        """
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'UPDATE events SET attempts = attempts + 1 WHERE id = ?', (event_id,))
+            dead = connection.execute(
+                'INSERT INTO dead_events (id, payload, enqueued_at, attempts, error, failed_at) '
+                'SELECT id, payload, enqueued_at, attempts, ?, ? FROM events '
+                'WHERE id = ? AND attempts >= ?',
+                (error, time.time(), event_id, max_attempts)
+            ).rowcount > 0
+            if dead:
+                connection.execute('DELETE FROM events WHERE id = ?', (event_id,))
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+        return dead
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the queue depth metrics.
+
+        Returns:
+            Dict[str, Any]: `depth` (pending events), `dead` (events that ran out of attempts),
+            `oldest_age_seconds` (age of the oldest pending event, or None) and `retrying`
+            (pending events that failed at least once).
+        """
+        depth, oldest, retrying = self.connection.execute(
+            'SELECT COUNT(*), MIN(enqueued_at), '
+            'COALESCE(SUM(CASE WHEN attempts > 0 THEN 1 ELSE 0 END), 0) FROM events'
+        ).fetchone()
+        dead, = self.connection.execute('SELECT COUNT(*) FROM dead_events').fetchone()
+        return {
+            'depth': depth,
+            'dead': dead,
+            'retrying': retrying,
+            'oldest_age_seconds': None if oldest is None else max(time.time() - oldest, 0.0),
+        }
+
+
+_spools: Dict[str, AuditSpool] = {}
+_spools_lock = threading.Lock()
+
+
+def get_audit_spool(path: Optional[str] = None) -> AuditSpool:
+    """
+    Returns the spool at `path`, defaulting to `DJANGO_DATA_SEED_AUDIT_QUEUE_PATH`.
+    """
+    path = path or getattr(settings, 'DJANGO_DATA_SEED_AUDIT_QUEUE_PATH', None)
+    if not path:
+        raise ValueError('DJANGO_DATA_SEED_AUDIT_QUEUE_PATH is not set')
+    with _spools_lock:
+        spool = _spools.get(path)
+        if spool is None:
+            spool = _spools[path] = AuditSpool(
+                path,
+                synchronous=getattr(
+                    settings, 'DJANGO_DATA_SEED_AUDIT_QUEUE_SYNCHRONOUS', 'NORMAL')
+            )
+        return spool
+
+
+def enqueue_audit_event(model: Type[models.Model], fields: Dict[str, Any], using: str) -> None:
+    """
+    Queues an audit row to be written by `run_audit_worker` once the transaction commits.
+
+    Args:
+        model (Type[models.Model]): The audit model the row belongs to.
+        fields (Dict[str, Any]): The field values of the row, using `*_id` names for foreign keys.
+        using (str): The database alias of the audited write.
+
+    Description:
+        The event is only enqueued if the surrounding transaction commits, so rolled back writes
+        never show up in the audit tables. The event keeps the moment of the write as its
+        `created_at`, however long it waits in the queue.
+    """
+    enqueue_audit_events(model, [fields], using=using)
+
+
+def enqueue_audit_events(
+        model: Type[models.Model],
+        fields_list: Iterable[Dict[str, Any]],
+        using: str
+) -> None:
+    """
+    Queues many audit rows of one model in a single spool transaction, see `enqueue_audit_event`.
+    """
+    created_at = timezone.now().isoformat()
+    events = [
+        {
+            'model': model._meta.label_lower,
+            'created_at': created_at,
+            'fields': fields,
+        }
+        for fields in fields_list
+    ]
+    if events:
+        transaction.on_commit(partial(spool_audit_events, events), using=using)
+
+
+def spool_audit_events(events: List[Dict[str, Any]]) -> None:
+    """
+    Writes the events of a committed transaction to the spool.
+
+    Description:
+        The audited write is already committed, so a failing spool (locked file, full disk) must
+        not raise to its caller. The events are then written to the audit tables directly, and
+        are only dropped, with an error logged, when that fails too.
+    """
+    try:
+        get_audit_spool().put_many(events)
+        return
+    except Exception as e:
+        theme.stdout_error(
+            f'ERROR : Could not queue {len(events)} audit events, writing them directly. Error : {str(e)}')
+    try:
+        rows = [build_audit_row(event) for event in events]
+        with transaction.atomic(using=router.db_for_write(type(rows[0]))):
+            write_audit_rows(rows)
+    except Exception as e:
+        theme.stdout_error(
+            f'ERROR : Lost {len(events)} audit events {json.dumps(events, default=str)}. Error : {str(e)}')
+
+
+def build_audit_row(event: Dict[str, Any]) -> models.Model:
+    """
+    Builds the unsaved audit model instance of an event.
+    """
+    if event['model'] not in QUEUE_MODELS:
+        raise ValueError(f"Unknown audit model {event['model']!r}")
+    model = apps.get_model(event['model'])
+    created_at = parse_datetime(event['created_at'])
+    if created_at is not None and not settings.USE_TZ and timezone.is_aware(created_at):
+        created_at = timezone.make_naive(created_at)
+    field_names = {field.attname for field in model._meta.concrete_fields}
+    fields = {
+        name: value for name, value in event['fields'].items() if name in field_names
+    }
+    return model(created_at=created_at, updated_at=created_at, **fields)
+
+
+def write_audit_rows(rows: List[models.Model]) -> None:
+    """
+    Inserts audit rows in bulk, keeping their `created_at`.
+
+    `bulk_create` stamps `auto_now_add` and `auto_now` fields with the moment of delivery, so
+    the moment of the audited write is written back with a `bulk_update`. Backends that do not
+    return the primary keys of bulk inserts save the rows one by one, raw.
+    """
+    by_model: Dict[Type[models.Model], List[models.Model]] = {}
+    for row in rows:
+        by_model.setdefault(type(row), []).append(row)
+    for model, objs in by_model.items():
+        using = router.db_for_write(model)
+        manager = model._base_manager.db_manager(using)
+        for chunk in chunked(objs, 500):
+            if not connections[using].features.can_return_rows_from_bulk_insert:
+                for obj in chunk:
+                    obj.save_base(raw=True, using=using)
+                continue
+            timestamps = [(obj.created_at, obj.updated_at) for obj in chunk]
+            manager.bulk_create(chunk)
+            for obj, (created_at, updated_at) in zip(chunk, timestamps):
+                obj.created_at, obj.updated_at = created_at, updated_at
+            manager.bulk_update(chunk, ['created_at', 'updated_at'])
+
+
+def deliver_audit_events(
+        spool: AuditSpool,
+        batch_size: int = 1000,
+        max_attempts: int = 5
+) -> Dict[str, int]:
+    """
+    Moves one batch of events from the spool into the audit tables.
+
+    Args:
+        spool (AuditSpool): The spool to drain.
+        batch_size (int): The maximum number of events to deliver.
+        max_attempts (int): The number of failed deliveries after which an event is dead lettered.
+
+    Returns:
+        Dict[str, int]: The number of `delivered`, `failed` and `dead` events.
+
+    Description:
+        Events are only removed from the spool after the rows are committed, so a crash between
+        the two delivers them again: delivery is at least once. When the batch can not be written
+        as a whole, its events are retried one by one so a single bad event does not hold up the
+        queue.
+    """
+    from django_data_seed.utils.log_entry_utils import clear_reconstruction_cache
+
+    report = {'delivered': 0, 'failed': 0, 'dead': 0}
+    events = spool.peek(batch_size)
+    if not events:
+        return report
+    try:
+        rows = [build_audit_row(event) for _, event in events]
+        with transaction.atomic(using=router.db_for_write(type(rows[0]))):
+            write_audit_rows(rows)
+    except Exception:
+        delivered = []
+        for event_id, event in events:
+            try:
+                row = build_audit_row(event)
+                with transaction.atomic(using=router.db_for_write(type(row))):
+                    write_audit_rows([row])
+            except Exception as error:
+                report['failed'] += 1
+                if spool.fail(event_id, repr(error), max_attempts):
+                    report['dead'] += 1
+            else:
+                delivered.append(event_id)
+        spool.ack(delivered)
+        report['delivered'] = len(delivered)
+    else:
+        spool.ack([event_id for event_id, _ in events])
+        report['delivered'] = len(events)
+    if report['delivered']:
+        # ? rows were written with past timestamps, cached reconstructions may be stale
+        clear_reconstruction_cache()
+    return report
+
+
+def run_audit_worker(
+        spool: AuditSpool,
+        batch_size: int = 1000,
+        max_attempts: int = 5,
+        poll_interval: float = 1.0,
+        once: bool = False,
+        progress: Any = None
+) -> int:
+    """
+    Drains the spool, waiting for new events unless `once` is set.
+
+    Args:
+        spool (AuditSpool): The spool to drain.
+        batch_size (int): The number of events delivered per transaction.
+        max_attempts (int): The number of failed deliveries after which an event is dead lettered.
+        poll_interval (float): Seconds to wait when the queue is empty.
+        once (bool): Return as soon as the queue is empty instead of polling.
+        progress (Any): Optional callable receiving the report of every batch.
+
+    Returns:
+        int: The number of delivered events.
+    """
+    delivered = 0
+    while True:
+        report = deliver_audit_events(
+            spool, batch_size=batch_size, max_attempts=max_attempts)
+        delivered += report['delivered']
+        if progress is not None and any(report.values()):
+            progress(report)
+        if report['delivered'] + report['failed'] < batch_size:
+            if once:
+                return delivered
+            time.sleep(poll_interval)
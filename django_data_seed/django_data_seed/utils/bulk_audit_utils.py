@@ -0,0 +1,171 @@
+from typing import Any, Dict, Iterable, List, Optional, Type
+from django.db import models
+from django_data_seed.utils.audit_queue import enqueue_audit_events
+from django_data_seed.utils.config import get_audit_config
+from django_data_seed.utils.get_user import get_current_user_id
+from django_data_seed.utils.restore_utils import chunked
+from django_data_seed.utils.signal_utils import (
+    get_snapshot_fingerprint,
+    serialize_instances
+)
+
+# ? number of objects whose state is read with one query
+DEFAULT_AUDIT_CHUNK_SIZE = 1000
+
+
+def is_bulk_audited(model: Type[models.Model]) -> bool:
+    """
+    Tells whether bulk writes of a model should produce log entries.
+    """
+    config = get_audit_config()
+    return config.log_entry_enabled and config.is_audited(model)
+
+
+def get_snapshots(model: Type[models.Model], pks: Iterable[Any], using: str) -> Dict[str, dict]:
+    """
+    Reads the current state of many objects with one query.
+
+    Args:
+        model (Type[models.Model]): The audited model.
+        pks (Iterable[Any]): The primary keys of the objects.
+        using (str): The database alias.
+
+    Returns:
+        Dict[str, dict]: The serialized states keyed by the stringified primary key.
+    """
+    instances = model._base_manager.using(using).filter(pk__in=list(pks))
+    return {snapshot['pk']: snapshot for snapshot in serialize_instances(model, instances)}
+
+
+def build_log_entries(
+        model: Type[models.Model],
+        before: Dict[str, Optional[dict]],
+        after: Dict[str, dict]
+) -> List[Dict[str, Any]]:
+    """
+    Builds the log entry field values of every object whose state changed.
+
+    Args:
+        model (Type[models.Model]): The audited model.
+        before (Dict[str, Optional[dict]]): The states before the write, None for created objects.
+        after (Dict[str, dict]): The states after the write.
+
+    Returns:
+        List[Dict[str, Any]]: The field values, ready for `DjangoSeedDataLogEntryModel(**fields)`.
+    """
+    user_id = get_current_user_id()
+    entries = []
+    for object_id, after_mutation in after.items():
+        before_mutation = before.get(object_id)
+        if before_mutation is not None:
+            before_fingerprint = get_snapshot_fingerprint(before_mutation)
+            if before_fingerprint is not None and \
+                    before_fingerprint == get_snapshot_fingerprint(after_mutation):
+                continue
+        fields = {
+            'before_mutation': before_mutation,
+            'after_mutation': after_mutation,
+            'object_id': object_id,
+            'model_name': model.__name__,
+        }
+        if user_id is not None:
+            fields['mutated_by_id'] = user_id
+        entries.append(fields)
+    return entries
+
+
+def write_log_entries(entries: List[Dict[str, Any]], using: str, batch_size: int = 500) -> None:
+    """
+    Writes log entries with one bulk insert per batch, or enqueues them in queued mode.
+    """
+    from django_data_seed.models import DjangoSeedDataLogEntryModel
+    if not entries:
+        return
+    if get_audit_config().queued:
+        enqueue_audit_events(DjangoSeedDataLogEntryModel, entries, using=using)
+        return
+    DjangoSeedDataLogEntryModel.objects.bulk_create(
+        [DjangoSeedDataLogEntryModel(**fields) for fields in entries],
+        batch_size=batch_size
+    )
+
+
+def audit_update(
+        queryset: Any,
+        update: Any,
+        chunk_size: int = DEFAULT_AUDIT_CHUNK_SIZE
+) -> int:
+    """
+    Runs `QuerySet.update()` chunk by chunk and logs the changed objects.
+
+    Args:
+        queryset (Any): The queryset to update.
+        update (Any): A callable applying the update to a queryset and returning the row count.
+        chunk_size (int): The number of objects per chunk.
+
+    Returns:
+        int: The number of updated rows.
+
+    Description:
+        Every chunk costs one query for its before state, the update itself and one query for
+        its after state, which also picks up values computed by the database (e.g. `F()`
+        expressions). The caller is expected to run this inside a transaction.
+    """
+    model, using = queryset.model, queryset.db
+    pks = list(queryset.values_list('pk', flat=True))
+    updated = 0
+    for chunk in chunked(pks, chunk_size):
+        before = get_snapshots(model, chunk, using)
+        updated += update(queryset.filter(pk__in=chunk))
+        after = get_snapshots(model, chunk, using)
+        write_log_entries(build_log_entries(model, before, after), using=using)
+    return updated
+
+
+def audit_bulk_update(
+        model: Type[models.Model],
+        objs: List[models.Model],
+        update: Any,
+        using: str,
+        chunk_size: int = DEFAULT_AUDIT_CHUNK_SIZE
+) -> int:
+    """
+    Runs `bulk_update()` chunk by chunk and logs the changed objects.
+
+    Args:
+        model (Type[models.Model]): The audited model.
+        objs (List[models.Model]): The instances holding the new values.
+        update (Any): A callable running `bulk_update()` on a chunk of instances.
+        using (str): The database alias.
+        chunk_size (int): The number of objects per chunk.
+
+    Returns:
+        int: The number of updated rows.
+
+    Description:
+        Like `audit_update`, every chunk costs one query for its before state, the update itself
+        and one query for its after state. The after state is read back rather than taken from
+        the instances, whose values may be expressions (e.g. `F('count') + 1`). The caller is
+        expected to run this inside a transaction.
+    """
+    updated = 0
+    for chunk in chunked(objs, chunk_size):
+        pks = [obj.pk for obj in chunk]
+        before = get_snapshots(model, pks, using)
+        # ? Django 3.2 returns None
+        updated += update(chunk) or 0
+        after = get_snapshots(model, pks, using)
+        write_log_entries(build_log_entries(model, before, after), using=using)
+    return updated
+
+
+def audit_bulk_create(model: Type[models.Model], objs: List[models.Model]) -> List[Dict[str, Any]]:
+    """
+    Builds the log entries of objects created by `bulk_create()`.
+
+    Objects whose primary key was not returned by the database can not be referenced and are
+    skipped.
+    """
+    created = [obj for obj in objs if obj.pk is not None]
+    after = {snapshot['pk']: snapshot for snapshot in serialize_instances(model, created)}
+    return build_log_entries(model, {}, after)
@@ -1,21 +1,46 @@
-from colorama import Fore, Style
+import logging
+from django_data_seed.utils.output import (
+    LOGGER_NAME,
+    SIGNAL_LOGGER_NAME,
+    get_output_logger
+)
 
 
 class StdoutTextTheme:
+    """
+        Styled console messages, routed through the `django_data_seed` logger.
+
+        Set `output_logger_name` to log under a child logger.
+    """
+    output_logger_name = LOGGER_NAME
+
+    def stdout_log(self, level, style, message):
+        logger = get_output_logger(self.output_logger_name)
+        if logger.isEnabledFor(level):
+            logger.log(level, message, extra={'style': style})
+
     def stdout_success(self, message):
-        print(Fore.GREEN + message + Style.RESET_ALL)
+        self.stdout_log(logging.INFO, 'success', message)
 
     def stdout_error(self, message):
-        print(Fore.RED + message + Style.RESET_ALL)
+        self.stdout_log(logging.ERROR, 'error', message)
 
     def stdout_warning(self, message):
-        print(Fore.YELLOW + message + Style.RESET_ALL)
+        self.stdout_log(logging.WARNING, 'warning', message)
 
     def stdout_info(self, message):
-        print(Fore.BLUE + message + Style.RESET_ALL)
+        self.stdout_log(logging.INFO, 'info', message)
 
     def stdout_standard(self, message):
-        print(Fore.WHITE + message + Style.RESET_ALL)
+        self.stdout_log(logging.INFO, 'standard', message)
 
     def stdout_headers(self, message):
-        print(Fore.WHITE + Style.BRIGHT + message + Style.RESET_ALL)
+        self.stdout_log(logging.INFO, 'headers', message)
+
+
+class SignalTextTheme(StdoutTextTheme):
+    """
+        The theme of the signal handlers, silent unless `DJANGO_DATA_SEED_SIGNAL_LOG_LEVEL`
+        is lowered to `INFO`.
+    """
+    output_logger_name = SIGNAL_LOGGER_NAME
@@ -0,0 +1,297 @@
+import datetime
+import json
+import random
+from decimal import Decimal
+from typing import Any, Callable, List, Optional, Sequence, Type
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, models
+from django.db.models import Count, Max, Min, Q
+from django_data_seed.utils.model_introspection import FieldDescriptor, get_model_descriptor
+
+# ? most common values kept per column
+DEFAULT_TOP_K = 20
+# ? equi-width buckets of the histogram of the remaining values
+DEFAULT_BINS = 20
+COLUMN_PROFILE_VERSION = 1
+
+# ? fields whose remaining values are summarized by a histogram
+HISTOGRAM_FIELD_TYPES = (models.IntegerField, models.FloatField, models.DecimalField, models.DateField)
+# ? fields that are never profiled, their values can not be grouped or must stay unique
+UNPROFILED_FIELD_TYPES = (models.AutoField, models.BinaryField, models.JSONField, models.FileField)
+
+NULL = object()
+REST = object()
+
+
+class AliasTable:
+    """
+        Draws values with given weights in O(1), with Vose's alias method.
+
+        Building the table costs O(n); every draw then costs two random numbers, where
+        `random.choices` bisects the cumulative weights on every call.
+    """
+    __slots__ = ('values', 'probabilities', 'aliases', 'size')
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        total = float(sum(weights))
+        if not values or len(values) != len(weights) or total <= 0:
+            raise ValueError('An alias table needs values with positive total weight')
+        size = len(values)
+        scaled = [weight * size / total for weight in weights]
+        small = [index for index, weight in enumerate(scaled) if weight < 1]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1]
+        probabilities, aliases = [1.0] * size, list(range(size))
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probabilities[less], aliases[less] = scaled[less], more
+            scaled[more] += scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        self.values = values if isinstance(values, list) else list(values)
+        self.probabilities = probabilities
+        self.aliases = aliases
+        self.size = size
+
+    def draw(self) -> Any:
+        index = int(random.random() * self.size)
+        if random.random() < self.probabilities[index]:
+            return self.values[index]
+        return self.values[self.aliases[index]]
+
+
+def is_profiled(descriptor: FieldDescriptor) -> bool:
+    """
+    Tells whether the values of a field are profiled: concrete, non relational, non unique
+    fields whose values can be grouped.
+    """
+    return descriptor.concrete and not descriptor.is_relation and not descriptor.primary_key \
+        and not descriptor.unique and not isinstance(descriptor.field, UNPROFILED_FIELD_TYPES)
+
+
+def histogram_edges(field: models.Field, low: Any, high: Any, bins: int) -> List[Any]:
+    """
+    Returns the `bins + 1` edges of the equi-width buckets between `low` and `high`.
+
+    Integer buckets are half open `[edge, next edge)` with integer edges, the other buckets are
+    half open but for the last one, which includes `high`.
+    """
+    if isinstance(field, models.IntegerField):
+        span = high - low + 1
+        return [low + span * index // bins for index in range(bins)] + [high + 1]
+    width = (high - low) / bins
+    return [low + width * index for index in range(bins)] + [high]
+
+
+def profile_histogram(
+        queryset: models.QuerySet,
+        field: models.Field,
+        low: Any,
+        high: Any,
+        bins: int
+) -> dict:
+    """
+    Counts the rows of every bucket with one aggregate query.
+    """
+    edges = histogram_edges(field, low, high, bins)
+    aggregates = {}
+    for index in range(bins):
+        condition = Q(**{f'{field.attname}__gte': edges[index]})
+        if index < bins - 1 or isinstance(field, models.IntegerField):
+            condition &= Q(**{f'{field.attname}__lt': edges[index + 1]})
+        else:
+            condition &= Q(**{f'{field.attname}__lte': edges[index + 1]})
+        aggregates[f'bucket_{index}'] = Count('pk', filter=condition)
+    counts = queryset.aggregate(**aggregates)
+    return {'min': low, 'max': high, 'counts': [counts[f'bucket_{index}'] for index in range(bins)]}
+
+
+def profile_model(
+        model: Type[models.Model],
+        using: str = DEFAULT_DB_ALIAS,
+        top_k: int = DEFAULT_TOP_K,
+        bins: int = DEFAULT_BINS
+) -> dict:
+    """
+    Profiles the columns of a model from its existing rows.
+
+    Args:
+        model (Type[models.Model]): The model class.
+        using (str): The database alias.
+        top_k (int): The number of most common values kept per column.
+        bins (int): The number of histogram buckets of numeric and date columns.
+
+    Returns:
+        dict: `{'rows': n, 'columns': {name: column}}` where every column holds its
+            `null_fraction`, `distinct` count, `top` values with their counts, the number of
+            `rest` rows holding other values and, for numeric and date columns, a `histogram` of
+            those other values.
+
+    Description:
+        Row, null and distinct counts and the min/max of all columns are read with one aggregate
+        query. Every column then costs one grouped query for its top values and one aggregate
+        query for its histogram.
+    """
+    queryset = model._base_manager.using(using)
+    fields = [
+        descriptor for descriptor in get_model_descriptor(model).concrete_fields
+        if is_profiled(descriptor)
+    ]
+    aggregates = {'rows': Count('pk')}
+    for index, descriptor in enumerate(fields):
+        aggregates[f'filled_{index}'] = Count(descriptor.attname)
+        aggregates[f'distinct_{index}'] = Count(descriptor.attname, distinct=True)
+        if isinstance(descriptor.field, HISTOGRAM_FIELD_TYPES):
+            aggregates[f'min_{index}'] = Min(descriptor.attname)
+            aggregates[f'max_{index}'] = Max(descriptor.attname)
+    stats = queryset.aggregate(**aggregates)
+    rows = stats['rows']
+    columns = {}
+    for index, descriptor in enumerate(fields if rows else ()):
+        field, filled = descriptor.field, stats[f'filled_{index}']
+        column = {
+            'null_fraction': round(1 - filled / rows, 6),
+            'distinct': stats[f'distinct_{index}'],
+            'top': [],
+        }
+        if filled:
+            top = queryset.filter(**{f'{field.attname}__isnull': False}).values_list(
+                field.attname).annotate(rows=Count('pk')).order_by('-rows', field.attname)[:top_k]
+            column['top'] = [[value, count] for value, count in top]
+            rest = column['rest'] = filled - sum(count for _, count in column['top'])
+            if rest and stats.get(f'min_{index}') is not None:
+                column['histogram'] = profile_histogram(
+                    queryset.filter(**{f'{field.attname}__isnull': False}).exclude(
+                        **{f'{field.attname}__in': [value for value, _ in column['top']]}),
+                    field, stats[f'min_{index}'], stats[f'max_{index}'], bins
+                )
+        columns[descriptor.name] = column
+    return {'rows': rows, 'columns': columns}
+
+
+def profile_models(
+        models_to_profile: List[Type[models.Model]],
+        using: str = DEFAULT_DB_ALIAS,
+        top_k: int = DEFAULT_TOP_K,
+        bins: int = DEFAULT_BINS
+) -> dict:
+    """
+    Profiles many models into the stored column profile format.
+    """
+    return {
+        'version': COLUMN_PROFILE_VERSION,
+        'models': {
+            model._meta.label: profile_model(model, using=using, top_k=top_k, bins=bins)
+            for model in models_to_profile
+        }
+    }
+
+
+def save_column_profiles(profiles: dict, path: str) -> None:
+    """
+    Writes column profiles as JSON, dates, decimals and uuids as strings.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(profiles, file, cls=DjangoJSONEncoder, indent=1)
+
+
+def load_column_profiles(path: str) -> dict:
+    """
+    Reads column profiles written by `save_column_profiles`.
+    """
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def compile_bucket_sampler(field: models.Field, histogram: dict) -> Optional[Callable[[], Any]]:
+    """
+    Compiles a sampler drawing a bucket by its count, then a uniform value inside it.
+    """
+    counts = histogram['counts']
+    if not sum(counts):
+        return None
+    low, high = field.to_python(histogram['min']), field.to_python(histogram['max'])
+    edges = histogram_edges(field, low, high, len(counts))
+    buckets = AliasTable(range(len(counts)), counts)
+
+    if isinstance(field, models.IntegerField):
+        def sample(start, end):
+            return random.randint(start, max(start, end - 1))
+    elif isinstance(field, models.DecimalField):
+        exponent = Decimal(1).scaleb(-(field.decimal_places or 0))
+
+        def sample(start, end):
+            return Decimal(str(random.uniform(float(start), float(end)))).quantize(exponent)
+    elif isinstance(field, models.FloatField):
+        def sample(start, end):
+            return random.uniform(start, end)
+    elif isinstance(field, models.DateTimeField):
+        def sample(start, end):
+            return start + (end - start) * random.random()
+    else:
+        def sample(start, end):
+            return start + datetime.timedelta(days=int((end - start).days * random.random()))
+
+    def draw():
+        index = buckets.draw()
+        return sample(edges[index], edges[index + 1])
+    return draw
+
+
+def compile_column_sampler(
+        descriptor: FieldDescriptor,
+        column: dict,
+        fallback: Optional[Callable[[], Any]] = None
+) -> Optional[Callable[[], Any]]:
+    """
+    Compiles a value generator reproducing the distribution of a profiled column.
+
+    Args:
+        descriptor (FieldDescriptor): The field.
+        column (dict): Its column profile, see `profile_model`.
+        fallback (Optional[Callable[[], Any]]): Generates the values outside the top values when
+            the column has no histogram, usually the generator of the field type.
+
+    Returns:
+        Optional[Callable[[], Any]]: The generator, or None if the profile holds no values.
+
+    Description:
+        One alias table draws between NULL, each top value and the remaining values in O(1). The
+        remaining values come from a second alias table over the histogram buckets, or from
+        `fallback`.
+    """
+    field = descriptor.field
+    top = [(field.to_python(value), count) for value, count in column.get('top', [])]
+    rest = column.get('rest', 0)
+    rest_sampler = None
+    if column.get('histogram'):
+        rest_sampler = compile_bucket_sampler(field, column['histogram'])
+    rest_sampler = rest_sampler or fallback
+    if rest_sampler is None:
+        rest = 0
+
+    # ? the null share is turned into a weight relative to the counted non null rows
+    null_fraction = column.get('null_fraction', 0) if descriptor.null else 0
+    non_null = sum(count for _, count in top) + rest
+    if null_fraction >= 1:
+        return lambda: None
+    values, weights = [], []
+    if null_fraction and non_null:
+        values.append(NULL)
+        weights.append(non_null * null_fraction / (1 - null_fraction))
+    for value, count in top:
+        values.append(value)
+        weights.append(count)
+    if rest:
+        values.append(REST)
+        weights.append(rest)
+    if not non_null:
+        return None
+    table = AliasTable(values, weights)
+
+    def generate():
+        value = table.draw()
+        if value is NULL:
+            return None
+        if value is REST:
+            return rest_sampler()
+        return value
+    return generate
@@ -0,0 +1,184 @@
+from typing import Dict, FrozenSet, Iterable, Optional, Type
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django_data_seed.utils.excluded_models import EXCLUDED_MODELS
+
+# ? settings that are compiled into the audit configuration
+AUDIT_SETTINGS = frozenset({
+    'ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP',
+    'ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY',
+    'DJANGO_DATA_SEED_EXCLUDED_MODELS',
+    'DJANGO_DATA_SEED_AUDITED_MODELS',
+    'DJANGO_DATA_SEED_AUDIT_QUEUE_PATH',
+})
+
+
+# ? models opted in with the `audited` decorator
+_registered_models = set()
+
+
+def audited(model: Type[models.Model]) -> Type[models.Model]:
+    """
+    Class decorator that opts a model in to auditing.
+
+    Args:
+        model (Type[models.Model]): The model class to audit.
+
+    Returns:
+        Type[models.Model]: The same model class.
+
+    Example:
+        @audited
+        class Order(models.Model):
+            ...
+    """
+    _registered_models.add(model)
+    return model
+
+
+def get_audit_marker(model: Type[models.Model]) -> Optional[bool]:
+    """
+    Reads the `DataSeedMeta.audited` marker of a model.
+
+    Args:
+        model (Type[models.Model]): The model class.
+
+    Returns:
+        Optional[bool]: The value of the marker, or None if the model does not declare it.
+
+    Example:
+        class Order(models.Model):
+            class DataSeedMeta:
+                audited = True
+    """
+    return getattr(getattr(model, 'DataSeedMeta', None), 'audited', None)
+
+
+def normalize_model_names(names: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Lower cases model references so 'Order', 'shop.Order' and 'shop.order' all match.
+    """
+    return frozenset(str(name).lower() for name in (names or ()))
+
+
+class AuditConfig:
+    """
+        The audit settings compiled once, so signal receivers only do set lookups.
+
+        Attributes:
+            backup_enabled: Whether deleted instances are backed up.
+            log_entry_enabled: Whether mutations are recorded as log entries.
+            excluded_models: Lower cased model names and labels that are never audited.
+            audited_models: Lower cased model names and labels to audit exclusively, or None to
+                audit every model that is not excluded.
+            opt_in: Whether only opted in models are audited, which is the case as soon as
+                `DJANGO_DATA_SEED_AUDITED_MODELS`, the `audited` decorator or a
+                `DataSeedMeta.audited = True` marker is used.
+            queued: Whether audit rows are enqueued for `run_audit_worker` instead of being
+                written in the request.
+    """
+    __slots__ = (
+        'backup_enabled',
+        'log_entry_enabled',
+        'excluded_models',
+        'audited_models',
+        'opt_in',
+        'queued',
+        '_decisions'
+    )
+
+    def __init__(
+            self,
+            backup_enabled: bool = False,
+            log_entry_enabled: bool = False,
+            excluded_models: Iterable[str] = (),
+            audited_models: Optional[Iterable[str]] = None,
+            opt_in: bool = False,
+            queued: bool = False
+    ):
+        self.backup_enabled = bool(backup_enabled)
+        self.log_entry_enabled = bool(log_entry_enabled)
+        self.excluded_models = normalize_model_names(excluded_models)
+        self.audited_models = normalize_model_names(
+            audited_models) if audited_models else None
+        self.opt_in = bool(opt_in or self.audited_models)
+        self.queued = bool(queued)
+        self._decisions: Dict[Type[models.Model], bool] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.backup_enabled or self.log_entry_enabled
+
+    def is_audited(self, model: Type[models.Model]) -> bool:
+        """
+        Tells whether a model is audited, caching the answer per model class.
+
+        Args:
+            model (Type[models.Model]): The model class.
+
+        Returns:
+            bool: True if signals of the model should be audited.
+        """
+        decision = self._decisions.get(model)
+        if decision is None:
+            names = {
+                model.__name__.lower(),
+                model._meta.label_lower,
+            }
+            marker = get_audit_marker(model)
+            if names & self.excluded_models or marker is False:
+                decision = False
+            elif marker or model in _registered_models:
+                decision = True
+            elif self.audited_models is not None:
+                decision = bool(names & self.audited_models)
+            else:
+                decision = not self.opt_in
+            self._decisions[model] = decision
+        return decision
+
+
+def build_audit_config() -> AuditConfig:
+    """
+    Compiles the audit configuration from the Django settings.
+
+    Returns:
+        AuditConfig: The compiled configuration.
+    """
+    opt_in = bool(_registered_models) or any(
+        get_audit_marker(model) for model in apps.get_models()
+    )
+    return AuditConfig(
+        backup_enabled=getattr(
+            settings, 'ENABLE_DJANGO_DATA_SEED_AUTO_BACKUP', None),
+        log_entry_enabled=getattr(
+            settings, 'ENABLE_DJANGO_DATA_SEED_AUTO_LOG_ENTRY', None),
+        excluded_models=list(EXCLUDED_MODELS) + list(
+            getattr(settings, 'DJANGO_DATA_SEED_EXCLUDED_MODELS', None) or []),
+        audited_models=getattr(settings, 'DJANGO_DATA_SEED_AUDITED_MODELS', None),
+        opt_in=opt_in,
+        queued=getattr(settings, 'DJANGO_DATA_SEED_AUDIT_QUEUE_PATH', None)
+    )
+
+
+_audit_config: Optional[AuditConfig] = None
+
+
+def get_audit_config() -> AuditConfig:
+    """
+    Returns the compiled audit configuration, compiling it on first use.
+    """
+    global _audit_config
+    if _audit_config is None:
+        _audit_config = build_audit_config()
+    return _audit_config
+
+
+def reload_audit_config() -> AuditConfig:
+    """
+    Recompiles the audit configuration, e.g. after the settings changed.
+    """
+    global _audit_config
+    _audit_config = build_audit_config()
+    return _audit_config
@@ -1,37 +1,37 @@
-from django.conf import settings
-
 EXCLUDED_MODELS = [
     'DjangoSeedDataBackUpModel',
     'DjangoSeedDataLogEntryModel',
     'LogEntry',
+    # ? written on almost every request, never worth auditing
+    'Session',
 ]
 
 
-def auto_log_entry_get_excluded_models() -> list:
+def auto_log_entry_get_excluded_models() -> frozenset:
     """
-        Retrieves a list of models that should be excluded from automatic log entry.
+        Retrieves the models that should be excluded from automatic log entry.
 
         Returns:
-            list: A list of model classes that are excluded from logging.
+            frozenset: The lower cased names and labels of the models excluded from logging.
 
         Description:
-            This function returns a list of models for which automatic logging is not required.
-            It is used to configure which models are excluded from log entry processes.
+            This function returns the models for which automatic logging is not required,
+            including the ones configured in `DJANGO_DATA_SEED_EXCLUDED_MODELS`.
     """
-    excluded_models = EXCLUDED_MODELS
-    return excluded_models
+    from django_data_seed.utils.config import get_audit_config
+    return get_audit_config().excluded_models
 
 
-def auto_data_backup_get_excluded_models() -> list:
+def auto_data_backup_get_excluded_models() -> frozenset:
     """
-        Retrieves a list of models that should be excluded from automatic data backup.
+        Retrieves the models that should be excluded from automatic data backup.
 
         Returns:
-            list: A list of model classes that are excluded from the data backup process.
+            frozenset: The lower cased names and labels of the models excluded from data backup.
 
         Description:
-            This function returns a list of models that are not included in automatic data backup operations.
-            It helps in configuring which models should be excluded from the data backup routine.
+            This function returns the models that are not included in automatic data backup operations,
+            including the ones configured in `DJANGO_DATA_SEED_EXCLUDED_MODELS`.
     """
-    excluded_models = EXCLUDED_MODELS
-    return excluded_models
+    from django_data_seed.utils.config import get_audit_config
+    return get_audit_config().excluded_models
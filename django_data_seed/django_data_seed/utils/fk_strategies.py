@@ -0,0 +1,112 @@
+import random
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional
+from django_data_seed.utils.column_profile import AliasTable
+
+# ? the ways children are spread over their parents
+FK_STRATEGIES = ('uniform', 'round_robin', 'zipf', 'fixed')
+DEFAULT_ZIPF_EXPONENT = 1.0
+# ? the children per parent of self referential keys shaped as trees
+DEFAULT_TREE_BRANCHING = 3
+
+
+def zipf_cum_weights(size: int, exponent: float = DEFAULT_ZIPF_EXPONENT) -> List[float]:
+    """
+    Returns the cumulative Zipf weights `1 / rank ** exponent` of `size` ranks.
+    """
+    return list(accumulate(1 / rank ** exponent for rank in range(1, size + 1)))
+
+
+def parent_sampler(
+        pool: List[Any],
+        strategy: str = 'uniform',
+        fan_out: Optional[int] = None,
+        exponent: float = DEFAULT_ZIPF_EXPONENT,
+        histogram: Optional[Dict[int, int]] = None
+) -> Callable[[int, int], List[Any]]:
+    """
+    Binds a foreign key strategy to the primary keys of the parents.
+
+    Args:
+        pool (List[Any]): The parent primary keys, computed once per model.
+        strategy (str): One of `FK_STRATEGIES`:
+            - uniform: every row picks a random parent.
+            - round_robin: rows cycle through the parents in order.
+            - zipf: the parent of rank r is picked with a weight of `1 / r ** exponent`, the first
+              parents of the pool being the hot keys.
+            - fixed: every parent gets `fan_out` consecutive rows.
+        fan_out (Optional[int]): The number of children per parent of the fixed strategy.
+        exponent (float): The skew of the zipf strategy, higher is more skewed.
+        histogram (Optional[Dict[int, int]]): The number of parents per number of children. When
+            set, every parent draws its weight from it and rows pick parents by weight.
+
+    Returns:
+        Callable[[int, int], List[Any]]: Returns the parent primary keys of the rows
+            `[start, stop)`, drawn in one call per batch (`random.choices` with precomputed
+            cumulative weights, or an alias table).
+    """
+    size = len(pool)
+    if not size:
+        return lambda start, stop: [None] * (stop - start)
+
+    if histogram:
+        children, parents = zip(*histogram.items())
+        weights = random.choices(children, weights=parents, k=size)
+        if any(weights):
+            table = AliasTable(pool, weights)
+            return lambda start, stop: [table.draw() for _ in range(stop - start)]
+    if strategy == 'fixed':
+        fan_out = fan_out or 1
+        return lambda start, stop: [pool[index // fan_out % size] for index in range(start, stop)]
+    if strategy == 'round_robin':
+        return lambda start, stop: [pool[index % size] for index in range(start, stop)]
+    if strategy == 'zipf':
+        cum_weights = zipf_cum_weights(size, exponent)
+        return lambda start, stop: random.choices(pool, cum_weights=cum_weights, k=stop - start)
+    if strategy != 'uniform':
+        raise ValueError(f'Unknown foreign key strategy {strategy!r}, expected one of {FK_STRATEGIES}')
+    return lambda start, stop: random.choices(pool, k=stop - start)
+
+
+def tree_sampler(
+        pool: List[Any],
+        depth: Optional[int] = None,
+        branching: int = DEFAULT_TREE_BRANCHING
+) -> Callable[[int, int], List[Any]]:
+    """
+    Shapes the rows of `pool` into trees, every row pointing to a row of the same pool.
+
+    Args:
+        pool (List[Any]): The primary keys of the rows, in insertion order.
+        depth (Optional[int]): The number of levels of every tree, one tree when not set.
+        branching (int): The number of children of every parent.
+
+    Returns:
+        Callable[[int, int], List[Any]]: Returns the parent primary keys (None for roots) of
+            the rows `[start, stop)`. The first rows are the roots and the children of row `j`
+            follow breadth first, at `roots + j * branching`.
+    """
+    size = len(pool)
+    roots = 1
+    if depth:
+        per_tree = sum(branching ** level for level in range(depth))
+        roots = max(1, -(-size // per_tree))
+    return lambda start, stop: [
+        None if index < roots else pool[(index - roots) // branching]
+        for index in range(start, stop)
+    ]
+
+
+def with_null_ratio(
+        sample: Callable[[int, int], List[Any]],
+        null_ratio: float
+) -> Callable[[int, int], List[Any]]:
+    """
+    Leaves a share of the sampled rows without a parent.
+    """
+    if not null_ratio:
+        return sample
+
+    def sample_or_null(start, stop):
+        return [None if random.random() < null_ratio else pk for pk in sample(start, stop)]
+    return sample_or_null
@@ -0,0 +1,207 @@
+import random
+from typing import Any, Callable, List, Optional, Type
+from django.db import models
+from django_data_seed.utils.colorama_theme import StdoutTextTheme
+
+# ? the entry point group of the packages shipping generators, every entry point loads a
+# ? callable receiving the registry
+ENTRY_POINT_GROUP = 'django_data_seed.generators'
+# ? values drawn per call of a batch generator when values are generated one at a time
+BATCH_GENERATOR_CHUNK_SIZE = 1000
+# ? the largest number of items of generated arrays and mappings
+MAX_GENERATED_ITEMS = 3
+
+theme = StdoutTextTheme()
+
+
+class GeneratorEntry:
+    """
+        A value generator registered for a field class.
+
+        Attributes:
+            function: Called as `function(seeder, field, model)` and returns one value, or as
+                `function(seeder, field, model, count)` and returns `count` values when `batch`
+                is set. `seeder` is the `SeedData` instance.
+            batch: Whether the generator produces many values per call.
+    """
+    __slots__ = ('function', 'batch')
+
+    def __init__(self, function: Callable[..., Any], batch: bool = False):
+        self.function = function
+        self.batch = batch
+
+    def __repr__(self):
+        return f'<GeneratorEntry {getattr(self.function, "__name__", self.function)!r}>'
+
+
+class BatchBuffer:
+    """
+        Serves the values of a batch generator one at a time, drawing `size` values per call.
+    """
+    __slots__ = ('entry', 'seeder', 'field', 'model', 'size', 'values')
+
+    def __init__(
+            self,
+            entry: GeneratorEntry,
+            seeder: Any,
+            field: models.Field,
+            model: Type[models.Model],
+            size: int = BATCH_GENERATOR_CHUNK_SIZE
+    ):
+        self.entry = entry
+        self.seeder = seeder
+        self.field = field
+        self.model = model
+        self.size = size
+        self.values = []
+
+    def __call__(self) -> Any:
+        if not self.values:
+            self.values = list(self.entry.function(self.seeder, self.field, self.model, self.size))
+            if not self.values:
+                raise ValueError(f'The batch generator of {self.field.name} returned no values')
+            self.values.reverse()
+        return self.values.pop()
+
+
+def get_entry_points(group: str) -> list:
+    """
+    Returns the installed entry points of a group, across the `importlib.metadata` versions.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        # ? Python 3.7
+        return []
+    installed = entry_points()
+    if hasattr(installed, 'select'):
+        return list(installed.select(group=group))
+    return list(installed.get(group, []))
+
+
+class GeneratorRegistry:
+    """
+        The value generators of field classes. A field uses the generators registered for the
+        classes of its MRO, the most specific first, the others being fallbacks when it fails.
+
+        Attributes:
+            generators: The generator entry per field class.
+            resolved: The generator entries per field class, resolved once per class.
+            loaded: Whether the built-in and entry point generators are registered.
+    """
+    __slots__ = ('generators', 'resolved', 'loaded')
+
+    def __init__(self):
+        self.generators = {}
+        self.resolved = {}
+        self.loaded = False
+
+    def register(
+            self,
+            field_class: Type[models.Field],
+            function: Optional[Callable[..., Any]] = None,
+            batch: bool = False
+    ) -> Callable[..., Any]:
+        """
+        Registers the generator of a field class, replacing any previous one. Usable as a
+        decorator when `function` is left out.
+
+        Example:
+            @registry.register(MoneyField, batch=True)
+            def generate_money(seeder, field, model, count):
+                return [Money(random.randint(1, 100), 'EUR') for _ in range(count)]
+        """
+        if function is None:
+            return lambda function: self.register(field_class, function, batch)
+        self.generators[field_class] = GeneratorEntry(function, batch)
+        self.resolved.clear()
+        return function
+
+    def unregister(self, field_class: Type[models.Field]) -> None:
+        self.generators.pop(field_class, None)
+        self.resolved.clear()
+
+    def resolve(self, field_class: Type[models.Field]) -> tuple:
+        """
+        Returns the generator entries of a field class, the most specific first, or an empty
+        tuple. Cached per class.
+        """
+        entries = self.resolved.get(field_class)
+        if entries is None:
+            self.load()
+            entries = self.resolved[field_class] = tuple(
+                self.generators[klass] for klass in field_class.__mro__
+                if klass in self.generators
+            )
+        return entries
+
+    def load(self) -> None:
+        """
+        Registers, once, the built-in generators and those of the installed entry points.
+        Generators registered before keep precedence over the built-in ones.
+        """
+        if self.loaded:
+            return
+        self.loaded = True
+        register_builtin_generators(self)
+        for entry_point in get_entry_points(ENTRY_POINT_GROUP):
+            try:
+                entry_point.load()(self)
+            except Exception as e:
+                theme.stdout_warning(
+                    f'WARNING : Could not load the generators of {entry_point.name}. Error : {str(e)}')
+        self.resolved.clear()
+
+
+def seeder_method(name: str) -> Callable[..., Any]:
+    """
+    Returns a generator calling the generator method `name` of the seeder, so subclasses of
+    `SeedData` can override it.
+    """
+    def generate(seeder, field, model):
+        return getattr(seeder, name)(field, model)
+    generate.__name__ = name
+    return generate
+
+
+def generate_array(seeder: Any, field: models.Field, model: Type[models.Model]) -> List[Any]:
+    """
+    Generates the items of an `ArrayField` with the generators of its base field.
+    """
+    count = random.randint(0, min(field.size or MAX_GENERATED_ITEMS, MAX_GENERATED_ITEMS))
+    return [seeder.generate_field_value(field.base_field, model) for _ in range(count)]
+
+
+def generate_hstore(seeder: Any, field: models.Field, model: Type[models.Model]) -> dict:
+    from django_data_seed.management.commands.fields import fake
+
+    return {fake.word(): fake.word() for _ in range(random.randint(1, MAX_GENERATED_ITEMS))}
+
+
+def register_builtin_generators(registry: GeneratorRegistry) -> None:
+    """
+    Registers the generator methods `SeedData` defines among `SUPPORTED_DJANGO_MODEL_FIELDS`
+    and, when `django.contrib.postgres` can be imported, the `ArrayField` and `HStoreField`
+    generators. Field classes without a method resolve to their parent class generator.
+    """
+    from django_data_seed.management.commands.load_data import SeedData
+    from django_data_seed.management.commands.utils import SUPPORTED_DJANGO_MODEL_FIELDS
+
+    defaults = [
+        (getattr(models, name, None), seeder_method(name)) for name in SUPPORTED_DJANGO_MODEL_FIELDS
+        if callable(getattr(SeedData, name, None))
+    ]
+    try:
+        from django.contrib.postgres.fields import ArrayField, HStoreField
+    except ImportError:
+        # ? psycopg is not installed
+        pass
+    else:
+        defaults += [(ArrayField, generate_array), (HStoreField, generate_hstore)]
+    for field_class, function in defaults:
+        if field_class is not None and field_class not in registry.generators:
+            registry.generators[field_class] = GeneratorEntry(function)
+
+
+registry = GeneratorRegistry()
+register_generator = registry.register
@@ -1,8 +1,11 @@
 from django.contrib.auth.models import AnonymousUser
 from django.contrib.auth import get_user_model
-import threading
 from typing import Any
-_thread_locals = threading.local()
+from django_data_seed.utils.audit_context import (
+    get_context_user,
+    set_context_user
+)
+from django_data_seed.utils.identity import AuditIdentity
 
 
 User = get_user_model()  # Get the user model class
@@ -10,16 +13,18 @@ User = get_user_model()  # Get the user model class
 
 def get_current_user() -> Any:
     """
-    Retrieves the current user from thread-local storage.
+    Retrieves the current user from the audit context.
 
     Returns:
-        Any: The user object from thread-local storage, or None if the user is anonymous or not set.
+        Any: The user object of the current request or task, or None if the user is anonymous or not set.
 
     Description:
-        This function fetches the user object that is stored in thread-local storage.
-        It is typically used to access the currently logged-in user in a thread-safe manner.
+        The user is stored in a context variable, so every request, thread and async task
+        sees its own user.
     """
-    user = getattr(_thread_locals, 'user', None)
+    user = get_context_user()
+    if isinstance(user, AuditIdentity):
+        user = user.user
 
     if isinstance(user, User) and not isinstance(user, AnonymousUser):
         return user
@@ -28,14 +33,35 @@ def get_current_user() -> Any:
 
 def set_current_user(user: Any) -> None:
     """
-    Sets the current user in thread-local storage.
+    Sets the current user in the audit context.
 
     Args:
-        user (Any): The user object to be stored in thread-local storage.
+        user (Any): The user object to be stored.
 
     Description:
-        This function stores the provided user object in thread-local storage.
-        It is used to make the current user accessible across different parts of the application
-        within the same thread.
+        This function stores the provided user object for the current execution context.
+        Prefer `AuditContextMiddleware`, which also resets the user once the request is done.
     """
-    _thread_locals.user = user
+    set_context_user(user)
+
+
+def get_current_user_id() -> Any:
+    """
+    Retrieves the primary key of the current user from the audit context.
+
+    Returns:
+        Any: The primary key of the user, or None if the user is anonymous or not set.
+
+    Description:
+        The middleware stores an `AuditIdentity`, so this is the moment the identity sources
+        are asked. It is only called when a backup or log entry row is written, which keeps
+        read only requests free of session and user lookups; a JWT source answers without
+        touching the user table at all.
+    """
+    identity = get_context_user()
+    if isinstance(identity, AuditIdentity):
+        return identity.user_id
+    user = get_current_user()
+    if user is None:
+        return None
+    return user.pk
@@ -0,0 +1,201 @@
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+# ? identity sources used when neither the middleware nor the settings name any
+DEFAULT_IDENTITY_SOURCES = (
+    'django_data_seed.utils.identity.request_user_id',
+)
+# ? identity sources of token authenticated APIs, the JWT claim wins over request.user
+JWT_IDENTITY_SOURCES = (
+    'django_data_seed.utils.identity.jwt_user_id',
+    'django_data_seed.utils.identity.request_user_id',
+)
+_UNRESOLVED = object()
+
+
+def load_identity_sources(sources: Optional[Iterable[Any]] = None) -> Tuple[Callable, ...]:
+    """
+    Imports the identity sources of the audit context.
+
+    Args:
+        sources (Optional[Iterable[Any]]): Callables or dotted paths to callables. Defaults to
+            `DJANGO_DATA_SEED_IDENTITY_SOURCES`, then to `DEFAULT_IDENTITY_SOURCES`.
+
+    Returns:
+        Tuple[Callable, ...]: The callables, each taking a request and returning a user id or None.
+
+    Raises:
+        ImproperlyConfigured: If the JWT identity source is configured without PyJWT installed.
+    """
+    if sources is None:
+        sources = getattr(settings, 'DJANGO_DATA_SEED_IDENTITY_SOURCES',
+                          None) or DEFAULT_IDENTITY_SOURCES
+    sources = tuple(
+        import_string(source) if isinstance(source, str) else source
+        for source in sources
+    )
+    if jwt_user_id in sources:
+        check_jwt_installed()
+    return sources
+
+
+def check_jwt_installed() -> None:
+    """
+    Fails at startup rather than inside the signal handlers, which swallow errors and would
+    silently drop every audit row.
+    """
+    try:
+        import jwt  # noqa: F401
+    except ImportError:
+        raise ImproperlyConfigured(
+            'The JWT identity source requires PyJWT, install it with '
+            '`pip install django-data-seed[jwt]`')
+
+
+def request_user_id(request: Any) -> Any:
+    """
+    Identity source reading `request.user`, which resolves the session and user when needed.
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return user.pk
+    return None
+
+
+def get_request_token(request: Any) -> Optional[str]:
+    """
+    Extracts a JWT from the `Authorization` header or the query string of a request.
+
+    Args:
+        request (Any): The request.
+
+    Returns:
+        Optional[str]: The raw token, or None if the request does not carry one.
+
+    Description:
+        The accepted header prefixes come from `DJANGO_DATA_SEED_JWT_AUTH_HEADER_PREFIXES`
+        (default `('Bearer', 'JWT')`) and the query parameter from `DJANGO_DATA_SEED_JWT_QUERY_PARAM`
+        (default `'token'`).
+    """
+    header = request.META.get('HTTP_AUTHORIZATION', '')
+    prefixes = getattr(settings, 'DJANGO_DATA_SEED_JWT_AUTH_HEADER_PREFIXES', ('Bearer', 'JWT'))
+    parts = header.split()
+    if len(parts) == 2 and parts[0] in prefixes:
+        return parts[1]
+    query_param = getattr(settings, 'DJANGO_DATA_SEED_JWT_QUERY_PARAM', 'token')
+    if query_param:
+        return request.GET.get(query_param) or None
+    return None
+
+
+def _decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Decodes and verifies a JWT, returning None when it is invalid.
+    """
+    import jwt
+
+    try:
+        return jwt.decode(
+            token,
+            getattr(settings, 'DJANGO_DATA_SEED_JWT_SECRET', None) or settings.SECRET_KEY,
+            algorithms=getattr(settings, 'DJANGO_DATA_SEED_JWT_ALGORITHMS', ['HS256'])
+        )
+    except jwt.PyJWTError:
+        return None
+
+
+# ? decoded claims keyed by the raw token, so a client reusing its token is only verified once
+_cached_decode_token = lru_cache(
+    maxsize=getattr(settings, 'DJANGO_DATA_SEED_JWT_CACHE_SIZE', 256)
+)(_decode_token)
+
+
+def decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the verified claims of a JWT, decoding each distinct token once.
+
+    Args:
+        token (str): The raw token.
+
+    Returns:
+        Optional[Dict[str, Any]]: The claims, or None if the token is invalid or has expired since
+        it was cached.
+    """
+    claims = _cached_decode_token(token)
+    if claims is None:
+        return None
+    expires_at = claims.get('exp')
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    return claims
+
+
+def clear_token_cache() -> None:
+    """
+    Drops every cached token, e.g. after the signing key was rotated.
+    """
+    _cached_decode_token.cache_clear()
+
+
+def jwt_user_id(request: Any) -> Any:
+    """
+    Identity source reading the user id claim of the request's JWT without fetching the user.
+
+    The claim is named by `DJANGO_DATA_SEED_JWT_USER_ID_CLAIM` (default `'user_id'`).
+    """
+    token = get_request_token(request)
+    if not token:
+        return None
+    claims = decode_token(token)
+    if claims is None:
+        return None
+    user_id = claims.get(getattr(settings, 'DJANGO_DATA_SEED_JWT_USER_ID_CLAIM', 'user_id'))
+    if user_id is None:
+        return None
+    return get_user_model()._meta.pk.to_python(user_id)
+
+
+class AuditIdentity:
+    """
+        A lazy reference to the user responsible for the mutations of a request.
+
+        The identity sources are only asked when a backup or log entry row is written, and the
+        first user id they return is kept for the rest of the request.
+    """
+    __slots__ = ('request', 'sources', '_user_id', '_user')
+
+    def __init__(self, request: Any, sources: Tuple[Callable, ...]):
+        self.request = request
+        self.sources = sources
+        self._user_id = _UNRESOLVED
+        self._user = _UNRESOLVED
+
+    @property
+    def user_id(self) -> Any:
+        if self._user_id is _UNRESOLVED:
+            user_id = None
+            for source in self.sources:
+                user_id = source(self.request)
+                if user_id is not None:
+                    break
+            self._user_id = user_id
+        return self._user_id
+
+    @property
+    def user(self) -> Any:
+        """
+        The user instance; unlike `user_id` this may query the user table.
+        """
+        if self._user is _UNRESOLVED:
+            user = getattr(self.request, 'user', None)
+            if user is None or not user.is_authenticated or user.pk != self.user_id:
+                user = None
+                if self.user_id is not None:
+                    user = get_user_model()._default_manager.filter(pk=self.user_id).first()
+            self._user = user
+        return self._user
@@ -1,4 +1,15 @@
-from typing import Any
+import hashlib
+import json
+from typing import Any, Set, Tuple
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+# ? types compared inline instead of being pushed on the stack
+SCALAR_TYPES = (str, int, float, bool, type(None))
+_MISSING = object()
 
 
 def compare_json_objects(obj1: Any, obj2: Any) -> bool:
@@ -8,16 +19,112 @@ def compare_json_objects(obj1: Any, obj2: Any) -> bool:
         :param obj1: The first JSON object.
         :param obj2: The second JSON object.
         :return: A boolean indicating whether the two JSON objects are identical.
+
+        Values are only equal when their types match exactly (`1`, `1.0` and `True` differ).
+        The structures are walked with an explicit stack and the walk stops at the first
+        difference, so no recursion limit applies to deeply nested payloads.
     """
-    if not compare_types(obj1, obj2):
-        return False
+    stack = [(obj1, obj2)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        value1, value2 = pop()
+        value_type = type(value1)
+        if value_type is not type(value2):
+            return False
+        if isinstance(value1, dict):
+            if value1 is value2:
+                continue
+            if len(value1) != len(value2):
+                return False
+            for key, item1 in value1.items():
+                item2 = value2.get(key, _MISSING)
+                if item2 is _MISSING:
+                    return False
+                item_type = type(item1)
+                if item_type in SCALAR_TYPES:
+                    if item_type is not type(item2) or item1 != item2:
+                        return False
+                else:
+                    push((item1, item2))
+        elif isinstance(value1, list):
+            if value1 is value2:
+                continue
+            if len(value1) != len(value2):
+                return False
+            for item1, item2 in zip(value1, value2):
+                item_type = type(item1)
+                if item_type in SCALAR_TYPES:
+                    if item_type is not type(item2) or item1 != item2:
+                        return False
+                else:
+                    push((item1, item2))
+        elif value1 != value2:
+            return False
+    return True
+
+
+def get_changed_paths(obj1: Any, obj2: Any) -> Set[Tuple[Any, ...]]:
+    """
+        Return the paths at which two JSON objects differ.
+
+        :param obj1: The first JSON object.
+        :param obj2: The second JSON object.
+        :return: A set of paths, each a tuple of dictionary keys and list indexes, e.g.
+            `('fields', 'char_field')`. An empty set means the objects are identical.
+    """
+    changed = set()
+    stack = [((), obj1, obj2)]
+    while stack:
+        path, value1, value2 = stack.pop()
+        if type(value1) is not type(value2):
+            changed.add(path)
+        elif isinstance(value1, dict):
+            for key in value1.keys() | value2.keys():
+                if key not in value1 or key not in value2:
+                    changed.add(path + (key,))
+                else:
+                    stack.append((path + (key,), value1[key], value2[key]))
+        elif isinstance(value1, list):
+            for index in range(max(len(value1), len(value2))):
+                if index >= len(value1) or index >= len(value2):
+                    changed.add(path + (index,))
+                else:
+                    stack.append((path + (index,), value1[index], value2[index]))
+        elif value1 != value2:
+            changed.add(path)
+    return changed
 
-    if isinstance(obj1, dict):
-        return compare_dicts(obj1, obj2)
-    elif isinstance(obj1, list):
-        return compare_lists(obj1, obj2)
-    else:
-        return compare_values(obj1, obj2)
+
+def canonical_json(obj: Any) -> bytes:
+    """
+        Encode a JSON object to canonical bytes: sorted keys, no whitespace, UTF-8.
+
+        :param obj: The JSON object.
+        :return: The canonical encoding.
+    """
+    return json.dumps(
+        obj,
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    ).encode('utf-8')
+
+
+def json_fingerprint(obj: Any) -> str:
+    """
+        Return a hash of the canonical encoding of a JSON object.
+
+        :param obj: The JSON object.
+        :return: A hex digest, computed with xxhash when it is installed and blake2b otherwise.
+
+        Two snapshots with equal fingerprints are identical in the sense of
+        `compare_json_objects`, so a stored fingerprint can replace a full comparison.
+    """
+    encoded = canonical_json(obj)
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(encoded)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
 def compare_types(obj1: Any, obj2: Any) -> bool:
@@ -27,24 +134,11 @@ def compare_types(obj1: Any, obj2: Any) -> bool:
 
 
 def compare_dicts(dict1: dict, dict2: dict) -> bool:
-    for key in dict1.keys():
-        if key not in dict2:
-            return False
-        if not compare_json_objects(dict1[key], dict2[key]):
-            return False
-    for key in dict2.keys():
-        if key not in dict1:
-            return False
-    return True
+    return compare_json_objects(dict1, dict2)
 
 
 def compare_lists(list1: list, list2: list) -> bool:
-    if len(list1) != len(list2):
-        return False
-    for item1, item2 in zip(list1, list2):
-        if not compare_json_objects(item1, item2):
-            return False
-    return True
+    return compare_json_objects(list1, list2)
 
 
 def compare_values(value1: Any, value2: Any) -> bool:
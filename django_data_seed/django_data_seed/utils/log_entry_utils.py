@@ -0,0 +1,183 @@
+import copy
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple, Type, Union
+from django.apps import apps
+from django.conf import settings
+from django.db import models
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from django_data_seed.utils.restore_utils import chunked
+
+_MISSING = object()
+
+
+class ReconstructionCache:
+    """
+        A small thread-safe LRU cache of reconstructed object states keyed by
+        `(model_name, object_id, timestamp)`.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, Any]) -> Any:
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple[str, str, Any], value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+reconstruction_cache = ReconstructionCache(
+    maxsize=getattr(settings, 'DJANGO_DATA_SEED_RECONSTRUCTION_CACHE_SIZE', 1024)
+)
+
+
+def clear_reconstruction_cache() -> None:
+    """
+    Drops every cached reconstruction, e.g. after log entries were compacted.
+    """
+    reconstruction_cache.clear()
+
+
+def get_log_entry_model_name(model: Union[str, Type[models.Model]]) -> str:
+    """
+    Returns the name under which a model's mutations are stored in `DjangoSeedDataLogEntryModel`.
+
+    Args:
+        model (Union[str, Type[models.Model]]): The model class, its class name or 'app_label.ModelName'.
+
+    Returns:
+        str: The model class name.
+    """
+    if isinstance(model, str):
+        if '.' in model:
+            return apps.get_model(model).__name__
+        return model
+    return model.__name__
+
+
+def get_objects_at(
+        model: Union[str, Type[models.Model]],
+        pks: Iterable[Any],
+        timestamp: Any
+) -> Dict[str, Optional[dict]]:
+    """
+    Reconstructs the state of many objects of one model at a point in time.
+
+    Args:
+        model (Union[str, Type[models.Model]]): The model class, its class name or 'app_label.ModelName'.
+        pks (Iterable[Any]): The primary keys of the objects to reconstruct.
+        timestamp (Any): The point in time to reconstruct the objects at.
+
+    Returns:
+        Dict[str, Optional[dict]]: The serialized state (`{"pk", "model", "fields"}`) keyed by the
+        stringified primary key, or None when the log entries can not tell the state at that time.
+
+    Description:
+        The state at `timestamp` is the `after_mutation` of the latest log entry created at or before
+        it. Objects without such an entry fall back to the `before_mutation` of their first entry
+        after `timestamp`. Both lookups pick the one entry per object in SQL with a correlated
+        subquery served by the `(model_name, object_id, created_at)` index, so only one row per
+        object is returned, and issue one query per 1000 objects. States resolved from an entry at or
+        before a past timestamp are kept in an in-process LRU cache; fallbacks and unknown states are
+        not, since an entry logged later can still change them.
+    """
+    from django_data_seed.models import DjangoSeedDataLogEntryModel
+    model_name = get_log_entry_model_name(model)
+    if settings.USE_TZ and timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    object_ids = list(dict.fromkeys(str(pk) for pk in pks))
+    cacheable = timestamp < timezone.now()
+    results = {}
+    missing = []
+    for object_id in object_ids:
+        cached = reconstruction_cache.get((model_name, object_id, timestamp)) if cacheable else _MISSING
+        if cached is _MISSING:
+            missing.append(object_id)
+        else:
+            results[object_id] = copy.deepcopy(cached)
+
+    queryset = DjangoSeedDataLogEntryModel.objects.filter(model_name=model_name)
+    for object_id_chunk in chunked(missing, 1000):
+        latest = queryset.filter(
+            object_id=OuterRef('object_id'),
+            created_at__lte=timestamp,
+            after_mutation__isnull=False
+        ).order_by('-created_at', '-pk').values('pk')[:1]
+        found = dict(queryset.filter(
+            object_id__in=object_id_chunk,
+            pk=Subquery(latest)
+        ).values_list('object_id', 'after_mutation'))
+
+        resolved = set(found)
+        not_found = [object_id for object_id in object_id_chunk if object_id not in found]
+        if not_found:
+            earliest = queryset.filter(
+                object_id=OuterRef('object_id'),
+                created_at__gt=timestamp
+            ).order_by('created_at', 'pk').values('pk')[:1]
+            found.update(queryset.filter(
+                object_id__in=not_found,
+                pk=Subquery(earliest)
+            ).values_list('object_id', 'before_mutation'))
+
+        for object_id in object_id_chunk:
+            state = found.get(object_id)
+            if cacheable and object_id in resolved:
+                reconstruction_cache.set((model_name, object_id, timestamp), state)
+            results[object_id] = copy.deepcopy(state)
+    return results
+
+
+def get_object_at(
+        model: Union[str, Type[models.Model]],
+        pk: Any,
+        timestamp: Any
+) -> Optional[dict]:
+    """
+    Reconstructs what a single object looked like at a point in time.
+
+    Args:
+        model (Union[str, Type[models.Model]]): The model class, its class name or 'app_label.ModelName'.
+        pk (Any): The primary key of the object.
+        timestamp (Any): The point in time to reconstruct the object at.
+
+    Returns:
+        Optional[dict]: The serialized state of the object, or None if it is unknown.
+    """
+    return get_objects_at(model, [pk], timestamp)[str(pk)]
+
+
+def reconstruct_queryset(queryset: Any, timestamp: Any) -> Dict[str, Optional[dict]]:
+    """
+    Reconstructs the state at a point in time of every object in a queryset.
+
+    Args:
+        queryset (Any): A queryset of the audited model.
+        timestamp (Any): The point in time to reconstruct the objects at.
+
+    Returns:
+        Dict[str, Optional[dict]]: The serialized states keyed by the stringified primary key.
+    """
+    return get_objects_at(
+        queryset.model,
+        queryset.values_list('pk', flat=True).iterator(),
+        timestamp
+    )
@@ -0,0 +1,233 @@
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Type
+from django.core.signals import setting_changed
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models
+from django.db.models.signals import class_prepared
+from django.dispatch import receiver
+
+
+class FrozenSlots:
+    """
+        Base class of the immutable, slot based introspection descriptors.
+    """
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {getattr(self, "name", "")}>'
+
+
+class FieldDescriptor(FrozenSlots):
+    """
+        Everything the seeder, the restore engine and the serializer ask about a field.
+
+        Attributes:
+            field: The Django field or reverse relation object.
+            name, attname: The field name and its column attribute (`owner_id` for `owner`).
+            type: The class name of the field, e.g. 'CharField'.
+            concrete, auto_created, primary_key: The field flags of `_meta`.
+            null, blank, unique, db_index, max_length: The field options, None when not applicable.
+            has_default, default: Whether a default is declared, and the declared default.
+            choices: The flat choice values, or an empty tuple.
+            validators: The field validators.
+            min_value, max_value: The limits of `MinValueValidator`/`MaxValueValidator`, or None.
+            max_digits, decimal_places: The precision of decimal fields, or None.
+            is_relation, many_to_one, one_to_one, many_to_many, one_to_many: The relation kind.
+            related_model: The related model class, or None.
+            related_name: The related name of reverse relations, or None.
+            self_referential: Whether the relation points to the model itself.
+    """
+    __slots__ = (
+        'field', 'name', 'attname', 'type', 'concrete', 'auto_created', 'primary_key',
+        'null', 'blank', 'unique', 'db_index', 'max_length', 'has_default', 'default',
+        'choices', 'validators', 'min_value', 'max_value', 'max_digits', 'decimal_places',
+        'is_relation', 'many_to_one', 'one_to_one', 'many_to_many', 'one_to_many',
+        'related_model', 'related_name', 'self_referential',
+    )
+
+
+class ModelDescriptor(FrozenSlots):
+    """
+        The introspection of a model, computed once per model class.
+
+        Attributes:
+            model: The model class.
+            name, label: The model class name and its 'app_label.ModelName' label.
+            pk_name, pk_attname: The name and column attribute of the primary key.
+            fields: Every field of `_meta.get_fields()`, in the same order.
+            fields_by_name: Read only mapping of field name (and attname) to descriptor.
+            concrete_fields: The fields stored in the model's table.
+            relation_fields: The forward foreign key and one to one fields.
+            many_to_many_fields: The forward many to many fields.
+            unique_together: The field name tuples that must be unique together, from
+                `unique_together` and unconditional `UniqueConstraint`s.
+    """
+    __slots__ = (
+        'model', 'name', 'label', 'pk_name', 'pk_attname', 'fields', 'fields_by_name',
+        'concrete_fields', 'relation_fields', 'many_to_many_fields', 'unique_together',
+    )
+
+    def get_field(self, name: str) -> FieldDescriptor:
+        """
+        Returns the descriptor of a field by name or attname, like `_meta.get_field`.
+
+        Raises:
+            FieldDoesNotExist: If the model has no such field.
+        """
+        try:
+            return self.fields_by_name[name]
+        except KeyError:
+            from django.core.exceptions import FieldDoesNotExist
+            raise FieldDoesNotExist(f'{self.name} has no field named {name!r}')
+
+
+def describe_field(model: Type[models.Model], field: Any) -> FieldDescriptor:
+    """
+    Computes the descriptor of one field.
+    """
+    min_value = max_value = None
+    validators = tuple(getattr(field, 'validators', ()) or ())
+    for validator in validators:
+        if isinstance(validator, MinValueValidator):
+            min_value = validator.limit_value
+        elif isinstance(validator, MaxValueValidator):
+            max_value = validator.limit_value
+    choices = getattr(field, 'flatchoices', None) or ()
+    has_default = bool(getattr(field, 'has_default', lambda: False)())
+    related_model = field.related_model if field.is_relation else None
+    return FieldDescriptor(
+        field=field,
+        name=field.name,
+        attname=getattr(field, 'attname', field.name),
+        type=type(field).__name__,
+        concrete=bool(getattr(field, 'concrete', False)),
+        auto_created=bool(field.auto_created),
+        primary_key=bool(getattr(field, 'primary_key', False)),
+        null=getattr(field, 'null', None),
+        blank=getattr(field, 'blank', None),
+        unique=getattr(field, 'unique', None),
+        db_index=getattr(field, 'db_index', None),
+        max_length=getattr(field, 'max_length', None),
+        has_default=has_default,
+        default=field.default if has_default else None,
+        choices=tuple(value for value, _ in choices),
+        validators=validators,
+        min_value=min_value,
+        max_value=max_value,
+        max_digits=getattr(field, 'max_digits', None),
+        decimal_places=getattr(field, 'decimal_places', None),
+        is_relation=bool(field.is_relation),
+        many_to_one=bool(field.many_to_one),
+        one_to_one=bool(field.one_to_one),
+        many_to_many=bool(field.many_to_many),
+        one_to_many=bool(field.one_to_many),
+        related_model=related_model,
+        related_name=getattr(field, 'related_name', None),
+        self_referential=related_model is model,
+    )
+
+
+def describe_model(model: Type[models.Model]) -> ModelDescriptor:
+    """
+    Computes the descriptor of a model by walking `_meta.get_fields()` once.
+    """
+    opts = model._meta
+    fields = tuple(describe_field(model, field) for field in opts.get_fields())
+    by_name: Dict[str, FieldDescriptor] = {}
+    for descriptor in fields:
+        by_name.setdefault(descriptor.name, descriptor)
+        by_name.setdefault(descriptor.attname, descriptor)
+    unique_together = [tuple(names) for names in opts.unique_together]
+    for constraint in opts.constraints:
+        if isinstance(constraint, models.UniqueConstraint) and constraint.fields and \
+                getattr(constraint, 'condition', None) is None:
+            unique_together.append(tuple(constraint.fields))
+    return ModelDescriptor(
+        model=model,
+        name=model.__name__,
+        label=opts.label,
+        pk_name=opts.pk.name,
+        pk_attname=opts.pk.attname,
+        fields=fields,
+        fields_by_name=MappingProxyType(by_name),
+        concrete_fields=tuple(descriptor for descriptor in fields if descriptor.concrete),
+        relation_fields=tuple(
+            descriptor for descriptor in fields
+            if descriptor.concrete and (descriptor.many_to_one or descriptor.one_to_one)
+        ),
+        many_to_many_fields=tuple(
+            descriptor for descriptor in fields
+            if descriptor.many_to_many and not descriptor.auto_created
+        ),
+        unique_together=tuple(unique_together),
+    )
+
+
+_descriptors: Dict[Type[models.Model], ModelDescriptor] = {}
+_descriptors_lock = threading.Lock()
+
+
+def get_model_descriptor(model: Type[models.Model]) -> ModelDescriptor:
+    """
+    Returns the cached descriptor of a model, computing it on first use.
+
+    Args:
+        model (Type[models.Model]): The model class.
+
+    Returns:
+        ModelDescriptor: The frozen descriptor, shared by every caller.
+    """
+    descriptor = _descriptors.get(model)
+    if descriptor is None:
+        descriptor = describe_model(model)
+        with _descriptors_lock:
+            descriptor = _descriptors.setdefault(model, descriptor)
+    return descriptor
+
+
+def get_field_descriptor(model: Type[models.Model], name: str) -> FieldDescriptor:
+    """
+    Returns the cached descriptor of a model field by name or attname.
+    """
+    return get_model_descriptor(model).get_field(name)
+
+
+def clear_model_descriptors(model: Optional[Type[models.Model]] = None) -> None:
+    """
+    Drops the cached descriptors, of one model or of all of them.
+    """
+    with _descriptors_lock:
+        if model is None:
+            _descriptors.clear()
+        else:
+            _descriptors.pop(model, None)
+
+
+@receiver(class_prepared)
+def clear_model_descriptors_on_class_prepared(sender, **kwargs):
+    """
+    A newly registered model adds reverse relations to the models it points to, so every
+    descriptor computed so far may be missing fields.
+    """
+    clear_model_descriptors()
+
+
+@receiver(setting_changed)
+def clear_model_descriptors_on_setting_changed(setting, **kwargs):
+    """
+    The app registry is reloaded when `INSTALLED_APPS` is overridden, e.g. in tests.
+    """
+    if setting == 'INSTALLED_APPS':
+        clear_model_descriptors()
+
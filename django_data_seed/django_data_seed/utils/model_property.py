@@ -1,46 +1,34 @@
-
 from django.db import models
+from django_data_seed.utils.model_introspection import get_model_descriptor
 
 
 def get_model_properties(model: models.Model) -> dict:
     """
     Retrieve and return all properties of a Django model, including fields, types, and attributes.
+
+    The fields are read from the cached model descriptor, so `_meta` is only walked once per model.
     """
     properties = {}
 
-    # ? Get all fields of the model
-    fields = model._meta.get_fields()
-    for field in fields:
+    for descriptor in get_model_descriptor(model).fields:
+        field = descriptor.field
         # ? Convert field type to a string that is JSON serializable
-        field_type = str(type(field).__name__)
         field_info = {
-            'type': field_type,
-            'max_length': getattr(field, 'max_length', None),
-            'null': getattr(field, 'null', None),
-            'blank': getattr(field, 'blank', None),
+            'type': descriptor.type,
+            'max_length': descriptor.max_length,
+            'null': descriptor.null,
+            'blank': descriptor.blank,
             'default': None,
-            'unique': getattr(field, 'unique', None),
-            'db_index': getattr(field, 'db_index', None),
-            'related_name': getattr(field, 'related_name', None),
+            'unique': descriptor.unique,
+            'db_index': descriptor.db_index,
+            'related_name': descriptor.related_name,
             'related_model': None,
             'choices': getattr(field, 'choices', None),
         }
 
         # ? Handle related model
-        if hasattr(field, 'remote_field') and field.remote_field:
-            related_model = field.remote_field.model
-            if related_model:
-                field_info['related_model'] = related_model.__name__
-
-        # ? Ensure the default value is a string if it's not a boolean
-        if isinstance(field, models.UUIDField):
-            field_info['default'] = None
-        else:
-            # ? Ensure the default value is a string if it's not a boolean
-            if isinstance(field_info['default'], bool):
-                field_info['default'] = str(field_info['default'])
-            elif field_info['default'] is not None:
-                field_info['default'] = str(field_info['default'])
+        if descriptor.related_model:
+            field_info['related_model'] = descriptor.related_model.__name__
 
         # ? If the field has choices, get the choices and default choice
         if field_info['choices']:
@@ -48,7 +36,7 @@ def get_model_properties(model: models.Model) -> dict:
                                      for choice in field_info['choices']]
             field_info['default_choice'] = str(field_info['default'])
 
-        properties[field.name] = field_info
+        properties[descriptor.name] = field_info
 
     return {
         "model": str(model),
@@ -1,7 +1,12 @@
 from django.db import models
-from django.core.exceptions import ObjectDoesNotExist
-from typing import Any
-from django.db import transaction
+from django.core import serializers
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django_data_seed.utils.colorama_theme import StdoutTextTheme
+from django_data_seed.utils.model_introspection import get_model_descriptor
+from django_data_seed.utils.restore_utils import chunked
+
+theme = StdoutTextTheme()
 
 
 def get_model_full_path(cls: models.Model):
@@ -55,50 +60,160 @@ def load_object(model_name: str, pk: Any, data: dict):
         pk (Any): The primary key of the object to be loaded or created.
         data (dict): A dictionary containing the serialized data for the object.
     """
-    try:
-        # ? Split the model_name into app_label and model_name
-        app_label, model_name = model_name.split('.')
-
-        # ? Get the model class from the app and model name
-        model = apps.get_model(app_label, model_name)
-
-        # ? Extract primary key and fields from the data
-        fields = {}
-        many_to_many_fields = {}
-
-        for field, value in data.get('fields', {}).items():
-            field_obj = model._meta.get_field(field)
-            parsed_value = parse_value(value, field_obj)
-
-            if field_obj.many_to_many:
-                many_to_many_fields[field] = parsed_value
-            else:
-                fields[field] = parsed_value
-
-        # ? Check if an instance with this primary key already exists
-        if pk is not None:
-            try:
-                instance = model.objects.get(pk=pk)
-                # ? Update existing instance
-                for field, value in fields.items():
-                    setattr(instance, field, value)
-            except ObjectDoesNotExist:
-                # ? Create new instance if not found
-                instance = model(**fields)
+    report = load_objects([{
+        'model': model_name,
+        'pk': pk,
+        'fields': data.get('fields', {}),
+    }])
+    if report['errors']:
+        theme.stdout_error(f"Error loading object: {report['errors'][0]}")
+    else:
+        theme.stdout_success(f"Successfully loaded {model_name} with PK {pk}")
+
+
+def load_objects(
+        objects: Iterable[dict],
+        chunk_size: int = 1000,
+        batch_size: Optional[int] = None,
+        using: str = DEFAULT_DB_ALIAS
+) -> Dict[str, Any]:
+    """
+    Load serialized objects into the database in bulk.
+
+    Args:
+        objects (Iterable[dict]): `{"model", "pk", "fields"}` dictionaries, e.g. a generator
+            over a large dump. It is consumed lazily.
+        chunk_size (int): The number of objects written per transaction.
+        batch_size (Optional[int]): The batch size of the bulk queries, defaults to the database's.
+        using (str): The database alias.
+
+    Returns:
+        Dict[str, Any]: The number of `created` and `updated` objects and the `errors` of the
+        chunks that were rolled back.
+
+    Description:
+        Every chunk is one transaction. Its objects are grouped by model. The existing primary
+        keys of each group are fetched with one query, then the group is split into
+        `bulk_create` and `bulk_update` calls. Updates only write the fields present in the
+        serialized objects. Many-to-many values replace the current ones, and their through rows
+        are deleted and inserted in bulk. Multi-table inherited models are saved one object at a
+        time. Only one chunk is held in memory at a time. Bulk writes do not send
+        `pre_save`/`post_save`; use `AuditedManager` as the default manager to audit them.
+    """
+    report = {'created': 0, 'updated': 0, 'errors': []}
+    for chunk in chunked(objects, chunk_size):
+        try:
+            with transaction.atomic(using=using):
+                deserialized = serializers.deserialize('python', chunk, using=using)
+                by_model: Dict[Type[models.Model], List[Tuple[Any, frozenset]]] = {}
+                # ? the python deserializer yields one object per dictionary, in order
+                for data, item in zip(chunk, deserialized):
+                    by_model.setdefault(type(item.object), []).append(
+                        (item, frozenset(data.get('fields', {}))))
+                created, updated = 0, 0
+                for model, items in by_model.items():
+                    model_created, model_updated = load_model_objects(
+                        model, items, batch_size=batch_size, using=using)
+                    created, updated = created + model_created, updated + model_updated
+        except Exception as e:
+            report['errors'].append(str(e))
+        else:
+            report['created'] += created
+            report['updated'] += updated
+    return report
+
+
+def load_model_objects(
+        model: Type[models.Model],
+        items: List[Tuple[Any, frozenset]],
+        batch_size: Optional[int] = None,
+        using: str = DEFAULT_DB_ALIAS
+) -> Tuple[int, int]:
+    """
+    Writes the deserialized objects of one model with bulk queries.
+
+    Args:
+        model (Type[models.Model]): The model class.
+        items (List[Tuple[Any, frozenset]]): `DeserializedObject`s of the model with the names
+            of the fields present in their serialized data.
+        batch_size (Optional[int]): The batch size of the bulk queries.
+        using (str): The database alias.
+
+    Returns:
+        Tuple[int, int]: The number of created and updated objects.
+    """
+    descriptor = get_model_descriptor(model)
+    manager = model._default_manager.db_manager(using)
+    pks = [item.object.pk for item, _ in items if item.object.pk is not None]
+    existing = set(
+        model._base_manager.using(using).filter(pk__in=pks).values_list('pk', flat=True)
+    ) if pks else set()
+    # ? serialized data may name a foreign key by its attname
+    field_names = {}
+    for field in descriptor.concrete_fields:
+        if not field.primary_key and not field.many_to_many:
+            field_names[field.name] = field_names[field.attname] = field.name
+
+    to_create = []
+    # ? objects to update grouped by the fields present in their serialized data
+    to_update: Dict[Tuple[str, ...], List[models.Model]] = {}
+    for item, present in items:
+        if item.object.pk in existing:
+            update_fields = tuple(sorted({field_names[name] for name in present if name in field_names}))
+            to_update.setdefault(update_fields, []).append(item.object)
         else:
-            # ? Create new instance if no primary key is provided
-            instance = model(**fields)
-
-        # ? Save the instance in a transaction to ensure atomicity
-        with transaction.atomic():
-            instance.save()
-            # ? Handle many-to-many fields separately
-            for field, values in many_to_many_fields.items():
-                # ? Clear existing relationships and set new ones
-                getattr(instance, field).set(values)
-
-            instance.save()  # ? Save again after updating many-to-many fields
-            print(f"Successfully loaded {model_name} with PK {pk}")
-
-    except Exception as e:
-        print(f"Error loading object: {e}")
+            to_create.append(item.object)
+    updated = sum(len(objs) for objs in to_update.values())
+
+    if model._meta.parents:
+        # ? bulk queries can not write the parent tables of multi-table inheritance
+        for obj in to_create:
+            obj.save(using=using)
+        for update_fields, objs in to_update.items():
+            for obj in objs:
+                if update_fields:
+                    obj.save(using=using, update_fields=update_fields)
+    else:
+        if to_create:
+            manager.bulk_create(to_create, batch_size=batch_size)
+        for update_fields, objs in to_update.items():
+            if update_fields:
+                manager.bulk_update(objs, update_fields, batch_size=batch_size)
+
+    for field in descriptor.many_to_many_fields:
+        values = {
+            item.object.pk: item.m2m_data[field.name]
+            for item, _ in items if field.name in item.m2m_data
+        }
+        if values:
+            set_many_to_many(field.field, values, batch_size=batch_size, using=using)
+    return len(to_create), updated
+
+
+def set_many_to_many(
+        field: models.ManyToManyField,
+        values: Dict[Any, List[Any]],
+        batch_size: Optional[int] = None,
+        using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Replaces the many-to-many values of many objects with one delete and bulk inserts.
+
+    Args:
+        field (models.ManyToManyField): The many-to-many field.
+        values (Dict[Any, List[Any]]): The related primary keys keyed by the object's primary key.
+        batch_size (Optional[int]): The batch size of the bulk insert.
+        using (str): The database alias.
+    """
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name()).attname
+    target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+    through._base_manager.using(using).filter(**{f'{source}__in': list(values)}).delete()
+    through._base_manager.using(using).bulk_create(
+        [
+            through(**{source: pk, target: related_pk})
+            for pk, related_pks in values.items()
+            for related_pk in dict.fromkeys(related_pks)
+        ],
+        batch_size=batch_size
+    )
@@ -0,0 +1,210 @@
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from colorama import Fore, Style
+
+# ? the logger every console message of django_data_seed goes through
+LOGGER_NAME = 'django_data_seed'
+# ? the logger of the signal handlers, silent unless its level is lowered
+SIGNAL_LOGGER_NAME = 'django_data_seed.signals'
+
+# ? numbers are ignored when messages are compared, so "row 1" and "row 2" are similar
+SIMILARITY_PATTERN = re.compile(r'\d+')
+
+# ? colors of the message styles of `StdoutTextTheme`
+STYLES = {
+    'success': Fore.GREEN,
+    'error': Fore.RED,
+    'warning': Fore.YELLOW,
+    'info': Fore.BLUE,
+    'standard': Fore.WHITE,
+    'headers': Fore.WHITE + Style.BRIGHT,
+}
+
+
+def get_setting(name: str, default):
+    """
+    Reads a setting, falling back to the default while settings are not configured.
+    """
+    from django.conf import settings
+    if not settings.configured:
+        return default
+    return getattr(settings, name, default)
+
+
+def stream_supports_color(stream) -> bool:
+    """
+    Tells whether ANSI colors should be written to a stream.
+
+    Colors are disabled when the stream is not a terminal or `NO_COLOR` is set, and
+    `DJANGO_DATA_SEED_COLOR_OUTPUT` forces them on or off.
+    """
+    forced = get_setting('DJANGO_DATA_SEED_COLOR_OUTPUT', None)
+    if forced is not None:
+        return bool(forced)
+    if os.environ.get('NO_COLOR'):
+        return False
+    isatty = getattr(stream, 'isatty', None)
+    return bool(isatty and isatty())
+
+
+class ConsoleHandler(logging.Handler):
+    """
+        Writes django_data_seed messages to stdout.
+
+        - Messages are colored by their style only when stdout is a terminal.
+        - Writes are buffered and flushed every `capacity` records, on warnings and errors,
+          and when logging shuts down.
+        - More than `rate_limit` similar messages (equal once numbers are ignored) within
+          `rate_window` seconds are dropped, and a single "N similar messages suppressed" line
+          is written with the next similar message after the window, or when logging shuts down.
+    """
+
+    def __init__(
+            self,
+            rate_limit: int = 10,
+            rate_window: float = 1.0,
+            capacity: int = 100,
+            stream=None
+    ):
+        super().__init__()
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.capacity = capacity
+        self._stream = stream
+        self._pending = 0
+        # ? [window start, emitted, suppressed] per similar message
+        self._windows: Dict[Tuple[str, int, str], list] = {}
+        self._windows_lock = threading.Lock()
+
+    @property
+    def stream(self):
+        # ? resolved on every write so redirected stdout (tests, call_command) is honoured
+        return self._stream or sys.stdout
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        if not stream_supports_color(self.stream):
+            return message
+        color = STYLES.get(getattr(record, 'style', None))
+        if color is None:
+            color = Fore.RED if record.levelno >= logging.ERROR else (
+                Fore.YELLOW if record.levelno >= logging.WARNING else '')
+        return color + message + Style.RESET_ALL if color else message
+
+    def check_rate(self, record: logging.LogRecord) -> Tuple[bool, int]:
+        """
+        Returns whether a record may be written and how many of its similar messages were
+        suppressed in the window that just ended.
+        """
+        if not self.rate_limit:
+            return True, 0
+        key = (record.name, record.levelno, SIMILARITY_PATTERN.sub('#', str(record.msg)))
+        now = time.monotonic()
+        with self._windows_lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.rate_window:
+                suppressed = window[2] if window else 0
+                self._windows[key] = [now, 1, 0]
+                if len(self._windows) > 1024:
+                    self.prune_windows(now)
+                return True, suppressed
+            if window[1] < self.rate_limit:
+                window[1] += 1
+                return True, 0
+            window[2] += 1
+            return False, 0
+
+    def prune_windows(self, now: float) -> None:
+        expired = [
+            key for key, window in self._windows.items()
+            if now - window[0] >= self.rate_window and not window[2]
+        ]
+        for key in expired:
+            del self._windows[key]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            allowed, suppressed = self.check_rate(record)
+            if not allowed:
+                return
+            stream = self.stream
+            if suppressed:
+                stream.write(f'... {suppressed} similar messages suppressed\n')
+            stream.write(self.format(record) + '\n')
+            self._pending += 1
+            if self._pending >= self.capacity or record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._pending = 0
+            flush = getattr(self.stream, 'flush', None)
+            if flush:
+                flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.flush_suppressed()
+        self.flush()
+        super().close()
+
+    def flush_suppressed(self) -> None:
+        """
+        Writes the pending "similar messages suppressed" lines of every window.
+        """
+        with self._windows_lock:
+            windows, self._windows = self._windows, {}
+        for window in windows.values():
+            if window[2]:
+                self.stream.write(f'... {window[2]} similar messages suppressed\n')
+
+
+_configure_lock = threading.Lock()
+_configured = False
+
+
+def configure_output() -> None:
+    """
+    Attaches the console handler to the django_data_seed logger, once.
+
+    Description:
+        Nothing is attached when the project's `LOGGING` already configures the
+        `django_data_seed` logger. The level comes from `DJANGO_DATA_SEED_LOG_LEVEL`
+        (default `INFO`), the signal handlers log at `DJANGO_DATA_SEED_SIGNAL_LOG_LEVEL`
+        (default `WARNING`, which silences their per row messages) and
+        `DJANGO_DATA_SEED_LOG_RATE_LIMIT` bounds similar messages per second (0 disables).
+    """
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        logger = logging.getLogger(LOGGER_NAME)
+        if not logger.handlers:
+            logger.addHandler(ConsoleHandler(
+                rate_limit=get_setting('DJANGO_DATA_SEED_LOG_RATE_LIMIT', 10)
+            ))
+            logger.setLevel(get_setting('DJANGO_DATA_SEED_LOG_LEVEL', 'INFO'))
+            logger.propagate = False
+        signal_logger = logging.getLogger(SIGNAL_LOGGER_NAME)
+        if signal_logger.level == logging.NOTSET:
+            signal_logger.setLevel(get_setting('DJANGO_DATA_SEED_SIGNAL_LOG_LEVEL', 'WARNING'))
+        _configured = True
+
+
+def get_output_logger(name: Optional[str] = None) -> logging.Logger:
+    """
+    Returns a django_data_seed logger with the console output configured.
+    """
+    configure_output()
+    return logging.getLogger(name or LOGGER_NAME)
@@ -0,0 +1,201 @@
+import datetime
+import re
+from typing import Any, Iterator, List, Tuple, Type
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+
+def add_months(year: int, month: int, months: int) -> Tuple[int, int]:
+    """
+    Shift a `(year, month)` pair by a number of months.
+
+    Args:
+        year (int): The year of the month to shift.
+        month (int): The month (1-12) to shift.
+        months (int): The number of months to shift by, may be negative.
+
+    Returns:
+        Tuple[int, int]: The shifted `(year, month)` pair.
+    """
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+def month_start(year: int, month: int) -> datetime.datetime:
+    """
+    Returns the aware datetime at which a month starts in the current time zone.
+    """
+    moment = datetime.datetime(year, month, 1)
+    if settings.USE_TZ:
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+def partition_name(model: Type[models.Model], year: int, month: int) -> str:
+    """
+    Returns the table name of the monthly partition of an audit model.
+    """
+    return f'{model._meta.db_table}_p{year:04d}{month:02d}'
+
+
+def is_partitioned(model: Type[models.Model], using: str = 'default') -> bool:
+    """
+    Tells whether the table of a model is a PostgreSQL declaratively partitioned table.
+
+    Args:
+        model (Type[models.Model]): The audit model.
+        using (str): The database alias.
+
+    Returns:
+        bool: True if the table is partitioned, False otherwise or on other databases.
+    """
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_partitioned_table pt '
+            'JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %s',
+            [model._meta.db_table]
+        )
+        return cursor.fetchone() is not None
+
+
+def create_month_partitions(
+        model: Type[models.Model],
+        months_ahead: int = 3,
+        start: Tuple[int, int] = None,
+        using: str = 'default'
+) -> List[str]:
+    """
+    Creates the monthly partitions of a partitioned audit table.
+
+    Args:
+        model (Type[models.Model]): The audit model whose table is partitioned by `created_at`.
+        months_ahead (int): The number of months after the current one to create partitions for.
+        start (Tuple[int, int]): The first `(year, month)` to create, defaults to the current month.
+        using (str): The database alias.
+
+    Returns:
+        List[str]: The names of the partitions that were checked or created.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    now = timezone.localtime() if settings.USE_TZ else timezone.now()
+    year, month = start or (now.year, now.month)
+    last = add_months(now.year, now.month, months_ahead)
+    names = []
+    with connection.cursor() as cursor:
+        while (year, month) <= last:
+            next_year, next_month = add_months(year, month, 1)
+            name = partition_name(model, year, month)
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS {quote(name)} '
+                f'PARTITION OF {quote(model._meta.db_table)} '
+                f'FOR VALUES FROM (%s) TO (%s)',
+                [month_start(year, month), month_start(next_year, next_month)]
+            )
+            names.append(name)
+            year, month = next_year, next_month
+    return names
+
+
+def iter_pk_ranges(queryset: Any, chunk_size: int = 5000) -> Iterator[Any]:
+    """
+    Splits a queryset into consecutive primary key ranges.
+
+    Args:
+        queryset (Any): The rows to split; the model must have an integer primary key.
+        chunk_size (int): The width of every primary key range.
+
+    Returns:
+        Iterator[Any]: A generator of querysets, one per non overlapping primary key range.
+
+    Description:
+        The primary key bounds are read once up front, so rows inserted while the ranges are
+        processed are never included.
+    """
+    bounds = queryset.aggregate(lower=Min('pk'), upper=Max('pk'))
+    lower, upper = bounds['lower'], bounds['upper']
+    if lower is None:
+        return
+    while lower <= upper:
+        yield queryset.filter(pk__gte=lower, pk__lt=lower + chunk_size)
+        lower += chunk_size
+
+
+def delete_in_pk_chunks(queryset: Any, chunk_size: int = 5000) -> int:
+    """
+    Deletes the rows of a queryset in primary key ranges, one short transaction per range.
+
+    Args:
+        queryset (Any): The rows to delete; the model must have an integer primary key.
+        chunk_size (int): The width of every primary key range.
+
+    Returns:
+        int: The number of deleted rows.
+    """
+    deleted = 0
+    for chunk in iter_pk_ranges(queryset, chunk_size=chunk_size):
+        with transaction.atomic(using=queryset.db):
+            count, _ = chunk.delete()
+        deleted += count
+    return deleted
+
+
+def drop_partitions_before(
+        model: Type[models.Model],
+        year: int,
+        month: int,
+        chunk_size: int = 5000,
+        using: str = 'default'
+) -> int:
+    """
+    Removes all audit rows created before a month.
+
+    Args:
+        model (Type[models.Model]): The audit model.
+        year (int): The year of the first month to keep.
+        month (int): The first month to keep.
+        chunk_size (int): The primary key range size used when rows are deleted.
+        using (str): The database alias.
+
+    Returns:
+        int: The number of dropped partitions on PostgreSQL, otherwise the number of deleted rows.
+
+    Description:
+        On a partitioned PostgreSQL table whole monthly partitions are detached and dropped, which
+        is instant regardless of their size. Everywhere else (e.g. SQLite) the same month window is
+        removed with chunked deletes so the command behaves alike on local databases.
+    """
+    if not is_partitioned(model, using=using):
+        return delete_in_pk_chunks(
+            model.objects.using(using).filter(
+                created_at__lt=month_start(year, month)),
+            chunk_size=chunk_size
+        )
+
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    table = model._meta.db_table
+    pattern = re.compile(rf'^{re.escape(table)}_p(\d{{4}})(\d{{2}})$')
+    dropped = 0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT c.relname FROM pg_inherits i '
+            'JOIN pg_class c ON c.oid = i.inhrelid '
+            'JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s',
+            [table]
+        )
+        partitions = [row[0] for row in cursor.fetchall()]
+        for name in sorted(partitions):
+            match = pattern.match(name)
+            if not match or (int(match.group(1)), int(match.group(2))) >= (year, month):
+                continue
+            cursor.execute(
+                f'ALTER TABLE {quote(table)} DETACH PARTITION {quote(name)}')
+            cursor.execute(f'DROP TABLE {quote(name)}')
+            dropped += 1
+    return dropped
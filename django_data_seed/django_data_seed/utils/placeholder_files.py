@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import posixpath
+import random
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.validators import FileExtensionValidator
+from django.db import models
+
+# ? distinct placeholder files written per field, every seeded row references one of them
+DEFAULT_PLACEHOLDER_FILES = 8
+# ? threads writing the placeholder files of a field to its storage
+PLACEHOLDER_WRITE_WORKERS = 4
+# ? the sides of placeholder images in pixels, used in turn
+IMAGE_SIZES = (32, 64, 128, 256)
+TEXT_EXTENSIONS = ('txt', 'csv', 'md', 'html', 'xml')
+# ? the size of placeholder files whose type is unknown
+BINARY_PLACEHOLDER_SIZE = 1024
+# ? the directory of placeholder files whose upload_to callable needs an instance
+FALLBACK_UPLOAD_DIRECTORY = 'django_data_seed'
+
+
+def get_placeholder_count() -> int:
+    """
+    Returns the `DJANGO_DATA_SEED_PLACEHOLDER_FILES` setting, 8 by default.
+    """
+    count = getattr(settings, 'DJANGO_DATA_SEED_PLACEHOLDER_FILES', DEFAULT_PLACEHOLDER_FILES)
+    if not isinstance(count, int) or count < 1:
+        raise ValueError('DJANGO_DATA_SEED_PLACEHOLDER_FILES must be a positive integer')
+    return count
+
+
+def get_placeholder_extension(field: models.FileField) -> str:
+    """
+    Returns the extension of the placeholder files of a field: png for images and txt for other
+    files, or the first extension a `FileExtensionValidator` of the field allows.
+    """
+    preferred = 'png' if isinstance(field, models.ImageField) else 'txt'
+    for validator in field.validators:
+        if isinstance(validator, FileExtensionValidator) and validator.allowed_extensions:
+            extensions = [extension.lower() for extension in validator.allowed_extensions]
+            return preferred if preferred in extensions else extensions[0]
+    return preferred
+
+
+def png_bytes(width: int, height: int, color: tuple) -> bytes:
+    """
+    Encodes a solid color RGB image as PNG, without any imaging library.
+    """
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+    row = b'\x00' + bytes(color) * width
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+        + chunk(b'IDAT', zlib.compress(row * height))
+        + chunk(b'IEND', b'')
+    )
+
+
+def make_placeholder(extension: str, index: int) -> bytes:
+    """
+    Returns the content of the `index`th placeholder file of a type.
+    """
+    from django_data_seed.management.commands.fields import fake
+
+    if extension == 'png':
+        side = IMAGE_SIZES[index % len(IMAGE_SIZES)]
+        return png_bytes(side, side, tuple(random.randint(0, 255) for _ in range(3)))
+    if extension == 'json':
+        return json.dumps({'title': fake.sentence(), 'text': fake.text()}).encode()
+    if extension in TEXT_EXTENSIONS:
+        return fake.text(max_nb_chars=200 * (index % 4 + 1)).encode()
+    return os.urandom(BINARY_PLACEHOLDER_SIZE)
+
+
+def get_upload_name(field: models.FileField, filename: str) -> str:
+    """
+    Returns the storage name of a file as the field would name an upload.
+    """
+    try:
+        return field.generate_filename(None, filename)
+    except Exception:
+        # ? upload_to callables may need the model instance
+        return field.storage.generate_filename(posixpath.join(FALLBACK_UPLOAD_DIRECTORY, filename))
+
+
+def write_placeholder(field: models.FileField, name: str, content: bytes) -> str:
+    """
+    Writes a placeholder file unless it already exists, and returns its storage name.
+    """
+    if field.storage.exists(name):
+        # ? names are content hashes, an existing file has the same content
+        return name
+    return field.storage.save(name, ContentFile(content), max_length=field.max_length)
+
+
+def create_placeholder_files(
+        field: models.FileField,
+        count: Optional[int] = None,
+        workers: int = PLACEHOLDER_WRITE_WORKERS
+) -> List[str]:
+    """
+    Writes the placeholder files of a field to its storage and returns their names.
+
+    Args:
+        field (models.FileField): The FileField or ImageField.
+        count (Optional[int]): The number of placeholder files, see `get_placeholder_count`.
+        workers (int): The number of threads writing the files.
+
+    Returns:
+        List[str]: The storage names of the files.
+
+    Description:
+        Files are named after the SHA-256 of their content, so identical placeholders are
+        written once and files written by previous runs are reused as is.
+    """
+    extension = get_placeholder_extension(field)
+    blobs = {}
+    for index in range(count or get_placeholder_count()):
+        content = make_placeholder(extension, index)
+        blobs.setdefault(hashlib.sha256(content).hexdigest(), content)
+    names = [get_upload_name(field, f'seed-{digest[:16]}.{extension}') for digest in blobs]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            lambda name, content: write_placeholder(field, name, content), names, blobs.values()
+        ))
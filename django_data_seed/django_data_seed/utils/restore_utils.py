@@ -0,0 +1,260 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from django.apps import apps
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import connection, models, transaction
+from django.db.models.functions import Cast
+from django_data_seed.utils.admin_utils import (
+    handle_related_fields,
+    update_or_create_instance
+)
+from django_data_seed.utils.seed_profile import sort_by_dependency
+
+
+def filter_backups(
+        queryset: Any,
+        model_name: Optional[str] = None,
+        object_id_from: Optional[str] = None,
+        object_id_to: Optional[str] = None,
+        user_id: Optional[Any] = None,
+        created_from: Optional[Any] = None,
+        created_to: Optional[Any] = None
+) -> Any:
+    """
+    Narrow a queryset of `DjangoSeedDataBackUpModel` rows down to the requested restore window.
+
+    Args:
+        queryset (Any): The queryset of backup entries to filter.
+        model_name (Optional[str]): Only keep backups of this model class name.
+        object_id_from (Optional[str]): Inclusive lower bound of the backed up object id.
+        object_id_to (Optional[str]): Inclusive upper bound of the backed up object id.
+        user_id (Optional[Any]): Only keep backups of objects deleted by this user id.
+        created_from (Optional[Any]): Only keep backups created at or after this datetime.
+        created_to (Optional[Any]): Only keep backups created at or before this datetime.
+
+    Returns:
+        Any: The filtered queryset.
+
+    Description:
+        `object_id` is stored as text, so numeric bounds are compared on the casted value
+        to keep `9 < 10`; any other bounds are compared as strings.
+    """
+    if model_name:
+        queryset = queryset.filter(model_name=model_name)
+    bounds = [bound for bound in (object_id_from, object_id_to) if bound is not None]
+    if bounds:
+        if all(str(bound).isdigit() for bound in bounds):
+            queryset = queryset.annotate(
+                object_id_number=Cast('object_id', models.BigIntegerField())
+            )
+            lookup, cast = 'object_id_number', int
+        else:
+            lookup, cast = 'object_id', str
+        if object_id_from is not None:
+            queryset = queryset.filter(**{f'{lookup}__gte': cast(object_id_from)})
+        if object_id_to is not None:
+            queryset = queryset.filter(**{f'{lookup}__lte': cast(object_id_to)})
+    if user_id is not None:
+        queryset = queryset.filter(deleted_by_id=user_id)
+    if created_from is not None:
+        queryset = queryset.filter(created_at__gte=created_from)
+    if created_to is not None:
+        queryset = queryset.filter(created_at__lte=created_to)
+    return queryset
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterable[List[Any]]:
+    """
+    Split an iterable into lists of at most `size` items without materialising it.
+
+    Args:
+        iterable (Iterable[Any]): The items to split.
+        size (int): The maximum length of every chunk.
+
+    Returns:
+        Iterable[List[Any]]: A generator of chunks.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def restore_entry(entry: Dict[str, Any]) -> None:
+    """
+    Restore a single serialized backup entry into its original model.
+
+    Args:
+        entry (Dict[str, Any]): The serialized data with 'model', 'pk' and 'fields' keys.
+
+    Raises:
+        LookupError: If the model of the entry is not installed.
+        ObjectDoesNotExist: If a related instance of the entry does not exist.
+    """
+    model = apps.get_model(entry['model'])
+    fields = handle_related_fields(model, entry['fields'])
+    update_or_create_instance(model, entry['pk'], fields)
+
+
+def restore_backup_stream(
+        queryset: Any,
+        chunk_size: int = 2000,
+        batch_size: int = 500,
+        should_delete: bool = True,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Stream backup rows from the database and restore them in batched transactions.
+
+    Args:
+        queryset (Any): The queryset of backup entries to restore.
+        chunk_size (int): The number of rows fetched per database round trip.
+        batch_size (int): The number of rows restored per transaction.
+        should_delete (bool): Whether to delete backup rows that were restored successfully.
+        progress (Optional[Callable]): Called with the running stats after every batch.
+
+    Returns:
+        Dict[str, Any]: The number of restored, failed and deleted rows and the error messages.
+
+    Description:
+        Rows are read with `.iterator(chunk_size=...)` so memory stays flat regardless of the
+        selection size. Every row is restored inside its own savepoint, which lets a broken row
+        (missing related instance, unknown model) fail alone without rolling back its batch.
+        Restored backup rows are deleted in `chunk_size` sized chunks once the stream is drained,
+        so the cursor never reads a table that is being deleted from.
+    """
+    stats = {'restored': 0, 'failed': 0, 'deleted': 0, 'errors': []}
+    restored_pks = []
+    rows = queryset.order_by('pk').only('pk', 'data').iterator(chunk_size=chunk_size)
+    for batch in chunked(rows, batch_size):
+        with transaction.atomic():
+            for backup in batch:
+                try:
+                    with transaction.atomic():
+                        restore_entry(backup.data)
+                except LookupError:
+                    stats['errors'].append(
+                        f"Error: Model {backup.data.get('model')} not found")
+                    stats['failed'] += 1
+                except ObjectDoesNotExist as e:
+                    stats['errors'].append(f'Error: {str(e)}')
+                    stats['failed'] += 1
+                except Exception as e:
+                    stats['errors'].append(f'Error: backup {backup.pk}: {str(e)}')
+                    stats['failed'] += 1
+                else:
+                    restored_pks.append(backup.pk)
+                    stats['restored'] += 1
+        if progress:
+            progress(stats)
+
+    if should_delete:
+        model = queryset.model
+        for pks in chunked(restored_pks, chunk_size):
+            with transaction.atomic():
+                deleted, _ = model.objects.filter(pk__in=pks).delete()
+            stats['deleted'] += deleted
+    return stats
+
+
+def order_model_names(model_names: List[str]) -> List[str]:
+    """
+    Sort backed up model names so every parent is restored before its children.
+
+    Args:
+        model_names (List[str]): The model class names of the backups, in name order.
+
+    Returns:
+        List[str]: The model names, parents first.
+
+    Description:
+        Names are resolved against the installed models; names that are unknown or shared by
+        several apps keep their place after the resolved models. The first foreign key of every
+        cycle is ignored until the models sort, its rows point to instances that are either
+        restored or already present.
+    """
+    classes = {}
+    for model in apps.get_models():
+        classes.setdefault(model.__name__, []).append(model)
+    resolved = {
+        model_name: classes[model_name][0]
+        for model_name in model_names if len(classes.get(model_name, ())) == 1
+    }
+    ignored = set()
+
+    def get_parents(model: Any) -> List[tuple]:
+        return [
+            (field, field.related_model) for field in model._meta.concrete_fields
+            if field.many_to_one or field.one_to_one
+            if field not in ignored
+        ]
+
+    while True:
+        ordered, cycle = sort_by_dependency(resolved.values(), get_parents)
+        if cycle is None:
+            break
+        ignored.add(cycle[0])
+    return [model.__name__ for model in ordered] + [
+        model_name for model_name in model_names if model_name not in resolved
+    ]
+
+
+def restore_backups_by_model(
+        queryset: Any,
+        workers: int = 1,
+        chunk_size: int = 2000,
+        batch_size: int = 500,
+        should_delete: bool = True,
+        progress: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Restore a backup queryset model by model, optionally in parallel.
+
+    Args:
+        queryset (Any): The (already filtered) queryset of backup entries.
+        workers (int): The number of models restored concurrently.
+        chunk_size (int): The number of rows fetched per database round trip.
+        batch_size (int): The number of rows restored per transaction.
+        should_delete (bool): Whether to delete backup rows that were restored successfully.
+        progress (Optional[Callable]): Called with the model name and its running stats.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The restore stats keyed by model name.
+
+    Description:
+        Each worker thread opens its own database connection and closes it when its model is
+        done. With a single worker the models are restored parents first (see
+        `order_model_names`); parallel workers restore them in any order, so models that
+        reference each other should be restored with a single worker.
+    """
+    model_names = list(
+        queryset.order_by('model_name').values_list('model_name', flat=True).distinct()
+    )
+
+    def run(model_name: str) -> Dict[str, Any]:
+        try:
+            return restore_backup_stream(
+                queryset.filter(model_name=model_name),
+                chunk_size=chunk_size,
+                batch_size=batch_size,
+                should_delete=should_delete,
+                progress=(lambda stats: progress(model_name, stats)) if progress else None
+            )
+        finally:
+            if workers > 1:
+                connection.close()
+
+    if workers <= 1:
+        return {model_name: run(model_name) for model_name in order_model_names(model_names)}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run, model_name): model_name for model_name in model_names
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
@@ -0,0 +1,248 @@
+import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Count, Func, Max, Sum
+from django.db.models.functions import Cast
+from django.utils import timezone
+from django_data_seed.utils.log_entry_utils import clear_reconstruction_cache
+from django_data_seed.utils.partition_utils import iter_pk_ranges
+
+DEFAULT_POLICY_KEY = '*'
+
+
+def get_retention_policy(model_name: str, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Resolves the retention policy of an audited model.
+
+    Args:
+        model_name (str): The model class name as stored in the audit tables.
+        overrides (Optional[Dict[str, Any]]): Values that take precedence over the settings, e.g. from the command line.
+
+    Returns:
+        Dict[str, Any]: The policy with `max_age_days` and `max_versions` keys; None disables a rule.
+
+    Description:
+        Policies are read from `DJANGO_DATA_SEED_RETENTION_POLICIES`, a dictionary keyed by model
+        class name whose `'*'` entry applies to every model.
+    """
+    policies = getattr(settings, 'DJANGO_DATA_SEED_RETENTION_POLICIES', {}) or {}
+    policy = {'max_age_days': None, 'max_versions': None}
+    policy.update(policies.get(DEFAULT_POLICY_KEY, {}))
+    policy.update(policies.get(model_name, {}))
+    policy.update({
+        key: value for key, value in (overrides or {}).items() if value is not None
+    })
+    return policy
+
+
+class OctetLength(Func):
+    """
+    The length of a text expression in bytes, where `Length` counts characters.
+    """
+    function = 'OCTET_LENGTH'
+    output_field = models.IntegerField()
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        # ? a text cast to BLOB keeps its UTF-8 bytes
+        return self.as_sql(
+            compiler, connection, template='LENGTH(CAST(%(expressions)s AS BLOB))', **extra_context)
+
+    def as_oracle(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function='LENGTHB', **extra_context)
+
+
+def measure_bytes(queryset: Any, fields: Iterable[str]) -> int:
+    """
+    Returns the size in bytes of the serialized JSON columns of a queryset.
+    """
+    aggregates = {
+        field: Sum(OctetLength(Cast(field, models.TextField()))) for field in fields
+    }
+    return sum(value or 0 for value in queryset.aggregate(**aggregates).values())
+
+
+def delete_expired_rows(
+        queryset: Any,
+        cutoff: datetime.datetime,
+        fields: Iterable[str],
+        chunk_size: int = 5000,
+        dry_run: bool = False
+) -> Tuple[int, int]:
+    """
+    Deletes the rows created before a cutoff in primary key chunks.
+
+    Args:
+        queryset (Any): The audit rows of one model.
+        cutoff (datetime.datetime): Rows created before this moment are deleted.
+        fields (Iterable[str]): The JSON columns whose size is reported.
+        chunk_size (int): The width of every primary key range.
+        dry_run (bool): Only measure what would be deleted.
+
+    Returns:
+        Tuple[int, int]: The number of deleted rows and their size in bytes.
+    """
+    rows, size = 0, 0
+    for chunk in iter_pk_ranges(queryset.filter(created_at__lt=cutoff), chunk_size=chunk_size):
+        with transaction.atomic(using=queryset.db):
+            chunk_bytes = measure_bytes(chunk, fields)
+            if dry_run:
+                count = chunk.count()
+            else:
+                count, _ = chunk.delete()
+        rows += count
+        size += chunk_bytes
+    return rows, size
+
+
+def get_objects_over_limit(queryset: Any, max_versions: int) -> List[str]:
+    """
+    Returns the object ids that have more than `max_versions` rows in a queryset.
+
+    The ids are fetched up front because the rows of those objects are rewritten afterwards.
+    """
+    return list(
+        queryset.order_by().values('object_id').annotate(
+            versions=Count('pk')
+        ).filter(versions__gt=max_versions).values_list('object_id', flat=True)
+    )
+
+
+def collapse_log_entry_versions(
+        queryset: Any,
+        max_versions: int,
+        dry_run: bool = False
+) -> Tuple[int, int]:
+    """
+    Collapses the oldest log entries of every object into one snapshot so at most
+    `max_versions` entries per object remain.
+
+    Args:
+        queryset (Any): The log entries of one model.
+        max_versions (int): The number of entries to keep per object.
+        dry_run (bool): Only measure what would be collapsed.
+
+    Returns:
+        Tuple[int, int]: The number of removed entries and their size in bytes.
+
+    Description:
+        The oldest run of entries is merged into its newest member, which takes over the
+        `before_mutation` of the first one, so the history still spans from the earliest known
+        state to the latest. Entries still waiting for their `after_mutation` are left alone.
+    """
+    rows, size = 0, 0
+    queryset = queryset.filter(after_mutation__isnull=False)
+    for object_id in get_objects_over_limit(queryset, max_versions):
+        with transaction.atomic(using=queryset.db):
+            entries = list(
+                queryset.select_for_update().filter(object_id=object_id).order_by(
+                    'created_at', 'pk'
+                ).values_list('pk', flat=True)
+            )
+            run = entries[:len(entries) - max_versions + 1]
+            if len(run) < 2:
+                continue
+            removed = queryset.filter(pk__in=run[:-1])
+            size += measure_bytes(removed, ['before_mutation', 'after_mutation'])
+            rows += len(run) - 1
+            if dry_run:
+                continue
+            first_before = queryset.filter(pk=run[0]).values_list(
+                'before_mutation', flat=True).get()
+            queryset.filter(pk=run[-1]).update(before_mutation=first_before)
+            removed.delete()
+    return rows, size
+
+
+def prune_backup_versions(
+        queryset: Any,
+        max_versions: int,
+        dry_run: bool = False
+) -> Tuple[int, int]:
+    """
+    Deletes all but the newest `max_versions` backups of every object.
+
+    Args:
+        queryset (Any): The backups of one model.
+        max_versions (int): The number of backups to keep per object.
+        dry_run (bool): Only measure what would be deleted.
+
+    Returns:
+        Tuple[int, int]: The number of deleted backups and their size in bytes.
+    """
+    rows, size = 0, 0
+    for object_id in get_objects_over_limit(queryset, max_versions):
+        with transaction.atomic(using=queryset.db):
+            stale = list(
+                queryset.filter(object_id=object_id).order_by(
+                    '-created_at', '-pk'
+                ).values_list('pk', flat=True)[max_versions:]
+            )
+            removed = queryset.filter(pk__in=stale)
+            size += measure_bytes(removed, ['data'])
+            rows += len(stale)
+            if not dry_run:
+                removed.delete()
+    return rows, size
+
+
+def compact_audit_model(
+        model: Type[models.Model],
+        model_name: Optional[str] = None,
+        overrides: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 5000,
+        dry_run: bool = False
+) -> Dict[str, Dict[str, int]]:
+    """
+    Applies the retention policies to one audit table.
+
+    Args:
+        model (Type[models.Model]): `DjangoSeedDataBackUpModel` or `DjangoSeedDataLogEntryModel`.
+        model_name (Optional[str]): Only compact the rows of this audited model.
+        overrides (Optional[Dict[str, Any]]): Policy values that take precedence over the settings.
+        chunk_size (int): The width of the primary key ranges used for age based deletes.
+        dry_run (bool): Only report what would be reclaimed.
+
+    Returns:
+        Dict[str, Dict[str, int]]: The reclaimed `rows` and `bytes` keyed by audited model name.
+
+    Description:
+        Only rows that existed when the run started are considered, so rows written concurrently
+        are never touched, and every chunk or object is handled in its own short transaction.
+    """
+    json_fields = [
+        field.name for field in model._meta.concrete_fields
+        if isinstance(field, models.JSONField)
+    ]
+    upper_pk = model.objects.aggregate(upper=Max('pk'))['upper']
+    report = {}
+    if upper_pk is None:
+        return report
+    queryset = model.objects.filter(pk__lte=upper_pk)
+    if model_name:
+        model_names = [model_name]
+    else:
+        model_names = list(
+            queryset.order_by('model_name').values_list('model_name', flat=True).distinct()
+        )
+    for name in model_names:
+        policy = get_retention_policy(name, overrides)
+        rows, size = 0, 0
+        model_queryset = queryset.filter(model_name=name)
+        if policy['max_age_days'] is not None:
+            cutoff = timezone.now() - datetime.timedelta(days=policy['max_age_days'])
+            deleted_rows, deleted_size = delete_expired_rows(
+                model_queryset, cutoff, json_fields, chunk_size=chunk_size, dry_run=dry_run)
+            rows, size = rows + deleted_rows, size + deleted_size
+        if policy['max_versions'] is not None:
+            if 'after_mutation' in json_fields:
+                pruned_rows, pruned_size = collapse_log_entry_versions(
+                    model_queryset, policy['max_versions'], dry_run=dry_run)
+            else:
+                pruned_rows, pruned_size = prune_backup_versions(
+                    model_queryset, policy['max_versions'], dry_run=dry_run)
+            rows, size = rows + pruned_rows, size + pruned_size
+        report[name] = {'rows': rows, 'bytes': size}
+    if not dry_run:
+        clear_reconstruction_cache()
+    return report
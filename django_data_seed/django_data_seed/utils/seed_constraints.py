@@ -0,0 +1,409 @@
+import math
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Type
+from django.core.exceptions import ValidationError
+from django.core.validators import (
+    DecimalValidator,
+    MaxLengthValidator,
+    MaxValueValidator,
+    MinValueValidator
+)
+from django.db import DEFAULT_DB_ALIAS, models
+from django_data_seed.utils.model_introspection import FieldDescriptor, get_model_descriptor
+from django_data_seed.utils.seed_profile import (
+    ModelPlan,
+    SeedPlan,
+    SeedProfileError,
+    get_cyclic_relations,
+    get_seeded_fields
+)
+
+# ? rows generated in memory to check custom validators and check constraints
+PROBE_SIZE = 10
+# ? validators the generated values are adjusted to, instead of being probed
+ADJUSTED_VALIDATORS = (MaxLengthValidator, MinValueValidator, MaxValueValidator, DecimalValidator)
+# ? attempts at regenerating the columns of a taken unique tuple, the first half leaves the
+# ? foreign keys alone
+MAX_UNIQUE_RETRIES = 100
+# ? rows streamed per fetch while the existing unique tuples are read
+UNIQUE_PRELOAD_CHUNK_SIZE = 10000
+
+
+class SeedConstraintError(SeedProfileError):
+    """
+        Raised when the planned rows can not satisfy the constraints of their model.
+    """
+
+
+@lru_cache(maxsize=None)
+def value_adjuster(field: models.Field) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns a function adjusting generated values to the limits of a field, or None.
+
+    Description:
+        Strings are truncated to `max_length`, decimals are rounded to `decimal_places` and
+        clamped to `max_digits`, and values are clamped to the limits of `MinValueValidator` and
+        `MaxValueValidator`. Computed once per field.
+    """
+    steps = []
+    # ? UUID and binary fields also declare a max_length, of their stored form
+    max_length = field.max_length if isinstance(field, (models.CharField, models.TextField)) else None
+    if max_length:
+        steps.append(lambda value: value[:max_length] if isinstance(value, str) else value)
+    if isinstance(field, models.DecimalField) and field.max_digits is not None:
+        places = field.decimal_places or 0
+        exponent = Decimal(1).scaleb(-places)
+        largest = Decimal(10) ** (field.max_digits - places) - exponent
+
+        def fit_decimal(value):
+            value = Decimal(str(value)).quantize(exponent)
+            return max(-largest, min(largest, value))
+        steps.append(fit_decimal)
+    for validator in field.validators:
+        limit = validator.limit_value if isinstance(
+            validator, (MinValueValidator, MaxValueValidator)) else None
+        if limit is None or callable(limit):
+            continue
+        clamp = max if isinstance(validator, MinValueValidator) else min
+
+        def fit_limit(value, limit=limit, clamp=clamp):
+            try:
+                return clamp(value, limit)
+            except TypeError:
+                return value
+        steps.append(fit_limit)
+    if not steps:
+        return None
+
+    def adjust(value):
+        if value is None:
+            return value
+        for step in steps:
+            value = step(value)
+        return value
+    return adjust
+
+
+def constrain(generate: Callable[[], Any], field: models.Field) -> Callable[[], Any]:
+    """
+    Wraps a value generator so its values satisfy the limits of the field.
+    """
+    adjust = value_adjuster(field)
+    if adjust is None:
+        return generate
+    return lambda: adjust(generate())
+
+
+def check_value(descriptor: FieldDescriptor, value: Any, where: str) -> None:
+    """
+    Validates a value declared in a profile once, instead of failing on every inserted row.
+    """
+    if value is None:
+        if not descriptor.null:
+            raise SeedConstraintError(f'{where}: {descriptor.name} is not nullable')
+        return
+    field = descriptor.field
+    try:
+        field.run_validators(field.to_python(value))
+    except ValidationError as e:
+        raise SeedConstraintError(f'{where}: {value!r} is invalid, {"; ".join(e.messages)}')
+
+
+def get_custom_validators(field: models.Field) -> list:
+    """
+    Returns the validators declared on a field that generated values are not adjusted to.
+    """
+    return [
+        validator for validator in getattr(field, '_validators', ())
+        if not isinstance(validator, ADJUSTED_VALIDATORS)
+    ]
+
+
+def get_check_constraints(model: Type[models.Model]) -> list:
+    return [
+        constraint for constraint in model._meta.constraints
+        if isinstance(constraint, models.CheckConstraint)
+    ]
+
+
+def get_unique_sets(model: Type[models.Model]) -> List[tuple]:
+    """
+    Returns the field name tuples that must be unique: unique fields, `unique_together` and
+    unconditional `UniqueConstraint`s.
+    """
+    descriptor = get_model_descriptor(model)
+    sets = [
+        (field.name,) for field in descriptor.concrete_fields
+        if field.unique and not field.primary_key
+    ]
+    return sets + [tuple(names) for names in descriptor.unique_together]
+
+
+class UniqueTuples:
+    """
+        The in-memory index of the composite unique constraints of a model, so generated rows
+        are deduplicated without querying the database.
+
+        Attributes:
+            model: The model class.
+            columns: The column attribute names of every composite unique set, from
+                `unique_together` and unconditional `UniqueConstraint`s.
+            relations: The column attribute names of foreign keys.
+            seen: The value tuples taken per unique set, existing rows included.
+    """
+    __slots__ = ('model', 'columns', 'relations', 'seen')
+
+    def __init__(self, model: Type[models.Model], using: Optional[str] = None):
+        descriptor = get_model_descriptor(model)
+        self.model = model
+        self.columns = [
+            tuple(descriptor.get_field(name).attname for name in names)
+            for names in get_unique_sets(model) if len(names) > 1
+        ]
+        self.relations = frozenset(
+            field.attname for field in descriptor.relation_fields)
+        self.seen = [set() for _ in self.columns]
+        if using is not None:
+            self.preload(using)
+
+    def __bool__(self):
+        return bool(self.columns)
+
+    def preload(self, using: str = DEFAULT_DB_ALIAS) -> None:
+        """
+        Reads the tuples of the existing rows, one streamed query per unique set.
+        """
+        queryset = self.model._base_manager.using(using)
+        for columns, seen in zip(self.columns, self.seen):
+            rows = queryset.values_list(*columns).iterator(chunk_size=UNIQUE_PRELOAD_CHUNK_SIZE)
+            # ? NULLs never conflict
+            seen.update(row for row in rows if None not in row)
+
+    def conflict(self, values: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Returns the columns of the first unique set whose tuple is already taken, or None.
+        """
+        for columns, seen in zip(self.columns, self.seen):
+            if tuple(values.get(column) for column in columns) in seen:
+                return columns
+        return None
+
+    def claim(
+            self,
+            values: Dict[str, Any],
+            regenerators: Dict[str, Callable[[], Any]]
+    ) -> Dict[str, Any]:
+        """
+        Regenerates the conflicting columns of a row until its unique tuples are free, then
+        takes them.
+
+        Args:
+            values (Dict[str, Any]): The row values keyed by column attribute name, updated in
+                place.
+            regenerators (Dict[str, Callable[[], Any]]): The callables drawing a new value of the
+                columns that can be regenerated. Foreign keys are only redrawn after half of the
+                attempts failed.
+
+        Returns:
+            Dict[str, Any]: The row values.
+
+        Raises:
+            SeedConstraintError: If no free tuple was found in `MAX_UNIQUE_RETRIES` attempts.
+        """
+        for attempt in range(MAX_UNIQUE_RETRIES + 1):
+            columns = self.conflict(values)
+            if columns is None:
+                for columns, seen in zip(self.columns, self.seen):
+                    key = tuple(values.get(column) for column in columns)
+                    if None not in key:
+                        seen.add(key)
+                return values
+            retry = [column for column in columns if column in regenerators]
+            if attempt < MAX_UNIQUE_RETRIES // 2:
+                retry = [column for column in retry if column not in self.relations] or retry
+            if not retry:
+                break
+            for column in retry:
+                values[column] = regenerators[column]()
+        raise SeedConstraintError(
+            f'{self.model._meta.label}: could not generate a free ({", ".join(columns)}) tuple '
+            f'in {MAX_UNIQUE_RETRIES} attempts')
+
+
+def requires_value(descriptor: FieldDescriptor) -> bool:
+    """
+    Tells whether inserting a row without a value for the field fails.
+    """
+    field = descriptor.field
+    has_db_default = getattr(field, 'db_default', models.NOT_PROVIDED) is not models.NOT_PROVIDED
+    return not descriptor.null and not descriptor.has_default and not has_db_default
+
+
+def check_required_fields(plan: ModelPlan) -> None:
+    """
+    Fails when a field that needs a value has no generator.
+    """
+    relations = {foreign_key.field.name for foreign_key in plan.foreign_keys}
+    for field in get_seeded_fields(plan.model):
+        if field.name in plan.values or field.name in relations:
+            continue
+        if requires_value(field):
+            raise SeedConstraintError(
+                f'{plan.label}.{field.name}: no generator supports {field.type} and the field has '
+                'no default, add a value, choices or faker override')
+
+
+def check_foreign_keys(plan: ModelPlan, parent_counts: Dict[models.Field, int]) -> None:
+    """
+    Fails when non nullable foreign keys have no parents, or when one to one and fixed fan out
+    foreign keys need more parents than there will be.
+    """
+    for foreign_key in plan.foreign_keys:
+        where = f'{plan.label}.{foreign_key.field.name}'
+        parents = parent_counts[foreign_key.field]
+        if not parents:
+            if plan.count and not foreign_key.field.null:
+                raise SeedConstraintError(
+                    f'{where}: no {foreign_key.parent._meta.label} rows to point to, seed them '
+                    'first or add them to the profile')
+            continue
+        if foreign_key.strategy == 'fixed':
+            needed = -(-plan.count // (foreign_key.fan_out or 1))
+            if needed > parents:
+                raise SeedConstraintError(
+                    f'{where} needs {needed} {foreign_key.parent._meta.label} rows, only '
+                    f'{parents} will exist')
+
+
+def check_unique_sets(
+        plan: ModelPlan,
+        parent_counts: Dict[models.Field, int]
+) -> None:
+    """
+    Fails when the values of a unique field set can not form `count` distinct combinations.
+    """
+    domains = dict(plan.domains)
+    for foreign_key in plan.foreign_keys:
+        domains[foreign_key.field.name] = parent_counts[foreign_key.field]
+    for names in get_unique_sets(plan.model):
+        sizes = [domains.get(name) for name in names]
+        if any(size is None for size in sizes):
+            continue
+        combinations = math.prod(sizes)
+        if combinations < plan.count:
+            raise SeedConstraintError(
+                f'{plan.label}: ({", ".join(names)}) must be unique but the profile can only '
+                f'produce {combinations} distinct values for {plan.count} rows')
+
+
+def probe_model_plan(plan: ModelPlan, using: str = DEFAULT_DB_ALIAS, size: int = PROBE_SIZE) -> None:
+    """
+    Generates a few rows in memory and checks them against the custom field validators and the
+    check constraints of the model, so systematic violations fail before anything is inserted.
+
+    Description:
+        Only models with custom validators or check constraints are probed. Foreign keys are left
+        out, as are the constraints that reference them.
+    """
+    validators = {
+        name: get_custom_validators(get_model_descriptor(plan.model).get_field(name).field)
+        for name in plan.values
+    }
+    validators = {name: checks for name, checks in validators.items() if checks}
+    constraints = get_check_constraints(plan.model)
+    if not plan.count or not (validators or constraints):
+        return
+    exclude = {foreign_key.field.attname for foreign_key in plan.foreign_keys} | {
+        foreign_key.field.name for foreign_key in plan.foreign_keys}
+    for _ in range(min(size, plan.count)):
+        instance = plan.model(**{name: generate() for name, generate in plan.values.items()})
+        for name, checks in validators.items():
+            value = getattr(instance, name)
+            for validator in checks if value is not None else ():
+                try:
+                    validator(value)
+                except ValidationError as e:
+                    raise SeedConstraintError(
+                        f'{plan.label}.{name}: generated {value!r} is invalid, '
+                        f'{"; ".join(e.messages)}, add an override that satisfies it')
+        for constraint in constraints:
+            try:
+                constraint.validate(plan.model, instance, exclude=exclude, using=using)
+            except ValidationError:
+                raise SeedConstraintError(
+                    f'{plan.label}: generated rows violate the check constraint '
+                    f'{constraint.name!r}, add overrides that satisfy it')
+
+
+def get_parent_counts(plan: SeedPlan, using: str = DEFAULT_DB_ALIAS) -> Dict[models.Field, int]:
+    """
+    Returns the number of parents every foreign key of the plan can point to, keyed by field: the
+    planned rows of planned parents, the existing rows of the others (one count per model).
+    """
+    planned = {model_plan.model: model_plan.count for model_plan in plan}
+    existing, counts = {}, {}
+    for model_plan in plan:
+        for foreign_key in model_plan.foreign_keys:
+            parent = foreign_key.parent
+            if parent in planned and (parent is not model_plan.model or foreign_key.deferred):
+                counts[foreign_key.field] = planned[parent]
+                continue
+            if parent not in existing:
+                existing[parent] = parent._base_manager.using(using).count()
+            counts[foreign_key.field] = existing[parent]
+    return counts
+
+
+def check_plan(plan: SeedPlan, using: str = DEFAULT_DB_ALIAS) -> None:
+    """
+    Checks a compiled plan against the constraints of every model, once, before any row is
+    generated.
+
+    Raises:
+        SeedConstraintError: On the first constraint the planned rows can not satisfy.
+    """
+    parent_counts = get_parent_counts(plan, using=using)
+    for model_plan in plan:
+        check_required_fields(model_plan)
+        check_foreign_keys(model_plan, parent_counts)
+        check_unique_sets(model_plan, parent_counts)
+        probe_model_plan(model_plan, using=using)
+
+
+def check_seed_model(
+        model: Type[models.Model],
+        generator: Any,
+        checked: Optional[set] = None,
+        path: tuple = ()
+) -> None:
+    """
+    Checks, once per model, that the classic seeder can create rows of a model and of the parents
+    it creates along with them.
+
+    Raises:
+        SeedConstraintError: If a required field has no generator, or non nullable foreign keys
+            point to the model itself or form a cycle.
+    """
+    checked = set() if checked is None else checked
+    if model in path:
+        cycle = path[path.index(model):] + (model,)
+        raise SeedConstraintError(
+            'Cyclic non nullable foreign keys between '
+            + ' -> '.join(related._meta.label for related in cycle) + ', one of them must be nullable')
+    if model in checked:
+        return
+    cyclic = get_cyclic_relations(model)
+    for field in get_seeded_fields(model):
+        where = f'{model._meta.label}.{field.name}'
+        if field.many_to_one or field.one_to_one:
+            if field.self_referential and not field.null:
+                raise SeedConstraintError(
+                    f'{where}: a non nullable foreign key to the model itself can not be seeded '
+                    'row by row, use a seeding profile')
+            if not field.self_referential and not (field.null and field.name in cyclic):
+                check_seed_model(field.related_model, generator, checked, path + (model,))
+        elif requires_value(field) and not generator.get_generators(type(field.field)):
+            raise SeedConstraintError(
+                f'{where}: no generator supports {field.type} and the field has no default')
+    checked.add(model)
@@ -0,0 +1,252 @@
+import random
+from typing import Any, Callable, Dict, List, Optional, Type
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+from django_data_seed.utils.colorama_theme import StdoutTextTheme
+from django_data_seed.utils.seed_constraints import UniqueTuples
+from django_data_seed.utils.seed_profile import (
+    ForeignKeyPlan,
+    ModelPlan,
+    SeedPlan,
+    SeedProfileError,
+    compile_profile,
+    load_profile
+)
+
+theme = StdoutTextTheme()
+
+
+def get_parent_pool(
+        plan: ModelPlan,
+        foreign_key: ForeignKeyPlan,
+        pools: Dict[Type[models.Model], List[Any]],
+        using: str
+) -> List[Any]:
+    """
+    Returns the primary keys the rows of a model plan can point to through a foreign key.
+
+    Description:
+        Parents created by the same plan are used as is. Other parents, including the model
+        itself for self referential keys, are read once from the existing rows; for one to one
+        fields the parents that already have a child are left out.
+    """
+    if foreign_key.parent in pools and foreign_key.parent is not plan.model:
+        return pools[foreign_key.parent]
+    parents = foreign_key.parent._base_manager.using(using)
+    if foreign_key.unique:
+        parents = parents.exclude(pk__in=plan.model._base_manager.using(using).filter(
+            **{f'{foreign_key.field.attname}__isnull': False}
+        ).values(foreign_key.field.attname))
+    return list(parents.order_by('pk').values_list('pk', flat=True))
+
+
+def check_parent_pool(plan: ModelPlan, foreign_key: ForeignKeyPlan, pool: List[Any]) -> None:
+    """
+    Fails before anything is inserted when the parents can not satisfy the planned rows.
+    """
+    where = f'{plan.label}.{foreign_key.field.name}'
+    if not pool:
+        if plan.count and not foreign_key.field.null:
+            raise SeedProfileError(
+                f'{where}: no {foreign_key.parent._meta.label} rows to point to, seed them first '
+                'or add them to the profile')
+        return
+    needed = plan.count if foreign_key.unique else 0
+    if foreign_key.fan_out:
+        needed = -(-plan.count // foreign_key.fan_out)
+    if needed > len(pool):
+        raise SeedProfileError(
+            f'{where} needs {needed} {foreign_key.parent._meta.label} rows, only {len(pool)} exist')
+
+
+def build_instances(
+        plan: ModelPlan,
+        pickers: List[tuple],
+        start: int,
+        stop: int,
+        unique: Optional[UniqueTuples] = None,
+        regenerators: Optional[Dict[str, Callable[[], Any]]] = None
+) -> List[models.Model]:
+    """
+    Builds the unsaved instances of the rows `[start, stop)` of a model plan, the parents of every
+    foreign key being drawn for the whole batch at once.
+
+    Description:
+        With `unique`, the conflicting columns of rows whose composite unique tuples are taken
+        are regenerated with `regenerators`, see `UniqueTuples.claim`.
+    """
+    columns = [(attname, pick(start, stop)) for attname, pick in pickers]
+    generators = list(plan.values.items())
+    objs = []
+    for offset in range(stop - start):
+        values = {name: generate() for name, generate in generators}
+        for attname, column in columns:
+            values[attname] = column[offset]
+        if unique:
+            unique.claim(values, regenerators)
+        objs.append(plan.model(**values))
+    return objs
+
+
+def seed_model(
+        plan: ModelPlan,
+        pools: Dict[Type[models.Model], List[Any]],
+        batch_size: int,
+        using: str = DEFAULT_DB_ALIAS,
+        keep_pks: bool = False
+) -> Optional[List[Any]]:
+    """
+    Generates and inserts the rows of one model plan, one transaction per batch.
+
+    Args:
+        plan (ModelPlan): The model plan.
+        pools (Dict[Type[models.Model], List[Any]]): The primary keys of the planned parents.
+        batch_size (int): The number of rows per bulk insert.
+        using (str): The database alias.
+        keep_pks (bool): Whether the primary keys of the new rows are collected.
+
+    Returns:
+        Optional[List[Any]]: The primary keys of the new rows when `keep_pks` is set.
+
+    Description:
+        Composite unique constraints are enforced in memory, the tuples of the existing rows
+        being read once before the first batch.
+    """
+    unique = UniqueTuples(plan.model)
+    regenerators = dict(plan.values) if unique else None
+    pickers = []
+    for foreign_key in plan.foreign_keys:
+        if foreign_key.deferred:
+            # ? filled by link_deferred_foreign_keys once every planned row exists
+            continue
+        pool = get_parent_pool(plan, foreign_key, pools, using)
+        check_parent_pool(plan, foreign_key, pool)
+        pickers.append((foreign_key.field.attname, foreign_key.picker(pool)))
+        if unique and pool and not foreign_key.unique:
+            regenerators[foreign_key.field.attname] = lambda pool=pool: random.choice(pool)
+    if unique:
+        unique.preload(using)
+
+    manager = plan.model._default_manager.db_manager(using)
+    returns_pks = connections[using].features.can_return_rows_from_bulk_insert
+    last_pk = None
+    if keep_pks and not returns_pks:
+        last_pk = plan.model._base_manager.using(using).order_by('-pk').values_list(
+            'pk', flat=True).first()
+
+    pks = [] if keep_pks else None
+    for start in range(0, plan.count, batch_size):
+        objs = build_instances(
+            plan, pickers, start, min(start + batch_size, plan.count), unique, regenerators)
+        with transaction.atomic(using=using):
+            objs = manager.bulk_create(objs, batch_size=batch_size)
+        if keep_pks:
+            pks.extend(obj.pk for obj in objs)
+
+    if keep_pks and any(pk is None for pk in pks):
+        # ? the backend did not return the auto primary keys, read them back
+        queryset = plan.model._base_manager.using(using)
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    return pks
+
+
+def link_foreign_key(
+        model: Type[models.Model],
+        field: models.Field,
+        pks: List[Any],
+        parents: List[Any],
+        batch_size: int,
+        using: str = DEFAULT_DB_ALIAS
+) -> int:
+    """
+    Points existing rows to their parents with bulk updates, one transaction per batch.
+
+    Args:
+        model (Type[models.Model]): The model class.
+        field (models.Field): The foreign key or one to one field.
+        pks (List[Any]): The primary keys of the rows.
+        parents (List[Any]): The parent primary key of every row, rows with None are left as is.
+        batch_size (int): The number of rows per update.
+        using (str): The database alias.
+
+    Returns:
+        int: The number of rows updated.
+    """
+    pk_attname = model._meta.pk.attname
+    objs = [
+        model(**{pk_attname: pk, field.attname: parent})
+        for pk, parent in zip(pks, parents) if parent is not None
+    ]
+    manager = model._default_manager.db_manager(using)
+    for start in range(0, len(objs), batch_size):
+        with transaction.atomic(using=using):
+            manager.bulk_update(objs[start:start + batch_size], [field.name])
+    return len(objs)
+
+
+def link_deferred_foreign_keys(
+        plan: SeedPlan,
+        pools: Dict[Type[models.Model], List[Any]],
+        using: str = DEFAULT_DB_ALIAS
+) -> None:
+    """
+    Fills the deferred foreign keys of a plan whose rows are all inserted: self referential keys
+    are shaped as trees over the new rows, keys closing a cycle draw from the new parents with
+    their strategy.
+    """
+    for model_plan in plan:
+        pks = pools.get(model_plan.model)
+        for foreign_key in model_plan.foreign_keys:
+            if not foreign_key.deferred or not pks:
+                continue
+            pool = pks if foreign_key.parent is model_plan.model else pools[foreign_key.parent]
+            parents = foreign_key.picker(pool)(0, len(pks))
+            linked = link_foreign_key(
+                model_plan.model, foreign_key.field, pks, parents, plan.batch_size, using=using)
+            theme.stdout_info(f'Linked {linked} rows of {model_plan.label}.{foreign_key.field.name}')
+
+
+def execute_plan(plan: SeedPlan, using: str = DEFAULT_DB_ALIAS) -> Dict[str, int]:
+    """
+    Executes a compiled seeding plan with bulk inserts.
+
+    Args:
+        plan (SeedPlan): The compiled plan, see `compile_profile`.
+        using (str): The database alias.
+
+    Returns:
+        Dict[str, int]: The number of rows created per model label.
+
+    Description:
+        Models are seeded parents first. Only the primary keys of planned parents are kept in
+        memory, so children can point to them without querying. Deferred foreign keys, trees and
+        cycles, are filled by a bulk update pass at the end. Every batch commits on its own, a
+        failing batch leaves the previous ones in place.
+    """
+    parents = plan.parent_models
+    pools: Dict[Type[models.Model], List[Any]] = {}
+    created = {}
+    for model_plan in plan:
+        pks = seed_model(
+            model_plan, pools, plan.batch_size, using=using,
+            keep_pks=model_plan.model in parents
+        )
+        if pks is not None:
+            pools[model_plan.model] = pks
+        created[model_plan.label] = model_plan.count
+        theme.stdout_info(f'Created {model_plan.count} rows for {model_plan.label}')
+    link_deferred_foreign_keys(plan, pools, using=using)
+    return created
+
+
+def seed_from_profile(
+        path: str,
+        using: str = DEFAULT_DB_ALIAS,
+        column_profiles: Any = None
+) -> Dict[str, int]:
+    """
+    Loads, compiles and executes a seeding profile file.
+    """
+    plan = compile_profile(load_profile(path), using=using, column_profiles=column_profiles)
+    return execute_plan(plan, using=using)
@@ -0,0 +1,788 @@
+import json
+import os
+import random
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, models
+from django_data_seed.utils.column_profile import (
+    AliasTable,
+    compile_column_sampler,
+    load_column_profiles
+)
+from django_data_seed.utils.fk_strategies import (
+    DEFAULT_TREE_BRANCHING,
+    DEFAULT_ZIPF_EXPONENT,
+    FK_STRATEGIES,
+    parent_sampler,
+    tree_sampler,
+    with_null_ratio as with_fk_null_ratio
+)
+from django_data_seed.utils.model_introspection import (
+    FieldDescriptor,
+    get_model_descriptor
+)
+
+# ? number of rows generated and inserted per bulk_create
+DEFAULT_SEED_BATCH_SIZE = 1000
+
+PROFILE_KEYS = frozenset({'batch_size', 'models', 'column_profiles'})
+MODEL_KEYS = frozenset({'count', 'fields'})
+# ? the overrides of a field, at most one of the value sources is allowed
+VALUE_SOURCES = ('value', 'choices', 'range', 'faker', 'generator')
+FIELD_KEYS = frozenset(VALUE_SOURCES + ('weights', 'args', 'null_ratio'))
+RELATION_KEYS = frozenset({
+    'strategy', 'exponent', 'fan_out', 'fan_out_histogram', 'null_ratio', 'depth', 'branching'
+})
+
+
+class SeedProfileError(ValueError):
+    """
+        Raised when a seeding profile is invalid or its plan can not be executed.
+    """
+
+
+class ForeignKeyPlan:
+    """
+        How the rows of a model point to their parents.
+
+        Attributes:
+            field: The foreign key or one to one field.
+            parent: The related model.
+            strategy: How rows are spread over the parents, one of `FK_STRATEGIES`, or `tree`
+                for nullable self referential keys. One to one fields always use `fixed` with
+                one child per parent, or chains when shaped as trees.
+            fan_out: The number of children of every parent of the `fixed` strategy.
+            exponent: The skew of the `zipf` strategy.
+            histogram: The number of parents per number of children, e.g. `{0: 10, 3: 90}`.
+                Every parent draws its weight from it and rows pick parents by weight.
+            null_ratio: The share of rows left without a parent.
+            unique: Whether every parent can only be used once (one to one fields).
+            depth, branching: The number of levels and the children per parent of the `tree`
+                strategy.
+            deferred: Whether the rows are inserted without the key and pointed to their parents
+                by an update pass once every planned row exists: trees and keys closing a cycle.
+    """
+    __slots__ = (
+        'field', 'parent', 'strategy', 'fan_out', 'exponent', 'histogram', 'null_ratio', 'unique',
+        'depth', 'branching', 'deferred'
+    )
+
+    def __init__(
+            self,
+            field: models.Field,
+            parent: Type[models.Model],
+            fan_out: Optional[int] = None,
+            null_ratio: float = 0.0,
+            histogram: Optional[Dict[int, int]] = None,
+            strategy: Optional[str] = None,
+            exponent: float = DEFAULT_ZIPF_EXPONENT,
+            depth: Optional[int] = None,
+            branching: Optional[int] = None
+    ):
+        self.field = field
+        self.parent = parent
+        self.unique = bool(field.one_to_one)
+        if self.unique and strategy != 'tree':
+            strategy, fan_out = 'fixed', 1
+        self.strategy = strategy or ('fixed' if fan_out else 'uniform')
+        self.fan_out = fan_out
+        self.exponent = exponent
+        self.histogram = histogram
+        self.null_ratio = null_ratio
+        self.depth = depth
+        self.branching = 1 if self.unique else branching or DEFAULT_TREE_BRANCHING
+        self.deferred = self.strategy == 'tree'
+
+    def picker(self, pool: List[Any]) -> Callable[[int, int], List[Any]]:
+        """
+        Binds the plan to the primary keys of the parents.
+
+        Returns:
+            Callable[[int, int], List[Any]]: Returns the parent primary keys (or None) of the
+                rows `[start, stop)`.
+        """
+        if self.strategy == 'tree':
+            sample = tree_sampler(pool, self.depth, self.branching)
+        else:
+            sample = parent_sampler(
+                pool, self.strategy, fan_out=self.fan_out, exponent=self.exponent,
+                histogram=None if self.unique else self.histogram
+            )
+        return with_fk_null_ratio(sample, self.null_ratio)
+
+
+class ModelPlan:
+    """
+        The rows to generate for one model.
+
+        Attributes:
+            model: The model class.
+            label: The 'app_label.ModelName' label.
+            count: The number of rows to create.
+            values: The value generator of every generated field, keyed by field name.
+            foreign_keys: The parent assignment of every foreign key and one to one field.
+            domains: The number of distinct values of the generated fields that can only take a
+                few, keyed by field name, e.g. 1 for a `value` override.
+    """
+    __slots__ = ('model', 'label', 'count', 'values', 'foreign_keys', 'domains')
+
+    def __init__(
+            self,
+            model: Type[models.Model],
+            count: int,
+            values: Dict[str, Callable[[], Any]],
+            foreign_keys: List[ForeignKeyPlan],
+            domains: Optional[Dict[str, int]] = None
+    ):
+        self.model = model
+        self.label = model._meta.label
+        self.count = count
+        self.values = values
+        self.foreign_keys = foreign_keys
+        self.domains = domains or {}
+
+    def __repr__(self):
+        return f'<ModelPlan {self.label} x{self.count}>'
+
+
+class SeedPlan:
+    """
+        A compiled seeding profile: the model plans in dependency order, parents first.
+    """
+    __slots__ = ('models', 'batch_size')
+
+    def __init__(self, models: List[ModelPlan], batch_size: int = DEFAULT_SEED_BATCH_SIZE):
+        self.models = models
+        self.batch_size = batch_size
+
+    def __iter__(self):
+        return iter(self.models)
+
+    @property
+    def parent_models(self) -> frozenset:
+        """
+        The models whose primary keys must be kept: the planned models other planned rows point
+        to, and the models with deferred foreign keys.
+        """
+        planned = {plan.model for plan in self.models}
+        return frozenset(
+            foreign_key.parent for plan in self.models for foreign_key in plan.foreign_keys
+            if foreign_key.parent in planned
+        ) | frozenset(
+            plan.model for plan in self.models
+            if any(foreign_key.deferred for foreign_key in plan.foreign_keys)
+        )
+
+
+def load_profile(path: str) -> dict:
+    """
+    Reads a seeding profile from a JSON or YAML (`.yaml`/`.yml`, requires PyYAML) file.
+
+    Args:
+        path (str): The path of the profile file.
+
+    Returns:
+        dict: The raw profile.
+
+    Raises:
+        SeedProfileError: If the file can not be parsed.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        with open(path, encoding='utf-8') as file:
+            if extension in ('.yaml', '.yml'):
+                try:
+                    import yaml
+                except ImportError:
+                    raise SeedProfileError(
+                        'PyYAML is required to read YAML profiles, install it with `pip install PyYAML`')
+                profile = yaml.safe_load(file)
+            else:
+                profile = json.load(file)
+    except SeedProfileError:
+        raise
+    except Exception as e:
+        raise SeedProfileError(f'Could not read the seeding profile {path}: {e}')
+    if not isinstance(profile, dict):
+        raise SeedProfileError(f'The seeding profile {path} must be a mapping')
+    return profile
+
+
+def check_keys(spec: Any, allowed: Iterable[str], where: str) -> dict:
+    if not isinstance(spec, dict):
+        raise SeedProfileError(f'{where} must be a mapping')
+    unknown = sorted(set(spec) - set(allowed))
+    if unknown:
+        raise SeedProfileError(f'{where} has unknown keys: {", ".join(unknown)}')
+    return spec
+
+
+def check_ratio(value: Any, where: str) -> float:
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or not 0 <= value <= 1:
+        raise SeedProfileError(f'{where} must be a number between 0 and 1')
+    return float(value)
+
+
+def check_count(value: Any, where: str, minimum: int = 0) -> int:
+    if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+        raise SeedProfileError(f'{where} must be an integer >= {minimum}')
+    return value
+
+
+def check_histogram(value: Any, where: str) -> Dict[int, int]:
+    if not isinstance(value, dict) or not value:
+        raise SeedProfileError(f'{where} must be a non empty mapping of children to parents')
+    try:
+        histogram = {int(children): int(parents) for children, parents in value.items()}
+    except (TypeError, ValueError):
+        raise SeedProfileError(f'{where} must map integer numbers of children to parents')
+    if any(children < 0 or parents < 0 for children, parents in histogram.items()):
+        raise SeedProfileError(f'{where} can not contain negative numbers')
+    return histogram
+
+
+def check_strategy(descriptor: FieldDescriptor, spec: dict, where: str) -> tuple:
+    """
+    Validates the strategy of a foreign key and returns it with its zipf exponent.
+    """
+    strategy = spec.get('strategy')
+    if strategy is None:
+        strategy = 'fixed' if spec.get('fan_out') is not None else None
+    elif strategy not in FK_STRATEGIES:
+        raise SeedProfileError(f'{where}.strategy must be one of {", ".join(FK_STRATEGIES)}')
+    if strategy == 'fixed' and spec.get('fan_out') is None:
+        raise SeedProfileError(f'{where}: the fixed strategy requires fan_out')
+    if strategy not in (None, 'fixed') and spec.get('fan_out') is not None:
+        raise SeedProfileError(f'{where}: fan_out requires the fixed strategy')
+    if strategy is not None and spec.get('fan_out_histogram') is not None:
+        raise SeedProfileError(f'{where}: strategy and fan_out_histogram are exclusive')
+    if descriptor.one_to_one and (
+            strategy not in (None, 'fixed') or spec.get('fan_out') not in (None, 1)):
+        raise SeedProfileError(f'{where}: one to one fields use every parent once')
+    exponent = spec.get('exponent', DEFAULT_ZIPF_EXPONENT)
+    if 'exponent' in spec:
+        if strategy != 'zipf':
+            raise SeedProfileError(f'{where}: exponent requires the zipf strategy')
+        if not isinstance(exponent, (int, float)) or isinstance(exponent, bool) or exponent <= 0:
+            raise SeedProfileError(f'{where}.exponent must be a positive number')
+    return strategy, float(exponent)
+
+
+def get_profile_model(label: str) -> Type[models.Model]:
+    try:
+        return apps.get_model(label)
+    except (LookupError, ValueError):
+        raise SeedProfileError(f'Unknown model {label!r}, expected "app_label.ModelName"')
+
+
+def get_seeded_fields(model: Type[models.Model]) -> List[FieldDescriptor]:
+    """
+    Returns the fields the seeder fills, every concrete field but auto primary keys, many to
+    many fields and database generated fields.
+    """
+    return [
+        descriptor for descriptor in get_model_descriptor(model).concrete_fields
+        if not descriptor.many_to_many and not isinstance(descriptor.field, models.AutoField)
+        and not getattr(descriptor.field, 'generated', False)
+    ]
+
+
+@lru_cache(maxsize=None)
+def get_cyclic_relations(model: Type[models.Model]) -> frozenset:
+    """
+    Returns the names of the foreign key and one to one fields of a model that lead back to it,
+    directly (self referential keys) or through the foreign keys of other models.
+    """
+    cyclic = set()
+    for field in get_model_descriptor(model).relation_fields:
+        seen, pending = set(), [field.related_model]
+        while pending:
+            related = pending.pop()
+            if related is model:
+                cyclic.add(field.name)
+                break
+            if related in seen:
+                continue
+            seen.add(related)
+            pending.extend(
+                relation.related_model
+                for relation in get_model_descriptor(related).relation_fields)
+    return frozenset(cyclic)
+
+
+def with_null_ratio(generate: Callable[[], Any], null_ratio: float) -> Callable[[], Any]:
+    if not null_ratio:
+        return generate
+
+    def generate_or_null():
+        return None if random.random() < null_ratio else generate()
+    return generate_or_null
+
+
+def compile_range(descriptor: FieldDescriptor, bounds: Any, where: str) -> Callable[[], Any]:
+    """
+    Compiles a `range` override, uniform values between two inclusive bounds of a numeric field.
+    """
+    field = descriptor.field
+    if not isinstance(bounds, list) or len(bounds) != 2 or any(
+            not isinstance(bound, (int, float, Decimal)) or isinstance(bound, bool)
+            for bound in bounds):
+        raise SeedProfileError(f'{where}.range must be a list of two numbers')
+    low, high = bounds
+    if low > high:
+        raise SeedProfileError(f'{where}.range must be ordered [min, max]')
+    if isinstance(field, models.IntegerField):
+        low, high = int(low), int(high)
+
+        def generate():
+            return random.randint(low, high)
+    elif isinstance(field, models.FloatField):
+        low, high = float(low), float(high)
+
+        def generate():
+            return random.uniform(low, high)
+    elif isinstance(field, models.DecimalField):
+        low, high = float(low), float(high)
+        exponent = Decimal(1).scaleb(-(field.decimal_places or 0))
+
+        def generate():
+            return Decimal(str(random.uniform(low, high))).quantize(exponent)
+    else:
+        raise SeedProfileError(f'{where}: range requires a numeric field')
+    return generate
+
+
+def field_type_generator(
+        model: Type[models.Model],
+        field: models.Field,
+        generator: Any
+) -> Optional[Callable[[], Any]]:
+    """
+    Returns a callable generating values with the generators of the field type, trying them in
+    turn like `SeedData.validate_and_give_value`, or None if no generator supports the field.
+    """
+    entries = generator.get_generators(type(field))
+    if not entries:
+        return None
+
+    def generate():
+        for entry in entries[:-1]:
+            try:
+                return generator.call_generator(entry, field, model)
+            except Exception:
+                continue
+        return generator.call_generator(entries[-1], field, model)
+    return generate
+
+
+def compile_column_samplers(column_profiles: Any, generator: Any) -> Dict[tuple, Callable[[], Any]]:
+    """
+    Compiles the samplers of stored column profiles.
+
+    Args:
+        column_profiles (Any): The column profiles, or the path of a file written by
+            `profile_columns`.
+        generator (Any): The `SeedData` instance, whose field type generators produce the values
+            outside the profiled top values of columns without histogram.
+
+    Returns:
+        Dict[tuple, Callable[[], Any]]: The samplers keyed by (model class, field name).
+    """
+    if isinstance(column_profiles, str):
+        try:
+            column_profiles = load_column_profiles(column_profiles)
+        except (OSError, ValueError) as e:
+            raise SeedProfileError(f'Could not read the column profiles: {e}')
+    if not isinstance(column_profiles, dict) or not isinstance(column_profiles.get('models'), dict):
+        raise SeedProfileError('Column profiles must map "models" to model profiles')
+    samplers = {}
+    for label, model_profile in column_profiles['models'].items():
+        model = get_profile_model(label)
+        descriptor = get_model_descriptor(model)
+        for name, column in (model_profile.get('columns') or {}).items():
+            try:
+                field = descriptor.get_field(name)
+            except FieldDoesNotExist:
+                # ? the model changed since it was profiled
+                continue
+            sampler = compile_column_sampler(
+                field, column, fallback=field_type_generator(model, field.field, generator))
+            if sampler is not None:
+                samplers[(model, field.name)] = sampler
+    return samplers
+
+
+def compile_field_value(
+        model: Type[models.Model],
+        descriptor: FieldDescriptor,
+        spec: dict,
+        generator: Any,
+        where: str
+) -> Optional[Callable[[], Any]]:
+    """
+    Compiles the value generator of a field from its overrides.
+
+    Args:
+        model (Type[models.Model]): The model class.
+        descriptor (FieldDescriptor): The field.
+        spec (dict): The field overrides of the profile, may be empty.
+        generator (Any): The `SeedData` instance providing the field type generators.
+        where (str): The location of the overrides, for error messages.
+
+    Returns:
+        Optional[Callable[[], Any]]: A callable returning a new value on every call, or None when
+            no generator supports the field and its default is left to the model.
+
+    Description:
+        Declared values and choices are validated once here. Generated values are adjusted to
+        the `max_length`, decimal precision and value limits of the field, see `value_adjuster`.
+    """
+    from django_data_seed.management.commands.fields import fake
+    from django_data_seed.management.commands.utils import SUPPORTED_DJANGO_MODEL_FIELDS
+    from django_data_seed.utils.seed_constraints import check_value, constrain
+
+    field = descriptor.field
+    sources = [source for source in VALUE_SOURCES if source in spec]
+    if len(sources) > 1:
+        raise SeedProfileError(f'{where} can only use one of {", ".join(sources)}')
+    if 'weights' in spec and 'choices' not in spec:
+        raise SeedProfileError(f'{where}: weights require choices')
+    if 'args' in spec and 'faker' not in spec:
+        raise SeedProfileError(f'{where}: args require faker')
+    null_ratio = check_ratio(spec.get('null_ratio', 0), f'{where}.null_ratio')
+    if null_ratio and not descriptor.null:
+        raise SeedProfileError(f'{where}: null_ratio requires a nullable field')
+
+    if 'value' in spec:
+        value = spec['value']
+        check_value(descriptor, value, f'{where}.value')
+
+        def generate():
+            return value
+    elif 'choices' in spec:
+        choices, weights = spec['choices'], spec.get('weights')
+        if not isinstance(choices, list) or not choices:
+            raise SeedProfileError(f'{where}.choices must be a non empty list')
+        if weights is not None and (not isinstance(weights, list) or len(weights) != len(choices)):
+            raise SeedProfileError(f'{where}.weights must be a list as long as choices')
+        for choice in choices:
+            check_value(descriptor, choice, f'{where}.choices')
+
+        if weights is None:
+            def generate():
+                return random.choice(choices)
+        else:
+            try:
+                table = AliasTable(choices, weights)
+            except (TypeError, ValueError):
+                raise SeedProfileError(f'{where}.weights must be non negative numbers, not all 0')
+            generate = table.draw
+    elif 'range' in spec:
+        generate = compile_range(descriptor, spec['range'], where)
+    elif 'faker' in spec:
+        provider = getattr(fake, str(spec['faker']), None)
+        if not callable(provider):
+            raise SeedProfileError(f'{where}: unknown faker provider {spec["faker"]!r}')
+        args = spec.get('args', {})
+        if not isinstance(args, dict):
+            raise SeedProfileError(f'{where}.args must be a mapping')
+
+        def generate():
+            return provider(**args)
+    elif 'generator' in spec:
+        name = spec['generator']
+        if name not in SUPPORTED_DJANGO_MODEL_FIELDS or not callable(getattr(generator, name, None)):
+            raise SeedProfileError(f'{where}: unknown generator {name!r}')
+        method = getattr(generator, name)
+
+        def generate():
+            return method(field, model)
+    else:
+        generate = field_type_generator(model, field, generator)
+        if generate is None:
+            return None
+    if 'value' not in spec and 'choices' not in spec:
+        generate = constrain(generate, field)
+    return with_null_ratio(generate, null_ratio)
+
+
+def field_domain(descriptor: FieldDescriptor, spec: dict) -> Optional[int]:
+    """
+    Returns the number of distinct values the generator of a field can produce when it can only
+    produce a few, otherwise None.
+    """
+    if 'value' in spec:
+        return 1
+    if 'choices' in spec:
+        try:
+            return len(set(spec['choices']))
+        except TypeError:
+            return len(spec['choices'])
+    if 'range' in spec and isinstance(descriptor.field, models.IntegerField):
+        low, high = spec['range']
+        return int(high) - int(low) + 1
+    if any(source in spec for source in VALUE_SOURCES):
+        return None
+    if descriptor.choices and isinstance(descriptor.field, models.CharField):
+        # ? the CharField generator picks one of the choices
+        return len(set(descriptor.choices))
+    if isinstance(descriptor.field, models.BooleanField):
+        return 2
+    return None
+
+
+def compile_model(
+        label: str,
+        spec: Any,
+        generator: Any,
+        samplers: Optional[Dict[tuple, Callable[[], Any]]] = None
+) -> tuple:
+    """
+    Compiles the fields of one model entry of a profile.
+
+    Returns:
+        tuple: The model, its explicit count (or None), the value generators, the foreign key
+            plans, the name of the foreign key whose fan out derives the count (or None) and the
+            value domains, see `ModelPlan.domains`.
+    """
+    model = get_profile_model(label)
+    spec = check_keys(spec if spec is not None else {}, MODEL_KEYS, f'models.{label}')
+    field_specs = spec.get('fields') or {}
+    if not isinstance(field_specs, dict):
+        raise SeedProfileError(f'models.{label}.fields must be a mapping')
+    descriptor = get_model_descriptor(model)
+    seeded = {field.name for field in get_seeded_fields(model)}
+    for name in field_specs:
+        try:
+            field = descriptor.get_field(name)
+        except FieldDoesNotExist:
+            raise SeedProfileError(f'models.{label}.fields: {model.__name__} has no field {name!r}')
+        if field.name not in seeded:
+            raise SeedProfileError(f'models.{label}.fields.{name} is not a seeded field')
+
+    values, foreign_keys, fan_out_field, domains = {}, [], None, {}
+    for field in get_seeded_fields(model):
+        where = f'models.{label}.fields.{field.name}'
+        field_spec = field_specs.get(field.name) or field_specs.get(field.attname) or {}
+        if field.many_to_one or field.one_to_one:
+            check_keys(field_spec, RELATION_KEYS, where)
+            null_ratio = check_ratio(field_spec.get('null_ratio', 0), f'{where}.null_ratio')
+            if null_ratio and not field.null:
+                raise SeedProfileError(f'{where}: null_ratio requires a nullable field')
+            fan_out = field_spec.get('fan_out')
+            if fan_out is not None:
+                fan_out = check_count(fan_out, f'{where}.fan_out', minimum=1)
+                if fan_out_field is not None:
+                    raise SeedProfileError(f'models.{label}: only one foreign key can set fan_out')
+                fan_out_field = field.name
+            histogram = field_spec.get('fan_out_histogram')
+            if histogram is not None:
+                if fan_out is not None:
+                    raise SeedProfileError(f'{where}: fan_out and fan_out_histogram are exclusive')
+                histogram = check_histogram(histogram, f'{where}.fan_out_histogram')
+            strategy, exponent = check_strategy(field, field_spec, where)
+            depth, branching = field_spec.get('depth'), field_spec.get('branching')
+            shaped = depth is not None or branching is not None
+            if shaped and not field.self_referential:
+                raise SeedProfileError(f'{where}: depth and branching shape self referential keys')
+            if shaped and not field.null:
+                raise SeedProfileError(f'{where}: depth and branching require a nullable field')
+            if shaped and (strategy or histogram):
+                raise SeedProfileError(
+                    f'{where}: depth and branching are exclusive with strategy, fan_out and '
+                    'fan_out_histogram')
+            if field.self_referential and field.null and not (strategy or histogram):
+                # ? rows point to the new rows of the same model, shaped as trees
+                strategy = 'tree'
+                depth = check_count(depth, f'{where}.depth', minimum=1) if depth is not None else None
+                branching = check_count(
+                    branching, f'{where}.branching', minimum=1) if branching is not None else None
+            foreign_keys.append(ForeignKeyPlan(
+                field.field, field.related_model, fan_out=fan_out, null_ratio=null_ratio,
+                histogram=histogram, strategy=strategy, exponent=exponent, depth=depth,
+                branching=branching))
+            continue
+        check_keys(field_spec, FIELD_KEYS, where)
+        if not field_spec and samplers and (model, field.name) in samplers:
+            values[field.name] = samplers[(model, field.name)]
+            continue
+        generate = compile_field_value(model, field, field_spec, generator, where)
+        if generate is not None:
+            values[field.name] = generate
+            domain = field_domain(field, field_spec)
+            if domain is not None:
+                domains[field.name] = domain
+
+    count = spec.get('count')
+    if count is not None:
+        count = check_count(count, f'models.{label}.count')
+        if fan_out_field is not None:
+            raise SeedProfileError(
+                f'models.{label}: count and fan_out are exclusive, fan_out derives the count')
+    elif fan_out_field is None:
+        raise SeedProfileError(f'models.{label} needs a count or a foreign key fan_out')
+    return model, count, values, foreign_keys, fan_out_field, domains
+
+
+def sort_by_dependency(items: Iterable[Any], get_parents: Callable[[Any], Iterable[tuple]]) -> tuple:
+    """
+    Sorts items parents first with a depth first search.
+
+    Args:
+        items (Iterable[Any]): The items to sort, visited in the given order.
+        get_parents (Callable): Returns the `(edge, parent)` pairs of an item. Parents that are
+            not among the items are ignored.
+
+    Returns:
+        tuple: The sorted items, and the edges of the first cycle found (or None).
+    """
+    items = list(items)
+    known, ordered, done, visiting, path = set(items), [], set(), [], []
+
+    def visit(item):
+        if item in done:
+            return None
+        if item in visiting:
+            return path[visiting.index(item):]
+        visiting.append(item)
+        for edge, parent in get_parents(item):
+            if parent in known and parent is not item:
+                path.append(edge)
+                cycle = visit(parent)
+                if cycle:
+                    return cycle
+                path.pop()
+        visiting.pop()
+        done.add(item)
+        ordered.append(item)
+        return None
+
+    for item in items:
+        cycle = visit(item)
+        if cycle:
+            return ordered, cycle
+    return ordered, None
+
+
+def sort_model_plans(plans: Dict[Type[models.Model], ModelPlan]) -> tuple:
+    """
+    Sorts the model plans parents first, ignoring deferred foreign keys.
+
+    Returns:
+        tuple: The sorted plans, and the foreign keys of the first cycle found (or None).
+    """
+    ordered, cycle = sort_by_dependency(plans, lambda model: [
+        (foreign_key, foreign_key.parent)
+        for foreign_key in plans[model].foreign_keys if not foreign_key.deferred
+    ])
+    return [plans[model] for model in ordered], cycle
+
+
+def order_model_plans(plans: Dict[Type[models.Model], ModelPlan]) -> List[ModelPlan]:
+    """
+    Sorts the model plans so every parent is created before its children.
+
+    Description:
+        The first nullable foreign key of every cycle between planned models is deferred: its
+        rows are inserted without it and pointed to their parents once every planned row exists.
+
+    Raises:
+        SeedProfileError: If the planned models depend on each other in a cycle of non nullable
+            foreign keys.
+    """
+    while True:
+        ordered, cycle = sort_model_plans(plans)
+        if cycle is None:
+            return ordered
+        deferrable = [foreign_key for foreign_key in cycle if foreign_key.field.null]
+        if not deferrable:
+            raise SeedProfileError(
+                'Cyclic foreign keys between ' + ' -> '.join(
+                    f'{foreign_key.field.model._meta.label}.{foreign_key.field.name}'
+                    for foreign_key in cycle
+                ) + ', one of them must be nullable')
+        deferrable[0].deferred = True
+
+
+def compile_profile(
+        profile: dict,
+        generator: Any = None,
+        using: str = DEFAULT_DB_ALIAS,
+        column_profiles: Any = None
+) -> SeedPlan:
+    """
+    Compiles a seeding profile into a plan, validating it and checking it against the model
+    constraints (see `seed_constraints.check_plan`) before anything is written.
+
+    Args:
+        profile (dict): The raw profile, see `load_profile`.
+        generator (Any): The `SeedData` instance providing the field type generators.
+        using (str): The database alias, used to count the existing parents of fan outs.
+        column_profiles (Any): Column profiles (or the path of their file), overriding the
+            `column_profiles` entry of the profile. Fields without overrides of profiled columns
+            sample their values from them.
+
+    Returns:
+        SeedPlan: The model plans in dependency order.
+
+    Raises:
+        SeedProfileError: If the profile is invalid or its rows can not satisfy the constraints
+            of their models.
+
+    Example:
+        {
+            "batch_size": 5000,
+            "models": {
+                "shop.Store": {"count": 1000},
+                "shop.Order": {
+                    "fields": {
+                        "store": {"fan_out": 10000},
+                        "customer": {"strategy": "zipf", "exponent": 1.2},
+                        "status": {"choices": ["new", "paid"], "weights": [1, 9]},
+                        "note": {"faker": "sentence", "null_ratio": 0.8}
+                    }
+                }
+            }
+        }
+    """
+    from django_data_seed.utils.seed_constraints import check_plan
+
+    if generator is None:
+        from django_data_seed.management.commands.load_data import SeedData
+        generator = SeedData()
+    check_keys(profile, PROFILE_KEYS, 'The seeding profile')
+    batch_size = check_count(
+        profile.get('batch_size', DEFAULT_SEED_BATCH_SIZE), 'batch_size', minimum=1)
+    model_specs = profile.get('models')
+    if not isinstance(model_specs, dict) or not model_specs:
+        raise SeedProfileError('The seeding profile must declare at least one model under "models"')
+    if column_profiles is None:
+        column_profiles = profile.get('column_profiles')
+    samplers = compile_column_samplers(column_profiles, generator) if column_profiles else {}
+
+    plans, fan_outs = {}, {}
+    for label, spec in model_specs.items():
+        model, count, values, foreign_keys, fan_out_field, domains = compile_model(
+            label, spec, generator, samplers)
+        if model in plans:
+            raise SeedProfileError(f'models.{label}: {model._meta.label} is declared twice')
+        plans[model] = ModelPlan(model, count, values, foreign_keys, domains)
+        if fan_out_field is not None:
+            fan_outs[model] = fan_out_field
+
+    ordered = order_model_plans(plans)
+    for plan in ordered:
+        if plan.model not in fan_outs:
+            continue
+        foreign_key = next(fk for fk in plan.foreign_keys if fk.field.name == fan_outs[plan.model])
+        if foreign_key.parent in plans and foreign_key.parent is not plan.model:
+            parents = plans[foreign_key.parent].count
+        else:
+            parents = foreign_key.parent._default_manager.using(using).count()
+        plan.count = parents * foreign_key.fan_out
+    plan = SeedPlan(ordered, batch_size=batch_size)
+    check_plan(plan, using=using)
+    return plan
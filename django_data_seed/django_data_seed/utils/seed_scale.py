@@ -0,0 +1,165 @@
+from collections import Counter
+from typing import Any, Dict, List, Optional, Type
+from django.db import DEFAULT_DB_ALIAS, models
+from django.db.models import Count
+from django_data_seed.utils.app_utils import get_filtered_models
+from django_data_seed.utils.column_profile import (
+    DEFAULT_BINS,
+    DEFAULT_TOP_K,
+    profile_model
+)
+from django_data_seed.utils.excluded_models import EXCLUDED_MODELS
+from django_data_seed.utils.seed_engine import execute_plan
+from django_data_seed.utils.seed_profile import (
+    SeedProfileError,
+    compile_profile,
+    get_seeded_fields
+)
+
+
+def sample_model(
+        model: Type[models.Model],
+        using: str = DEFAULT_DB_ALIAS,
+        row_counts: Optional[Dict[Type[models.Model], int]] = None,
+        top_k: int = DEFAULT_TOP_K,
+        bins: int = DEFAULT_BINS
+) -> tuple:
+    """
+    Samples the row count, the column distributions and the foreign keys of a model with
+    aggregate queries.
+
+    Args:
+        model (Type[models.Model]): The model class.
+        using (str): The database alias.
+        row_counts (Optional[Dict[Type[models.Model], int]]): Row counts already sampled, reused
+            for the parents of foreign keys and filled in as models are counted.
+        top_k (int): The number of most common values kept per column.
+        bins (int): The number of histogram buckets of numeric and date columns.
+
+    Returns:
+        tuple: The row count, the foreign key overrides of a seeding profile (null ratios and
+            fan out histograms) and the column profile of the other fields, see `profile_model`.
+
+    Description:
+        Foreign keys cost one aggregate query for their null counts and one grouped query each,
+        whose per parent counts are folded into a histogram while they are streamed.
+    """
+    row_counts = {} if row_counts is None else row_counts
+    column_profile = profile_model(model, using=using, top_k=top_k, bins=bins)
+    rows = row_counts[model] = column_profile['rows']
+    relations = [
+        field for field in get_seeded_fields(model) if field.many_to_one or field.one_to_one
+    ]
+    if not rows or not relations:
+        return rows, {}, column_profile
+
+    filled = model._base_manager.using(using).aggregate(**{
+        f'filled_{index}': Count(field.attname)
+        for index, field in enumerate(relations) if field.null
+    }) if any(field.null for field in relations) else {}
+    specs = {}
+    for index, field in enumerate(relations):
+        spec = {}
+        if field.null:
+            null_ratio = round(1 - filled[f'filled_{index}'] / rows, 4)
+            if null_ratio:
+                spec['null_ratio'] = null_ratio
+        if not field.one_to_one:
+            spec['fan_out_histogram'] = sample_fan_out(model, field, using, row_counts)
+        specs[field.name] = spec
+    return rows, specs, column_profile
+
+
+def sample_fan_out(
+        model: Type[models.Model],
+        field: Any,
+        using: str,
+        row_counts: Dict[Type[models.Model], int]
+) -> Dict[int, int]:
+    """
+    Returns the number of parents per number of children of a foreign key, parents without
+    children included.
+    """
+    children = model._base_manager.using(using).filter(
+        **{f'{field.attname}__isnull': False}
+    ).values(field.attname).annotate(children=Count('pk')).order_by().values_list(
+        'children', flat=True)
+    histogram = Counter(children.iterator())
+    parent = field.related_model
+    if parent not in row_counts:
+        row_counts[parent] = parent._base_manager.using(using).count()
+    childless = row_counts[parent] - sum(histogram.values())
+    if childless > 0:
+        histogram[0] = childless
+    return dict(histogram)
+
+
+def get_sampled_models(app_name: Optional[str] = None, model_name: Optional[str] = None) -> list:
+    """
+    Returns the models whose existing rows are sampled, the ones `seeddata` seeds without the
+    audit tables.
+    """
+    return [
+        model for model in get_filtered_models(specific_app_name=app_name, model_name=model_name)
+        if model.__name__ not in EXCLUDED_MODELS
+    ]
+
+
+def build_scale_profile(
+        models_to_scale: List[Type[models.Model]],
+        scale_factor: float,
+        using: str = DEFAULT_DB_ALIAS
+) -> dict:
+    """
+    Builds the seeding profile that grows the given models to `scale_factor` times their rows.
+
+    Args:
+        models_to_scale (List[Type[models.Model]]): The models to grow.
+        scale_factor (float): The target size relative to the current one, at least 1.
+        using (str): The database alias.
+
+    Returns:
+        dict: A profile for `compile_profile`, the additional rows of every non empty model with
+            the sampled foreign keys as field overrides and the column profiles of the other
+            fields.
+    """
+    if scale_factor < 1:
+        raise SeedProfileError('The scale factor must be at least 1, existing rows are kept')
+    profile = {'models': {}, 'column_profiles': {'models': {}}}
+    row_counts = {}
+    for model in models_to_scale:
+        rows, specs, column_profile = sample_model(model, using=using, row_counts=row_counts)
+        count = round(rows * (scale_factor - 1))
+        if count:
+            profile['models'][model._meta.label] = {'count': count, 'fields': specs}
+            profile['column_profiles']['models'][model._meta.label] = column_profile
+    return profile
+
+
+def scale_models(
+        scale_factor: float,
+        app_name: Optional[str] = None,
+        model_name: Optional[str] = None,
+        using: str = DEFAULT_DB_ALIAS,
+        batch_size: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Grows the selected models proportionally with the bulk seeding engine.
+
+    Args:
+        scale_factor (float): The target size relative to the current one, 10 makes the data
+            ten times bigger.
+        app_name (Optional[str]): Only scale the models of this app.
+        model_name (Optional[str]): Only scale the model with this class name.
+        using (str): The database alias.
+        batch_size (Optional[int]): The number of rows per bulk insert.
+
+    Returns:
+        Dict[str, int]: The number of rows created per model label.
+    """
+    profile = build_scale_profile(get_sampled_models(app_name, model_name), scale_factor, using)
+    if not profile['models']:
+        return {}
+    if batch_size:
+        profile['batch_size'] = batch_size
+    return execute_plan(compile_profile(profile, using=using), using=using)
@@ -1,16 +1,20 @@
 from django.core.serializers import serialize
 import json
-from .get_user import get_current_user
-from typing import Type
+from .get_user import get_current_user_id
+from typing import Iterable, List, Optional, Type
 from django.db import models
-from django_data_seed.utils.colorama_theme import StdoutTextTheme
+from django_data_seed.utils.colorama_theme import SignalTextTheme
 from django.db.models.query import QuerySet
-from django_data_seed.utils.json_compare import compare_json_objects
+from django_data_seed.utils.json_compare import (
+    compare_json_objects,
+    json_fingerprint
+)
 from django_data_seed.utils.thread_locals import (
     get_thread_variable
 )
+from django_data_seed.utils.audit_queue import enqueue_audit_event
 
-colorma_theme = StdoutTextTheme()
+colorma_theme = SignalTextTheme()
 
 
 def serialize_signal_data(sender: Type[models.Model], instance: models.Model) -> dict:
@@ -39,6 +43,49 @@ def serialize_signal_data(sender: Type[models.Model], instance: models.Model) ->
     return data_dict
 
 
+def serialize_instances(sender: Type[models.Model], instances: Iterable[models.Model]) -> List[dict]:
+    """
+        Args:
+            sender: The model class of the instances.
+            instances: The instances to serialize.
+
+        Info:
+            The bulk counterpart of `serialize_signal_data`: every instance is serialized in one
+            serializer pass, producing the same dictionaries.
+
+        Returns:
+            A list of dictionary representations, in the order of the instances.
+    """
+    app_name = sender._meta.app_label
+    model_name = sender.__name__.lower()
+    return [
+        {
+            "pk": str(parsed_data['pk']),
+            "model": f"{app_name}.{model_name}",
+            "fields": parsed_data['fields']
+        }
+        for parsed_data in json.loads(serialize('json', instances))
+    ]
+
+
+def get_snapshot_fingerprint(snapshot: dict) -> Optional[str]:
+    """
+        Args:
+            snapshot: The serialized model instance.
+
+        Info:
+            Returns the canonical fingerprint of a snapshot, or None when it can not be encoded
+            (e.g. too deeply nested), in which case snapshots are compared in full.
+
+        Returns:
+            The fingerprint or None.
+    """
+    try:
+        return json_fingerprint(snapshot)
+    except (TypeError, ValueError, RecursionError):
+        return None
+
+
 def data_backup_pre_save_handler(
         sender: Type[models.Model],
         instance: models.Model
@@ -64,9 +111,9 @@ def data_backup_pre_save_handler(
         'model_name': sender.__name__,
     }
     # ? Add the user who deleted the object
-    login_user = get_current_user()
-    if login_user:
-        data_dict['deleted_by'] = login_user
+    user_id = get_current_user_id()
+    if user_id is not None:
+        data_dict['deleted_by_id'] = user_id
     return data_dict
 
 
@@ -96,9 +143,9 @@ def data_logentry_prev_save_handler(
         'model_name': sender.__name__,
     }
     # ? Add the user who deleted the object
-    login_user = get_current_user()
-    if login_user:
-        data_dict['mutated_by'] = login_user
+    user_id = get_current_user_id()
+    if user_id is not None:
+        data_dict['mutated_by_id'] = user_id
     return data_dict
 
 
@@ -135,19 +182,73 @@ def data_logentry_post_save_handler(
     )
     if not pk:
         return False
-    try:
-        instance = queryset.get(pk=pk)
-    except sender.DoesNotExist:
-        return False
-    is_changes_exists = compare_json_objects(
-        obj1=instance.before_mutation,
-        obj2=data_dict['after_mutation']
+    # ? compare against the fingerprint stored at pre_save to avoid re-reading the log entry
+    fingerprint = get_thread_variable(
+        name="django_data_seed_auto_logentry_fingerprint",
     )
+    if fingerprint is not None:
+        is_changes_exists = fingerprint == get_snapshot_fingerprint(
+            data_dict['after_mutation']
+        )
+    else:
+        try:
+            instance = queryset.get(pk=pk)
+        except queryset.model.DoesNotExist:
+            return False
+        is_changes_exists = compare_json_objects(
+            obj1=instance.before_mutation,
+            obj2=data_dict['after_mutation']
+        )
     # ? only update if any changes happend
     if not is_changes_exists:
         # ? update new mutated data to logentry
         queryset.filter(
             pk=pk).update(**data_dict)
     else:
-        instance.delete()
+        queryset.filter(pk=pk).delete()
         return True
+
+
+def data_logentry_post_save_queue_handler(
+    sender: Type[models.Model],
+    instance: models.Model,
+    data_dict: dict,
+    model: Type[models.Model]
+) -> bool:
+    """
+        Args:
+            sender: The model class that sent the signal.
+            instance: The instance of the model being processed.
+            data_dict: The log entry data captured at pre_save.
+            model: The log entry model.
+
+        Description:
+            The queued counterpart of `data_logentry_post_save_handler`: instead of updating the
+            row written at pre_save, a complete log entry is enqueued for `run_audit_worker`, and
+            only if the save changed the instance.
+
+        Returns:
+            bool: Returns `True` if a log entry was enqueued, otherwise `False`.
+    """
+    after_mutation = serialize_signal_data(
+        sender=sender,
+        instance=instance
+    )
+    fingerprint = get_thread_variable(
+        name="django_data_seed_auto_logentry_fingerprint",
+    )
+    if fingerprint is not None:
+        is_changes_exists = fingerprint == get_snapshot_fingerprint(after_mutation)
+    else:
+        is_changes_exists = compare_json_objects(
+            obj1=data_dict['before_mutation'],
+            obj2=after_mutation
+        )
+    if is_changes_exists:
+        return False
+    enqueue_audit_event(
+        model,
+        dict(data_dict, after_mutation=after_mutation),
+        using=instance._state.db
+    )
+    return True
@@ -1,46 +1,50 @@
-import threading
 from typing import Any, Optional
+from django_data_seed.utils.audit_context import (
+    clear_context_variable,
+    get_context_variable,
+    set_context_variable
+)
 
-_thread_locals = threading.local()
+# ? These helpers keep their historical names but are backed by contextvars, so values
+# ? never leak between requests on reused threads or between concurrent async tasks.
 
 
 def set_thread_variable(name: str, value: Any) -> None:
     """
-    Sets a thread-local variable.
+    Sets a variable of the current execution context.
 
     Args:
-        name (str): The name of the thread-local variable to set.
-        value (Any): The value to assign to the thread-local variable.
+        name (str): The name of the variable to set.
+        value (Any): The value to assign to the variable.
 
     Returns:
         None
     """
-    setattr(_thread_locals, name, value)
+    set_context_variable(name, value)
 
 
 def get_thread_variable(name: str, default: Optional[Any] = None) -> Any:
     """
-    Retrieves the value of a thread-local variable.
+    Retrieves the value of a variable of the current execution context.
 
     Args:
-        name (str): The name of the thread-local variable to retrieve.
+        name (str): The name of the variable to retrieve.
         default (Optional[Any]): The default value to return if the variable is not found.
 
     Returns:
-        Any: The value of the thread-local variable, or the default value if not found.
+        Any: The value of the variable, or the default value if not found.
     """
-    return getattr(_thread_locals, name, default)
+    return get_context_variable(name, default)
 
 
 def clear_thread_variable(name: str) -> None:
     """
-    Clears a thread-local variable.
+    Clears a variable of the current execution context.
 
     Args:
-        name (str): The name of the thread-local variable to clear.
+        name (str): The name of the variable to clear.
 
     Returns:
         None
     """
-    if hasattr(_thread_locals, name):
-        delattr(_thread_locals, name)
+    clear_context_variable(name)
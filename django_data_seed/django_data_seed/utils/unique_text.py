@@ -0,0 +1,139 @@
+import re
+from string import Formatter
+from typing import Any, Callable, Iterable, Optional, Type
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+from django.utils.text import slugify
+
+SEQUENCE_DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+# ? 36 ** 6, about 2 billion values per field
+DEFAULT_SEQUENCE_WIDTH = 6
+MAX_PREFIX_LENGTH = 20
+# ? rows streamed per fetch while the highest existing sequence is read
+SEQUENCE_PRELOAD_CHUNK_SIZE = 10000
+# ? the format of the values per field class, `{prefix}` is random, `{sequence}` is unique
+TEXT_TEMPLATES = (
+    (models.EmailField, '{prefix}{sequence}@example.com'),
+    (models.URLField, 'https://example.com/{prefix}-{sequence}'),
+    (models.SlugField, '{prefix}-{sequence}'),
+)
+DEFAULT_TEXT_TEMPLATE = '{prefix}-{sequence}'
+# ? 'sequence' composes unique text values, 'lookup' retries random values until they are unused
+UNIQUE_TEXT_MODES = ('sequence', 'lookup')
+
+
+def get_unique_text_mode() -> str:
+    """
+    Returns the `DJANGO_DATA_SEED_UNIQUE_TEXT_MODE` setting, 'sequence' by default.
+    """
+    mode = getattr(settings, 'DJANGO_DATA_SEED_UNIQUE_TEXT_MODE', 'sequence')
+    if mode not in UNIQUE_TEXT_MODES:
+        raise ValueError(
+            f'DJANGO_DATA_SEED_UNIQUE_TEXT_MODE must be one of {", ".join(UNIQUE_TEXT_MODES)}')
+    return mode
+
+
+def to_base36(value: int, width: int) -> str:
+    """
+    Encodes a non negative integer with `width` base 36 digits, zero padded.
+    """
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, 36)
+        digits.append(SEQUENCE_DIGITS[digit])
+    return ''.join(reversed(digits))
+
+
+def get_text_template(field: models.Field) -> str:
+    for field_class, template in TEXT_TEMPLATES:
+        if isinstance(field, field_class):
+            return template
+    return DEFAULT_TEXT_TEMPLATE
+
+
+def random_prefix(length: int) -> str:
+    """
+    Returns a human looking prefix of at most `length` characters, valid in slugs and emails.
+    """
+    from django_data_seed.management.commands.fields import fake
+
+    if length < 1:
+        return ''
+    return slugify(fake.first_name())[:length]
+
+
+class UniqueTextSequence:
+    """
+        Unique text values of one field composed of a random prefix and a base 36 sequence, unique
+        by construction.
+
+        Attributes:
+            template: The format of the values, with `{prefix}` and `{sequence}`.
+            width: The number of base 36 digits of the sequence, sized to fit `max_length`.
+            prefix_length: The maximum length of the random prefix.
+            prefix: The callable returning a prefix of at most a given length.
+            pattern: The regular expression matching the values of the template.
+            next_value: The next sequence number.
+            limit: The number of sequence numbers of `width` digits.
+    """
+    __slots__ = ('template', 'width', 'prefix_length', 'prefix', 'pattern', 'next_value', 'limit')
+
+    def __init__(
+            self,
+            field: models.Field,
+            template: Optional[str] = None,
+            width: int = DEFAULT_SEQUENCE_WIDTH,
+            prefix: Callable[[int], str] = random_prefix
+    ):
+        self.template = template or get_text_template(field)
+        fixed = len(self.template.format(prefix='', sequence=''))
+        available = field.max_length - fixed if field.max_length else width + MAX_PREFIX_LENGTH
+        self.width = min(width, available)
+        if self.width < 1:
+            raise ValueError(
+                f'{field.model._meta.label}.{field.name}: max_length {field.max_length} leaves no '
+                'room for a unique sequence')
+        self.prefix_length = min(available - self.width, MAX_PREFIX_LENGTH)
+        self.prefix = prefix
+        self.pattern = re.compile(''.join(
+            re.escape(literal) + {
+                'prefix': '.*', 'sequence': f'(?P<sequence>[0-9a-z]{{{self.width}}})', None: ''
+            }[name]
+            for literal, name, _, _ in Formatter().parse(self.template)
+        ))
+        self.next_value = 0
+        self.limit = 36 ** self.width
+
+    def start_after(self, values: Iterable[Any]) -> 'UniqueTextSequence':
+        """
+        Moves the sequence past the highest sequence of the existing values, so the next values
+        can not collide with them.
+        """
+        for value in values:
+            match = self.pattern.fullmatch(value) if isinstance(value, str) else None
+            if match:
+                self.next_value = max(self.next_value, int(match.group('sequence'), 36) + 1)
+        return self
+
+    def __call__(self) -> str:
+        if self.next_value >= self.limit:
+            raise ValueError(f'The {self.width} digit unique sequence of {self.template} ran out')
+        sequence = to_base36(self.next_value, self.width)
+        self.next_value += 1
+        return self.template.format(prefix=self.prefix(self.prefix_length), sequence=sequence)
+
+
+def get_text_sequence(
+        model: Type[models.Model],
+        field: models.Field,
+        using: str = DEFAULT_DB_ALIAS
+) -> UniqueTextSequence:
+    """
+    Returns the unique text sequence of a field, started after the existing rows with one
+    streamed query.
+    """
+    sequence = UniqueTextSequence(field)
+    values = model._base_manager.using(using).exclude(
+        **{f'{field.attname}__isnull': True}
+    ).values_list(field.attname, flat=True)
+    return sequence.start_after(values.iterator(chunk_size=SEQUENCE_PRELOAD_CHUNK_SIZE))
@@ -1,5 +1,4 @@
 from django.conf import settings
-import jwt
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
@@ -12,6 +11,8 @@ def get_project_name():
 
 
 def token_decoder(token):
+    import jwt
+
     return jwt.decode(token, settings.SECRET_KEY, algorithms="HS256")
 
 
@@ -39,6 +39,9 @@ setup(
         'colorama>=0.4.6',
         'Faker>=26.0.0',
     ],
+    extras_require={
+        'jwt': ['PyJWT>=2.0.0'],
+    },
     project_urls={
         'Bug Reports': 'https://github.com/rohith-baggam/django-data-seed/issues',
         'Source': 'https://github.com/rohith-baggam/django-data-seed',